@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""
+Benchmark response compression: CPU time versus bytes saved.
+
+Encodes synthetic leaderboard, standings and batch payloads (compact JSON,
+as the HTTP routes send them) and compresses them with every available
+encoding and level, both as one body and per 64-row chunk with a flush after
+every chunk (as the middleware does for streamed responses).
+
+    python benchmarks/bench_compression.py [--rows 500] [--repeat 50]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_encoding import batch, leaderboard, standings  # noqa: E402
+from compression import available_encodings, compressor_for  # noqa: E402
+from pybaseball_mcp.encoding import dumpb  # noqa: E402
+
+LEVELS = {"gzip": (1, 6, 9), "zstd": (1, 3, 9), "br": (1, 4, 9)}
+CHUNK_ROWS = 64
+
+
+def row_chunks(value) -> list:
+    """Split a payload into the chunks a row stream would send."""
+    rows_key = next(key for key, item in value.items() if isinstance(item, (list, dict)))
+    rows = value[rows_key]
+    items = list(rows.items()) if isinstance(rows, dict) else rows
+    chunks = [dumpb({k: v for k, v in value.items() if k != rows_key})]
+    for i in range(0, len(items), CHUNK_ROWS):
+        chunks.append(dumpb(items[i:i + CHUNK_ROWS]))
+    return chunks
+
+
+def measure(encoding: str, level: int, chunks: list, repeat: int):
+    def run():
+        compressor = compressor_for(encoding, level)
+        return b"".join(compressor.compress(chunk) for chunk in chunks) + compressor.finish()
+
+    size = len(run())
+    start = time.process_time()
+    for _ in range(repeat):
+        run()
+    return size, (time.process_time() - start) / repeat * 1e6
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=500, help="Rows in the leaderboard and batch payloads")
+    parser.add_argument("--repeat", type=int, default=50, help="Compressions per measurement")
+    args = parser.parse_args(argv)
+
+    payloads = {"leaderboard": leaderboard(args.rows), "standings": standings(), "batch": batch(args.rows)}
+    encodings = sorted(available_encodings())
+    print(f"Encodings available: {', '.join(encodings)}; {args.repeat} compressions per row\n")
+    print(f"{'payload':<12} {'encoding':<10} {'mode':<9} {'bytes':>9} {'ratio':>7} {'us':>9} {'MB/s':>8}")
+    for payload_name, value in payloads.items():
+        body = dumpb(value, "compact")
+        print(f"{payload_name:<12} {'identity':<10} {'-':<9} {len(body):>9} {1:>7.2f} {0:>9.1f} {'-':>8}")
+        for encoding in encodings:
+            for level in LEVELS[encoding]:
+                for mode, chunks in (("body", [body]), ("chunked", row_chunks(value))):
+                    size, micros = measure(encoding, level, chunks, args.repeat)
+                    throughput = len(body) / micros if micros else float("inf")
+                    print(f"{payload_name:<12} {f'{encoding}-{level}':<10} {mode:<9} {size:>9} "
+                          f"{size / len(body):>7.2f} {micros:>9.1f} {throughput:>8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
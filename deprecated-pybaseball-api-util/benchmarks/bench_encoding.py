@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""
+Benchmark tool-response encoding.
+
+Compares the old path (json.dumps(indent=2), then json.dumps of that string
+again by the HTTP envelope) with the central encoder in both modes, on
+synthetic leaderboard, standings and batch payloads shaped like real tool
+results. Reports payload bytes and CPU time per encode.
+
+    python benchmarks/bench_encoding.py [--rows 500] [--repeat 200]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from pybaseball_mcp import encoding  # noqa: E402
+from pybaseball_mcp.encoding import dumpb  # noqa: E402
+
+
+def leaderboard(rows: int) -> dict:
+    rng = np.random.default_rng(0)
+    return {
+        "stat": "HR",
+        "year": 2024,
+        "type": "batting",
+        "leaders": [
+            {"rank": i + 1, "name": f"Player {i}", "team": "NYY", "HR": float(hr)}
+            for i, hr in enumerate(sorted(rng.integers(0, 60, rows), reverse=True))
+        ],
+    }
+
+
+def standings() -> dict:
+    return {
+        "year": 2024,
+        "standings": {
+            f"Division {d}": [
+                {"team": f"Team {d}{t}", "wins": 80 + t, "losses": 82 - t, "win_pct": round((80 + t) / 162, 3), "games_back": str(t)}
+                for t in range(5)
+            ]
+            for d in range(1, 7)
+        },
+    }
+
+
+def batch(rows: int) -> dict:
+    record = {"player": "Aaron Judge", "year": 2024, "type": "batting", "games": 158, "avg": 0.322, "obp": 0.458,
+              "slg": 0.701, "ops": 1.159, "hr": 58, "rbi": 144, "runs": 122, "sb": 10, "war": 11.2}
+    return {"count": rows, "players": [dict(record, player=f"Player {i}") for i in range(rows)]}
+
+
+def old_http(value) -> bytes:
+    """Tool text with indent=2, wrapped by the HTTP envelope as a JSON string."""
+    return json.dumps({"data": json.dumps(value, indent=2)}).encode("utf-8")
+
+
+def new_http(mode: str):
+    return lambda value: b'{"data":' + dumpb(value, mode) + b"}"
+
+
+def measure(func, value, repeat: int):
+    payload = func(value)
+    start = time.process_time()
+    for _ in range(repeat):
+        func(value)
+    return len(payload), (time.process_time() - start) / repeat * 1e6
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=500, help="Rows in the leaderboard and batch payloads")
+    parser.add_argument("--repeat", type=int, default=200, help="Encodes per measurement")
+    args = parser.parse_args(argv)
+
+    encoders = {
+        "old: json indent=2 + re-encode": old_http,
+        "pretty (encoder)": new_http("pretty"),
+        "compact (encoder)": new_http("compact"),
+    }
+    payloads = {"leaderboard": leaderboard(args.rows), "standings": standings(), "batch": batch(args.rows)}
+    backend = "orjson" if encoding.orjson is not None else "json (stdlib)"
+    print(f"Encoder backend: {backend}; {args.repeat} encodes per row\n")
+    print(f"{'payload':<12} {'encoder':<32} {'bytes':>10} {'us/encode':>10} {'bytes saved':>12} {'cpu saved':>10}")
+    for payload_name, value in payloads.items():
+        baseline = None
+        for encoder_name, func in encoders.items():
+            size, micros = measure(func, value, args.repeat)
+            baseline = baseline or (size, micros)
+            print(f"{payload_name:<12} {encoder_name:<32} {size:>10} {micros:>10.1f} "
+                  f"{1 - size / baseline[0]:>11.0%} {1 - micros / baseline[1]:>9.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
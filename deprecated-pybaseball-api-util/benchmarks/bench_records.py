@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+"""
+Benchmark building tool result rows from a DataFrame.
+
+Compares the old per-row path (iterrows() plus a dict per boxed Series)
+with the columnar build_records() on a synthetic FanGraphs-shaped batting
+frame, for the leaderboard and player_stats field sets.
+
+    python benchmarks/bench_records.py [--rows 1500] [--repeat 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from pybaseball_mcp.players import SEASON_FIELDS  # noqa: E402
+from pybaseball_mcp.records import FieldSpec, build_records  # noqa: E402
+
+
+def batting_frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({
+        "Name": [f"Player {i}" for i in range(rows)],
+        "Team": rng.choice(["NYY", "BOS", "LAD", "SDP", "- - -"], rows),
+        "G": rng.integers(1, 163, rows),
+        "HR": rng.integers(0, 60, rows),
+        "RBI": rng.integers(0, 140, rows),
+        "R": rng.integers(0, 130, rows),
+        "SB": rng.integers(0, 50, rows),
+    })
+    for column in ["AVG", "OBP", "SLG", "OPS", "WAR"]:
+        frame[column] = rng.uniform(0, 1, rows)
+    frame.loc[::50, "AVG"] = np.nan
+    return frame
+
+
+def leaders_iterrows(frame: pd.DataFrame) -> list:
+    return [
+        {"rank": idx, "name": player["Name"], "team": player.get("Team", "Unknown"),
+         "HR": float(player["HR"]) if pd.notna(player["HR"]) else 0}
+        for idx, (_, player) in enumerate(frame.iterrows(), 1)
+    ]
+
+
+LEADER_FIELDS = [FieldSpec("Name", "name"), FieldSpec("Team", "team", default="Unknown"),
+                 FieldSpec("HR", cast="float", default=0)]
+
+
+def leaders_columnar(frame: pd.DataFrame) -> list:
+    return [{"rank": rank, **record} for rank, record in enumerate(build_records(frame, LEADER_FIELDS), 1)]
+
+
+def season_iterrows(frame: pd.DataFrame) -> list:
+    return [
+        {"games": int(row.get("G", 0)), "avg": round(float(row.get("AVG", 0)), 3),
+         "obp": round(float(row.get("OBP", 0)), 3), "slg": round(float(row.get("SLG", 0)), 3),
+         "ops": round(float(row.get("OPS", 0)), 3), "hr": int(row.get("HR", 0)), "rbi": int(row.get("RBI", 0)),
+         "runs": int(row.get("R", 0)), "sb": int(row.get("SB", 0)), "war": round(float(row.get("WAR", 0)), 1)}
+        for _, row in frame.iterrows()
+    ]
+
+
+def season_columnar(frame: pd.DataFrame) -> list:
+    return build_records(frame, SEASON_FIELDS["batting"])
+
+
+def measure(func, frame, repeat: int) -> float:
+    func(frame)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(frame)
+    return (time.perf_counter() - start) / repeat * 1e3
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1500, help="Rows in the synthetic batting frame")
+    parser.add_argument("--repeat", type=int, default=20, help="Builds per measurement")
+    args = parser.parse_args(argv)
+
+    frame = batting_frame(args.rows)
+    print(f"{args.rows} rows, {args.repeat} builds per measurement\n")
+    print(f"{'fields':<12} {'iterrows ms':>12} {'columnar ms':>12} {'speedup':>8}")
+    for name, old, new in (("leaders", leaders_iterrows, leaders_columnar),
+                           ("season", season_iterrows, season_columnar)):
+        old_ms, new_ms = measure(old, frame, args.repeat), measure(new, frame, args.repeat)
+        print(f"{name:<12} {old_ms:>12.2f} {new_ms:>12.2f} {old_ms / new_ms:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""
+Benchmark server startup in STDIO mode.
+
+Starts fresh interpreters that import the server and answer tools/list,
+reporting wall time to the first tools/list response and the slowest
+imports from `python -X importtime`. Heavy data modules (pandas,
+pybaseball, ...) must not be loaded before a tool is called.
+
+    python benchmarks/bench_startup.py [--runs 5] [--top 15]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SERVER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# Modules that only tool calls may import
+HEAVY_MODULES = ("pandas", "numpy", "pyarrow", "pybaseball", "fastapi", "matplotlib")
+
+PROBE = f"""
+import asyncio, json, sys, time
+start = time.perf_counter()
+import pybaseball_nativemcp_server as server
+imported = time.perf_counter()
+tools = asyncio.run(server.handle_list_tools())
+listed = time.perf_counter()
+print(json.dumps({{
+    "import_seconds": imported - start,
+    "list_tools_seconds": listed - start,
+    "tools": len(tools),
+    "heavy_modules": [name for name in {HEAVY_MODULES!r} if name in sys.modules],
+}}))
+"""
+
+
+def probe_env() -> dict:
+    env = dict(os.environ, MCP_STDIO_MODE="1", PYBASEBALL_MCP_WARMUP="0")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [SERVER_DIR, env.get("PYTHONPATH")]))
+    return env
+
+
+def measure_startup() -> dict:
+    """Start one interpreter and report its startup timings."""
+    output = subprocess.run([sys.executable, "-c", PROBE], cwd=SERVER_DIR, env=probe_env(),
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def slowest_imports(top: int) -> list:
+    """Get (cumulative microseconds, module) of the slowest imports."""
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", "import pybaseball_nativemcp_server"],
+                            cwd=SERVER_DIR, env=probe_env(), capture_output=True, text=True, check=True).stderr
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        imports.append((int(cumulative), name))
+    return sorted(imports, reverse=True)[:top]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5, help="Interpreters to start")
+    parser.add_argument("--top", type=int, default=15, help="Slowest imports to list")
+    args = parser.parse_args(argv)
+
+    runs = [measure_startup() for _ in range(args.runs)]
+    print(f"{args.runs} runs, median seconds")
+    print(f"  import server:         {statistics.median(run['import_seconds'] for run in runs):.3f}")
+    print(f"  first tools/list:      {statistics.median(run['list_tools_seconds'] for run in runs):.3f}")
+    print(f"  tools listed:          {runs[0]['tools']}")
+    print(f"  heavy modules loaded:  {', '.join(runs[0]['heavy_modules']) or 'none'}\n")
+    print("Slowest imports (cumulative ms):")
+    for cumulative, name in slowest_imports(args.top):
+        print(f"  {cumulative / 1000:>8.1f}  {name}")
+    return 1 if runs[0]["heavy_modules"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,352 @@
+#!/usr/bin/env python
+"""
+Offline benchmark of every tool and HTTP tool route.
+
+Upstream pybaseball is replaced by recorded fixtures (upstream_fixtures.py),
+so runs need no network. For each case it measures cold latency (every
+cache, archive file and Statcast partition dropped first), warm latency
+p50/p95, warm throughput, and the peak Python heap of a cold and a warm call.
+Results are written as JSON and compared with the committed baseline
+(baseline_tools.json, measured on the synthetic fixtures); a metric worse
+than the baseline by more than the tolerance fails the run. Regenerate the
+baseline with --save-baseline on the machine that runs the comparison.
+
+    python benchmarks/bench_tools.py [--only player_stats,http:jsonrpc] [--warm-runs 50]
+    python benchmarks/bench_tools.py --save-baseline
+    python benchmarks/bench_tools.py --record [--year 2024]
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+BENCH_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, str(BENCH_DIR.parent))
+sys.path.insert(0, str(BENCH_DIR))
+
+# Server state lives in a scratch directory the cold runs can wipe; warmup,
+# span export and the metrics file would only add noise
+DATA_DIR = Path(tempfile.mkdtemp(prefix="pybaseball-mcp-bench-"))
+os.environ["PYBASEBALL_MCP_DATA_DIR"] = str(DATA_DIR)
+os.environ["PYBASEBALL_MCP_WARMUP"] = "0"
+os.environ["PYBASEBALL_MCP_TRACE_FILE"] = ""
+os.environ["PYBASEBALL_MCP_METRICS_FILE"] = ""
+
+import upstream_fixtures  # noqa: E402
+
+RESULTS_FILE = BENCH_DIR / "results" / "bench_tools.json"
+BASELINE_FILE = BENCH_DIR / "baseline_tools.json"
+
+# Metrics compared with the baseline, and the absolute slack below which a
+# difference is noise. Tail latency and throughput are reported only: p95 of
+# 50 calls is too noisy to gate on, and throughput follows the p50.
+COMPARED_METRICS = {
+    "cold_ms": 10.0,
+    "warm_p50_ms": 0.5,
+    "cold_peak_kib": 256.0,
+    "warm_peak_kib": 64.0,
+}
+
+LINEUP = ["Aaron Judge", "Juan Soto", "Shohei Ohtani", "Mookie Betts", "Freddie Freeman",
+          "Jose Ramirez", "Gunnar Henderson", "Corey Seager", "Kyle Tucker"]
+
+
+def tool_cases(year: int) -> list:
+    """(case name, tool, arguments) for every tool of players.py and teams.py."""
+    return [
+        ("player_stats", "player_stats", {"player_name": "Aaron Judge", "year": year}),
+        ("player_stats:pitcher", "player_stats", {"player_name": "Gerrit Cole", "year": year}),
+        ("players_stats_batch", "players_stats_batch", {"player_names": LINEUP, "years": year}),
+        ("player_recent_performance", "player_recent_performance", {"player_name": "Aaron Judge", "days": 30}),
+        ("player_recent_performance:pitcher", "player_recent_performance",
+         {"player_name": "Tarik Skubal", "days": 30}),
+        ("search_players", "search_players", {"search_term": "judge"}),
+        ("mlb_standings", "mlb_standings", {"year": year}),
+        ("stat_leaders", "stat_leaders", {"stat": "HR", "year": year, "top_n": 10}),
+        ("stat_leaders:pitching", "stat_leaders",
+         {"stat": "ERA", "year": year, "top_n": 10, "player_type": "pitching"}),
+        ("team_statistics", "team_statistics", {"team_name": "NYY", "year": year}),
+        ("team_statistics:all", "team_statistics", {"team_name": "all", "year": year}),
+    ]
+
+
+def http_cases(year: int) -> list:
+    """(case name, path, JSON body) for the three tool routes."""
+    return [
+        ("http:tools", "/tools/player_stats", {"player_name": "Aaron Judge", "year": year}),
+        ("http:streamable-http", "/streamable-http/tools/stat_leaders?stream=1", {"stat": "HR", "year": year}),
+        ("http:jsonrpc", "/jsonrpc", [
+            {"jsonrpc": "2.0", "id": 1, "method": "tool",
+             "params": {"name": "player_stats", "parameters": {"player_name": "Gerrit Cole", "year": year}}},
+            {"jsonrpc": "2.0", "id": 2, "method": "tool", "params": {"name": "mlb_standings",
+                                                                     "parameters": {"year": year}}},
+            {"jsonrpc": "2.0", "id": 3, "method": "tool",
+             "params": {"name": "team_statistics", "parameters": {"team_name": "LAD", "year": year}}},
+        ]),
+    ]
+
+
+def reset_state(server):
+    """Drop every in-process cache and all local data, as on a fresh install."""
+    from pybaseball_mcp import register, search
+    from pybaseball_mcp.frames import season_frames
+
+    season_frames.clear()
+    server.response_cache.clear()
+    register.player_register._loaded = False
+    search._index = None
+    shutil.rmtree(DATA_DIR, ignore_errors=True)
+    DATA_DIR.mkdir(parents=True)
+
+
+def _percentile(samples: list, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def measure(call, reset, upstream, cold_runs: int, warm_runs: int) -> dict:
+    """
+    Measure one case.
+
+    Args:
+        call: Function making the call and returning the response bytes (or text)
+        reset: Function emptying every cache before a cold call
+        upstream: Fixture upstream, whose call counts are reported for the cold call
+        cold_runs: Cold calls timed (the median is reported)
+        warm_runs: Warm calls timed for latency and throughput
+    """
+    cold = []
+    for _ in range(cold_runs):
+        reset()
+        upstream.reset_calls()
+        start = time.perf_counter()
+        response = call()
+        cold.append((time.perf_counter() - start) * 1000)
+    upstream_calls = upstream.reset_calls()
+
+    warm = []
+    for _ in range(warm_runs):
+        start = time.perf_counter()
+        call()
+        warm.append((time.perf_counter() - start) * 1000)
+    warm_upstream_calls = sum(upstream.reset_calls().values())
+
+    warm_peak = _peak_kib(call)
+    reset()
+    cold_peak = _peak_kib(call)
+    upstream.reset_calls()
+
+    return {
+        "cold_ms": round(statistics.median(cold), 3),
+        "warm_p50_ms": round(_percentile(warm, 0.50), 3),
+        "warm_p95_ms": round(_percentile(warm, 0.95), 3),
+        "throughput_per_s": round(len(warm) / (sum(warm) / 1000), 1),
+        "cold_peak_kib": round(cold_peak, 1),
+        "warm_peak_kib": round(warm_peak, 1),
+        "response_bytes": len(response),
+        "upstream_calls": upstream_calls,
+        "warm_upstream_calls": warm_upstream_calls,
+    }
+
+
+def _peak_kib(call) -> float:
+    tracemalloc.start()
+    try:
+        call()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def _check_text(name: str, text: str):
+    if text.startswith(("Error", "Player '", "No stats", "No recent", "Invalid")) or '"error"' in text[:200]:
+        raise RuntimeError(f"{name} did not return data from the fixtures: {text[:200]}")
+
+
+def run_tool_cases(server, upstream, cases, cold_runs: int, warm_runs: int) -> dict:
+    import asyncio
+
+    loop = asyncio.new_event_loop()
+
+    def caller(name, tool, arguments):
+        def call():
+            text = loop.run_until_complete(server._dispatch_tool(tool, arguments))[0].text
+            return text.encode()
+        return call
+
+    results = {}
+    try:
+        for name, tool, arguments in cases:
+            call = caller(name, tool, arguments)
+            reset_state(server)
+            _check_text(name, call().decode())
+            results[f"tool:{name}"] = measure(call, lambda: reset_state(server), upstream, cold_runs, warm_runs)
+    finally:
+        loop.close()
+    return results
+
+
+def run_http_cases(server, upstream, cases, cold_runs: int, warm_runs: int) -> dict:
+    from fastapi.testclient import TestClient
+
+    client = TestClient(server.create_http_app())
+
+    def caller(path, body):
+        def call():
+            response = client.post(path, json=body)
+            response.raise_for_status()
+            return response.content
+        return call
+
+    results = {}
+    for name, path, body in cases:
+        call = caller(path, body)
+        reset_state(server)
+        content = call().decode()
+        if '"error"' in content or "Error" in content:
+            raise RuntimeError(f"{name} did not return data from the fixtures: {content[:200]}")
+        results[name] = measure(call, lambda: reset_state(server), upstream, cold_runs, warm_runs)
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Compare results with a baseline.
+
+    A metric regresses when it is worse than the baseline by more than
+    ``tolerance`` (a fraction) and by more than the metric's absolute slack,
+    or when a case makes more upstream calls than it did.
+
+    Returns:
+        Descriptions of the regressions
+    """
+    regressions = []
+    for case, metrics in results.items():
+        expected = baseline.get(case)
+        if expected is None:
+            continue
+        for metric, slack in COMPARED_METRICS.items():
+            if metric not in metrics or metric not in expected:
+                continue
+            value, reference = metrics[metric], expected[metric]
+            if value > reference * (1 + tolerance) and value - reference > slack:
+                regressions.append(f"{case} {metric}: {value} vs baseline {reference}")
+        # A cache that stops holding data shows up as extra upstream calls
+        for metric in ("upstream_calls", "warm_upstream_calls"):
+            value, reference = _call_count(metrics.get(metric)), _call_count(expected.get(metric))
+            if value > reference:
+                regressions.append(f"{case} {metric}: {value} vs baseline {reference}")
+    return regressions
+
+
+def _call_count(calls) -> int:
+    return sum(calls.values()) if isinstance(calls, dict) else calls or 0
+
+
+def print_table(results: dict):
+    print(f"{'case':<40} {'cold ms':>9} {'p50 ms':>8} {'p95 ms':>8} {'calls/s':>9} "
+          f"{'cold KiB':>9} {'warm KiB':>9} {'bytes':>7}")
+    for case, metrics in results.items():
+        print(f"{case:<40} {metrics['cold_ms']:>9.1f} {metrics['warm_p50_ms']:>8.2f} "
+              f"{metrics['warm_p95_ms']:>8.2f} {metrics['throughput_per_s']:>9.0f} "
+              f"{metrics['cold_peak_kib']:>9.0f} {metrics['warm_peak_kib']:>9.0f} {metrics['response_bytes']:>7}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--only", help="Comma-separated case names (e.g. player_stats,http:jsonrpc)")
+    parser.add_argument("--cold-runs", type=int, default=3, help="Cold calls per case")
+    parser.add_argument("--warm-runs", type=int, default=50, help="Warm calls per case")
+    parser.add_argument("--output", type=Path, default=RESULTS_FILE, help="Where to write the results JSON")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help="Baseline results to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="Write these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.5,
+                        help="Allowed fraction a metric may be worse than the baseline")
+    parser.add_argument("--record", action="store_true", help="Record fixtures from upstream (needs network)")
+    parser.add_argument("--year", type=int, default=upstream_fixtures.FIXTURE_YEAR, help="Season to record")
+    args = parser.parse_args(argv)
+
+    try:
+        return _run(args)
+    finally:
+        shutil.rmtree(DATA_DIR, ignore_errors=True)
+
+
+def _run(args) -> int:
+    if args.record:
+        manifest = upstream_fixtures.record(args.year)
+        print(f"Recorded fixtures in {upstream_fixtures.FIXTURE_DIR}: {manifest['rows']}")
+        return 0
+
+    import logging
+
+    import pybaseball_nativemcp_server as server
+    from pybaseball_mcp.lazy import package_version
+
+    logging.disable(logging.WARNING)
+    fixtures = upstream_fixtures.load()
+    upstream = upstream_fixtures.Upstream(fixtures)
+    restore = upstream_fixtures.install(upstream)
+    only = set(args.only.split(",")) if args.only else None
+    try:
+        results = run_tool_cases(server, upstream, [case for case in tool_cases(fixtures.year)
+                                                    if only is None or case[0] in only],
+                                 args.cold_runs, args.warm_runs)
+        results.update(run_http_cases(server, upstream, [case for case in http_cases(fixtures.year)
+                                                         if only is None or case[0] in only],
+                                      args.cold_runs, args.warm_runs))
+    finally:
+        restore()
+
+    report = {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "fixtures": fixtures.source,
+            "year": fixtures.year,
+            "cold_runs": args.cold_runs,
+            "warm_runs": args.warm_runs,
+            "python": platform.python_version(),
+            "pandas": package_version("pandas"),
+            "pybaseball": package_version("pybaseball"),
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+    print(f"{len(results)} cases, {fixtures.source} fixtures for {fixtures.year}\n")
+    print_table(results)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"\nResults written to {args.output}")
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save-baseline to store one")
+        return 0
+    baseline = json.loads(args.baseline.read_text())
+    if baseline["meta"].get("fixtures") != fixtures.source:
+        print(f"Baseline was measured on {baseline['meta'].get('fixtures')} fixtures; not comparing")
+        return 0
+    regressions = compare(results, baseline["results"], args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} regressions beyond {args.tolerance:.0%} of {args.baseline}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print(f"No regressions beyond {args.tolerance:.0%} of {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
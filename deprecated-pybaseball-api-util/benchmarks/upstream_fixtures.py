@@ -0,0 +1,413 @@
+"""
+Recorded upstream data for the offline benchmarks.
+
+Every pybaseball function the tools call (batting_stats, pitching_stats,
+standings, statcast, statcast_batter/statcast_pitcher, chadwick_register,
+playerid_lookup) is replaced by one that serves a local fixture, so a
+benchmark measures the server and never the network.
+
+Fixtures are read from benchmarks/fixtures/ once recorded there with
+
+    python benchmarks/bench_tools.py --record [--year 2024]
+
+and otherwise generated: seeded synthetic frames with the recorded column
+names and dtypes, and a similar number of rows. No recording is committed
+yet, so the benchmark and its baseline currently use the synthetic frames.
+"""
+import json
+import os
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+FIXTURE_DIR = Path(os.path.dirname(os.path.abspath(__file__))) / "fixtures"
+MANIFEST_FILE = "manifest.json"
+
+# Season the synthetic fixtures stand in for (a completed one, so it is archived)
+FIXTURE_YEAR = 2024
+# Days of league-wide Statcast recorded, ending the day before the benchmark runs
+STATCAST_DAYS = 30
+
+REGISTER_COLUMNS = [
+    "name_first", "name_last", "key_mlbam", "key_fangraphs", "key_bbref",
+    "mlb_played_first", "mlb_played_last",
+]
+# Statcast columns the tools read, the only ones recorded
+STATCAST_COLUMNS = ["game_date", "batter", "pitcher", "events", "launch_speed", "release_speed", "type"]
+_DIVISION_COLUMN = "__division"
+
+# Players named by the benchmark cases: (first, last, team, kind)
+BENCH_PLAYERS = [
+    ("Aaron", "Judge", "NYY", "batting"),
+    ("Shohei", "Ohtani", "LAD", "batting"),
+    ("Juan", "Soto", "NYY", "batting"),
+    ("Mookie", "Betts", "LAD", "batting"),
+    ("Freddie", "Freeman", "LAD", "batting"),
+    ("Jose", "Ramirez", "CLE", "batting"),
+    ("Gunnar", "Henderson", "BAL", "batting"),
+    ("Corey", "Seager", "TEX", "batting"),
+    ("Kyle", "Tucker", "HOU", "batting"),
+    ("Gerrit", "Cole", "NYY", "pitching"),
+    ("Tarik", "Skubal", "DET", "pitching"),
+    ("Zack", "Wheeler", "PHI", "pitching"),
+]
+
+FANGRAPHS_TEAMS = [
+    "ARI", "ATL", "BAL", "BOS", "CHC", "CHW", "CIN", "CLE", "COL", "DET",
+    "HOU", "KCR", "LAA", "LAD", "MIA", "MIL", "MIN", "NYM", "NYY", "OAK",
+    "PHI", "PIT", "SDP", "SEA", "SFG", "STL", "TBR", "TEX", "TOR", "WSN",
+]
+
+_FIRST_NAMES = ["Alex", "Ben", "Carlos", "Chris", "Dan", "David", "Eric", "Frank", "Jake", "James", "Jose",
+                "Juan", "Kevin", "Luis", "Matt", "Mike", "Nick", "Pedro", "Rafael", "Ryan", "Sam", "Tom",
+                "Tyler", "Will", "Yusei", "Zach"]
+_LAST_NAMES = ["Adams", "Baker", "Castro", "Diaz", "Evans", "Flores", "Garcia", "Hernandez", "Jackson",
+               "Johnson", "Kim", "Lopez", "Martinez", "Miller", "Nelson", "Ortiz", "Perez", "Rivera",
+               "Rodriguez", "Smith", "Suzuki", "Taylor", "Torres", "Walker", "Williams", "Young"]
+
+
+class Fixtures(NamedTuple):
+    """Upstream frames served to the tools."""
+    year: int
+    batting: pd.DataFrame
+    pitching: pd.DataFrame
+    standings: List[pd.DataFrame]
+    statcast: pd.DataFrame
+    register: pd.DataFrame
+    source: str  # "recorded" or "synthetic"
+
+
+# --- Recording ---
+
+def record(year: int = FIXTURE_YEAR, directory: Path = FIXTURE_DIR, days: int = STATCAST_DAYS) -> dict:
+    """
+    Pull the upstream frames once through pybaseball and store them as fixtures.
+
+    Statcast is recorded for the last ``days`` days of the season's regular schedule
+    (late September), and only for the columns the tools read.
+
+    Returns:
+        The fixture manifest
+    """
+    from pyarrow import feather
+    from pybaseball import batting_stats, chadwick_register, pitching_stats, standings, statcast
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    statcast_end = date(year, 9, 29)
+    statcast_start = statcast_end - timedelta(days=days - 1)
+    frames = {
+        "batting": batting_stats(year, qual=1),
+        "pitching": pitching_stats(year, qual=1),
+        "standings": _concat_divisions(standings(year)),
+        "statcast": statcast(start_dt=statcast_start.isoformat(), end_dt=statcast_end.isoformat(),
+                             verbose=False).loc[:, STATCAST_COLUMNS],
+        "register": chadwick_register().loc[:, REGISTER_COLUMNS],
+    }
+    for name, frame in frames.items():
+        feather.write_feather(frame.reset_index(drop=True), directory / f"{name}.feather", compression="lz4")
+    manifest = {
+        "year": year,
+        "statcast_start": statcast_start.isoformat(),
+        "statcast_end": statcast_end.isoformat(),
+        "recorded_at": datetime.now().isoformat(timespec="seconds"),
+        "rows": {name: len(frame) for name, frame in frames.items()},
+    }
+    (directory / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2) + "\n")
+    return manifest
+
+
+def _concat_divisions(divisions: List[pd.DataFrame]) -> pd.DataFrame:
+    return pd.concat([division.assign(**{_DIVISION_COLUMN: i}) for i, division in enumerate(divisions)],
+                     ignore_index=True)
+
+
+def _split_divisions(frame: pd.DataFrame) -> List[pd.DataFrame]:
+    return [division.drop(columns=_DIVISION_COLUMN).reset_index(drop=True)
+            for _, division in frame.groupby(_DIVISION_COLUMN, sort=True)]
+
+
+# --- Loading ---
+
+def load(directory: Path = FIXTURE_DIR) -> Fixtures:
+    """Load the recorded fixtures, or generate synthetic ones when none are recorded."""
+    directory = Path(directory)
+    manifest_path = directory / MANIFEST_FILE
+    if not manifest_path.exists():
+        return synthetic()
+    from pyarrow import feather
+
+    manifest = json.loads(manifest_path.read_text())
+    frames = {name: feather.read_feather(directory / f"{name}.feather")
+              for name in ("batting", "pitching", "standings", "statcast", "register")}
+    return Fixtures(
+        year=manifest["year"],
+        batting=frames["batting"],
+        pitching=frames["pitching"],
+        standings=_split_divisions(frames["standings"]),
+        statcast=frames["statcast"],
+        register=frames["register"],
+        source="recorded",
+    )
+
+
+def synthetic(year: int = FIXTURE_YEAR, seed: int = 0) -> Fixtures:
+    """
+    Generate fixtures shaped like the recorded frames.
+
+    Row counts follow a real season: about 20,000 register entries, 1,300
+    batters and 900 pitchers at qual=1, six divisions and 4,000 pitches a day.
+    FanGraphs frames get filler stat columns so they are as wide as the real ones.
+    """
+    rng = np.random.default_rng(seed)
+    register = _synthetic_register(rng, year)
+    active = register[register["mlb_played_last"] == year]
+    bench = {(first, last): kind for first, last, _, kind in BENCH_PLAYERS}
+    bench_teams = {(first, last): team for first, last, team, _ in BENCH_PLAYERS}
+    names = list(zip(active["name_first"], active["name_last"]))
+    is_pitcher = np.array([bench.get(name) == "pitching" for name in names])
+    is_batter = np.array([bench.get(name) == "batting" for name in names])
+    unassigned = ~(is_pitcher | is_batter)
+    is_pitcher |= unassigned & (rng.random(len(active)) < 0.42)
+    is_batter |= unassigned & ~is_pitcher
+    teams = np.array([bench_teams.get(name) or FANGRAPHS_TEAMS[i % 30] for i, name in enumerate(names)])
+    teams[unassigned & (rng.random(len(active)) < 0.05)] = "- - -"
+
+    return Fixtures(
+        year=year,
+        batting=_synthetic_batting(rng, active[is_batter], teams[is_batter], year),
+        pitching=_synthetic_pitching(rng, active[is_pitcher], teams[is_pitcher], year),
+        standings=_synthetic_standings(rng),
+        statcast=_synthetic_statcast(rng, active[is_batter], active[is_pitcher]),
+        register=register,
+        source="synthetic",
+    )
+
+
+def _synthetic_register(rng, year: int, rows: int = 20000) -> pd.DataFrame:
+    first = rng.choice(_FIRST_NAMES, rows).astype(object)
+    last = rng.choice(_LAST_NAMES, rows).astype(object)
+    suffix = np.char.mod("%d", np.arange(rows) % 97).astype(object)
+    last = last + np.where(np.arange(rows) % 3 == 0, "", suffix)
+    debut = rng.integers(1871, year + 1, rows)
+    final = np.minimum(debut + rng.integers(0, 20, rows), year - 1)
+    # The most recent entries form this season's active rosters
+    final[-2200:] = year
+    debut[-2200:] = year - rng.integers(0, 15, 2200)
+    for i, (bench_first, bench_last, _, _) in enumerate(BENCH_PLAYERS):
+        first[rows - 1 - i], last[rows - 1 - i] = bench_first, bench_last
+    has_mlbam = debut >= 1900
+    return pd.DataFrame({
+        "name_first": first,
+        "name_last": last,
+        "key_mlbam": np.where(has_mlbam, 400000 + np.arange(rows), -1),
+        "key_fangraphs": np.where(has_mlbam, 1000 + np.arange(rows), -1),
+        "key_bbref": [f"{l[:5].lower()}{f[:2].lower()}01" for f, l in zip(first, last)],
+        "mlb_played_first": debut.astype(float),
+        "mlb_played_last": final.astype(float),
+    })
+
+
+def _filler_columns(rng, frame: pd.DataFrame, count: int) -> pd.DataFrame:
+    filler = pd.DataFrame(rng.normal(size=(len(frame), count)), columns=[f"stat_{i}" for i in range(count)])
+    return pd.concat([frame, filler], axis=1)
+
+
+def _names(players: pd.DataFrame) -> np.ndarray:
+    return (players["name_first"] + " " + players["name_last"]).to_numpy()
+
+
+def _synthetic_batting(rng, players: pd.DataFrame, teams: np.ndarray, year: int) -> pd.DataFrame:
+    rows = len(players)
+    avg = rng.uniform(0.150, 0.330, rows)
+    obp = avg + rng.uniform(0.03, 0.12, rows)
+    slg = avg + rng.uniform(0.05, 0.30, rows)
+    frame = pd.DataFrame({
+        "IDfg": players["key_fangraphs"].to_numpy(),
+        "Season": year,
+        "Name": _names(players),
+        "Team": teams,
+        "Age": rng.integers(20, 40, rows),
+        "G": rng.integers(1, 163, rows),
+        "PA": rng.integers(1, 720, rows),
+        "HR": rng.integers(0, 59, rows),
+        "RBI": rng.integers(0, 145, rows),
+        "R": rng.integers(0, 125, rows),
+        "SB": rng.integers(0, 60, rows),
+        "AVG": avg,
+        "OBP": obp,
+        "SLG": slg,
+        "OPS": obp + slg,
+        "WAR": rng.normal(1.0, 2.0, rows),
+    })
+    return _filler_columns(rng, frame, 300).sort_values("WAR", ascending=False, ignore_index=True)
+
+
+def _synthetic_pitching(rng, players: pd.DataFrame, teams: np.ndarray, year: int) -> pd.DataFrame:
+    rows = len(players)
+    frame = pd.DataFrame({
+        "IDfg": players["key_fangraphs"].to_numpy(),
+        "Season": year,
+        "Name": _names(players),
+        "Team": teams,
+        "Age": rng.integers(20, 42, rows),
+        "W": rng.integers(0, 19, rows),
+        "L": rng.integers(0, 15, rows),
+        "ERA": rng.uniform(1.5, 9.0, rows),
+        "G": rng.integers(1, 75, rows),
+        "GS": rng.integers(0, 33, rows),
+        "SV": rng.integers(0, 45, rows),
+        "IP": rng.uniform(1, 210, rows).round(1),
+        "SO": rng.integers(0, 260, rows),
+        "WHIP": rng.uniform(0.8, 2.0, rows),
+        "K/9": rng.uniform(4, 14, rows),
+        "BB/9": rng.uniform(1, 6, rows),
+        "WAR": rng.normal(0.5, 1.5, rows),
+    })
+    return _filler_columns(rng, frame, 380).sort_values("WAR", ascending=False, ignore_index=True)
+
+
+def _synthetic_standings(rng) -> List[pd.DataFrame]:
+    divisions = []
+    for start in range(0, 30, 5):
+        wins = np.sort(rng.integers(60, 100, 5))[::-1]
+        losses = 162 - wins
+        games_back = ["--"] + [f"{(wins[0] - w + losses[i] - losses[0]) / 2:.1f}" for i, w in enumerate(wins)][1:]
+        # Baseball-Reference standings come back as text columns
+        divisions.append(pd.DataFrame({
+            "Tm": FANGRAPHS_TEAMS[start:start + 5],
+            "W": wins.astype(str),
+            "L": losses.astype(str),
+            "W-L%": [f"{w / 162:.3f}" for w in wins],
+            "GB": games_back,
+        }))
+    return divisions
+
+
+_EVENTS = np.array(["single", "double", "triple", "home_run", "field_out", "strikeout", "walk",
+                    "grounded_into_double_play", "force_out", "hit_by_pitch"], dtype=object)
+_EVENT_WEIGHTS = np.array([0.14, 0.045, 0.004, 0.03, 0.38, 0.22, 0.08, 0.02, 0.02, 0.011])
+
+
+def _synthetic_statcast(rng, batters: pd.DataFrame, pitchers: pd.DataFrame, days: int = STATCAST_DAYS,
+                        pitches_per_day: int = 4000) -> pd.DataFrame:
+    rows = days * pitches_per_day
+    # Day offsets from the last recorded day; install() moves them next to today
+    last_day = date(FIXTURE_YEAR, 9, 29)
+    game_dates = pd.to_datetime(last_day) - pd.to_timedelta(np.repeat(np.arange(days)[::-1], pitches_per_day), unit="D")
+    pitch_type = rng.choice(np.array(["B", "S", "X"], dtype=object), rows, p=[0.36, 0.46, 0.18])
+    ends_at_bat = (pitch_type == "X") | (rng.random(rows) < 0.12)
+    events = np.where(ends_at_bat, rng.choice(_EVENTS, rows, p=_EVENT_WEIGHTS / _EVENT_WEIGHTS.sum()), None)
+    launch_speed = np.where(pitch_type == "X", rng.normal(89, 14, rows), np.nan)
+    return pd.DataFrame({
+        "game_date": game_dates,
+        "batter": rng.choice(batters["key_mlbam"].to_numpy(), rows),
+        "pitcher": rng.choice(pitchers["key_mlbam"].to_numpy(), rows),
+        "events": events,
+        "launch_speed": launch_speed,
+        "release_speed": rng.normal(91, 5, rows),
+        "type": pitch_type,
+    })
+
+
+# --- Serving ---
+
+class Upstream:
+    """
+    Stand-ins for the pybaseball functions, serving fixtures and counting calls.
+
+    Each call returns a fresh copy, as upstream does, so a frame kept by a
+    cache is never the fixture itself.
+    """
+
+    def __init__(self, fixtures: Fixtures, today: date = None):
+        self.fixtures = fixtures
+        self.calls: Dict[str, int] = {}
+        # Recorded Statcast is shifted so its last day is yesterday, inside every recent window
+        today = today or datetime.now(timezone.utc).date()
+        statcast = fixtures.statcast.copy()
+        game_dates = pd.to_datetime(statcast["game_date"])
+        statcast["game_date"] = game_dates + (pd.Timestamp(today - timedelta(days=1)) - game_dates.max())
+        self.statcast_frame = statcast
+        self._statcast_days = statcast["game_date"].to_numpy().astype("datetime64[D]")
+
+    def _count(self, name: str):
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def reset_calls(self) -> Dict[str, int]:
+        calls, self.calls = self.calls, {}
+        return calls
+
+    def batting_stats(self, year, qual=1, **kwargs):
+        self._count("batting_stats")
+        return self.fixtures.batting.copy()
+
+    def pitching_stats(self, year, qual=1, **kwargs):
+        self._count("pitching_stats")
+        return self.fixtures.pitching.copy()
+
+    def standings(self, year=None):
+        self._count("standings")
+        return [division.copy() for division in self.fixtures.standings]
+
+    def chadwick_register(self, *args, **kwargs):
+        self._count("chadwick_register")
+        return self.fixtures.register.copy()
+
+    def playerid_lookup(self, last, first=None, *args, **kwargs):
+        self._count("playerid_lookup")
+        register = self.fixtures.register
+        matches = register["name_last"].str.lower() == str(last).lower()
+        if first:
+            matches &= register["name_first"].str.lower() == str(first).lower()
+        return register[matches].reset_index(drop=True)
+
+    def _statcast_window(self, start_dt: str, end_dt: str) -> np.ndarray:
+        days = self._statcast_days
+        return (days >= np.datetime64(start_dt)) & (days <= np.datetime64(end_dt))
+
+    def statcast(self, start_dt=None, end_dt=None, **kwargs):
+        self._count("statcast")
+        return self.statcast_frame[self._statcast_window(start_dt, end_dt)].reset_index(drop=True)
+
+    def _statcast_player(self, role: str, start_dt, end_dt, player_id):
+        frame = self.statcast_frame
+        window = self._statcast_window(start_dt, end_dt) & (frame[role].to_numpy() == player_id)
+        return frame[window].reset_index(drop=True)
+
+    def statcast_batter(self, start_dt=None, end_dt=None, player_id=None):
+        self._count("statcast_batter")
+        return self._statcast_player("batter", start_dt, end_dt, player_id)
+
+    def statcast_pitcher(self, start_dt=None, end_dt=None, player_id=None):
+        self._count("statcast_pitcher")
+        return self._statcast_player("pitcher", start_dt, end_dt, player_id)
+
+
+def install(upstream: Upstream) -> Callable[[], None]:
+    """
+    Point every upstream import site of the tool modules at the fixtures.
+
+    Returns:
+        Function restoring the pybaseball functions
+    """
+    from pybaseball_mcp import frames, players, register, statcast_store
+
+    sites = [
+        (frames, "batting_stats"), (frames, "pitching_stats"), (frames, "standings"),
+        (register, "chadwick_register"), (register, "playerid_lookup"),
+        (statcast_store, "statcast"),
+        (players, "statcast_batter"), (players, "statcast_pitcher"),
+    ]
+    originals = [(module, name, getattr(module, name)) for module, name in sites]
+    for module, name in sites:
+        setattr(module, name, getattr(upstream, name))
+
+    def restore():
+        for module, name, original in originals:
+            setattr(module, name, original)
+
+    return restore
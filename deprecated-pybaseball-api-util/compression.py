@@ -0,0 +1,254 @@
+"""
+Response compression for the PyBaseball MCP HTTP server.
+A pure ASGI middleware that gzip-, zstd- or brotli-compresses responses
+above a size threshold. Streaming responses are compressed chunk by chunk
+with a flush after every chunk, so rows still reach the client as soon as
+they are produced.
+
+zstd and brotli are used only when the `zstandard` / `brotli` packages are
+installed; gzip (stdlib zlib) is always available.
+"""
+import logging
+import os
+import zlib
+from typing import Dict, List, Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Encodings in server preference order; unavailable ones are skipped
+COMPRESSION_ENCODINGS = [
+    encoding.strip()
+    for encoding in os.environ.get("PYBASEBALL_MCP_COMPRESSION", "zstd,br,gzip").lower().split(",")
+    if encoding.strip()
+]
+# Responses smaller than this are sent uncompressed
+COMPRESSION_MIN_BYTES = int(os.environ.get("PYBASEBALL_MCP_COMPRESSION_MIN_BYTES", 1024))
+GZIP_LEVEL = int(os.environ.get("PYBASEBALL_MCP_GZIP_LEVEL", 6))
+ZSTD_LEVEL = int(os.environ.get("PYBASEBALL_MCP_ZSTD_LEVEL", 3))
+BROTLI_QUALITY = int(os.environ.get("PYBASEBALL_MCP_BROTLI_QUALITY", 4))
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript")
+
+
+class _GzipCompressor:
+    def __init__(self, level: int = None):
+        self._compressor = zlib.compressobj(GZIP_LEVEL if level is None else level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _ZstdCompressor:
+    def __init__(self, level: int = None):
+        self._compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL if level is None else level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+class _BrotliCompressor:
+    def __init__(self, level: int = None):
+        self._compressor = brotli.Compressor(quality=BROTLI_QUALITY if level is None else level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+def available_encodings() -> Dict[str, type]:
+    """Get the compressor class of every encoding usable in this environment."""
+    encodings = {"gzip": _GzipCompressor}
+    if zstandard is not None:
+        encodings["zstd"] = _ZstdCompressor
+    if brotli is not None:
+        encodings["br"] = _BrotliCompressor
+    return encodings
+
+
+def compressor_for(encoding: str, level: int = None):
+    """Create a streaming compressor (compress() per chunk, finish() at the end)."""
+    return available_encodings()[encoding](level)
+
+
+def choose_encoding(accept_encoding: str, preferred: List[str]) -> Optional[str]:
+    """
+    Pick the response encoding for an Accept-Encoding header.
+
+    Among the encodings the client accepts (q > 0), the one the server
+    prefers most wins; q-values only rule encodings in or out.
+    """
+    accepted = {}
+    for item in (accept_encoding or "").split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name] = q
+    for encoding in preferred:
+        q = accepted.get(encoding, accepted.get("*", 0.0))
+        if q > 0:
+            return encoding
+    return None
+
+
+def _header(headers: list, name: bytes) -> Optional[bytes]:
+    for key, value in headers:
+        if key.lower() == name:
+            return value
+    return None
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing JSON and text responses.
+
+    Responses with a known size below ``minimum_size`` are sent as they are.
+    Streamed responses are held back only until ``minimum_size`` bytes have
+    been produced; if the stream ends first it is sent uncompressed,
+    otherwise it is compressed chunk by chunk from then on.
+    Compressed responses carry a weak ETag, since the bytes differ from the
+    identity representation.
+
+    Args:
+        app: ASGI application
+        minimum_size: Smallest response body worth compressing
+        encodings: Encodings in server preference order
+    """
+
+    def __init__(self, app, minimum_size: int = None, encodings: List[str] = None):
+        self.app = app
+        self.minimum_size = COMPRESSION_MIN_BYTES if minimum_size is None else minimum_size
+        usable = available_encodings()
+        self.encodings = [encoding for encoding in (encodings or COMPRESSION_ENCODINGS) if encoding in usable]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+        accept_encoding = _header(scope.get("headers", []), b"accept-encoding")
+        encoding = choose_encoding(accept_encoding.decode("latin-1") if accept_encoding else "", self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressingResponder(send, encoding, self.minimum_size)
+        await self.app(scope, receive, responder)
+
+
+class _CompressingResponder:
+    """Wraps ``send`` for one response, deciding whether and how to compress it."""
+
+    def __init__(self, send, encoding: str, minimum_size: int):
+        self.send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start_message = None
+        self.pending = []
+        self.pending_bytes = 0
+        self.compressor = None
+        self.passthrough = False
+
+    async def __call__(self, message):
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            headers = message.get("headers", [])
+            content_type = (_header(headers, b"content-type") or b"").decode("latin-1")
+            content_length = _header(headers, b"content-length")
+            if (message["status"] < 200 or message["status"] in (204, 304)
+                    or _header(headers, b"content-encoding") is not None
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)):
+                self.passthrough = True
+            elif content_length is not None and int(content_length) < self.minimum_size:
+                self.passthrough = True
+                self._add_vary(message)
+            if self.passthrough:
+                await self.send(message)
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.compressor is not None:
+            data = self.compressor.compress(body) if body else b""
+            if not more_body:
+                data += self.compressor.finish()
+            if data or not more_body:
+                await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
+            return
+
+        # Still deciding: hold chunks back until the threshold is reached or the body ends
+        self.pending.append(body)
+        self.pending_bytes += len(body)
+        if self.pending_bytes < self.minimum_size:
+            if not more_body:
+                self._add_vary(self.start_message)
+                await self.send(self.start_message)
+                await self.send({"type": "http.response.body", "body": b"".join(self.pending), "more_body": False})
+            return
+        await self._start_compressing(b"".join(self.pending), more_body)
+        self.pending = []
+
+    def _add_vary(self, message):
+        headers = message.setdefault("headers", [])
+        vary = _header(headers, b"vary")
+        if vary is None:
+            headers.append((b"vary", b"Accept-Encoding"))
+        elif b"accept-encoding" not in vary.lower():
+            headers[:] = [(k, v) for k, v in headers if k.lower() != b"vary"] + [(b"vary", vary + b", Accept-Encoding")]
+
+    async def _start_compressing(self, body: bytes, more_body: bool):
+        self.compressor = compressor_for(self.encoding)
+        data = self.compressor.compress(body)
+        if not more_body:
+            data += self.compressor.finish()
+        headers = []
+        for key, value in self.start_message.get("headers", []):
+            name = key.lower()
+            if name == b"content-length" or (name == b"transfer-encoding" and not more_body):
+                continue
+            if name == b"etag" and not value.startswith(b"W/"):
+                value = b"W/" + value
+            headers.append((key, value))
+        headers.append((b"content-encoding", self.encoding.encode("latin-1")))
+        if not more_body:
+            headers.append((b"content-length", str(len(data)).encode("latin-1")))
+        self.start_message["headers"] = headers
+        self._add_vary(self.start_message)
+        await self.send(self.start_message)
+        await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+
+def configure_compression(app, minimum_size: int = None, encodings: List[str] = None):
+    """Compress responses of a FastAPI/Starlette app (disable with PYBASEBALL_MCP_COMPRESSION=off)."""
+    if (encodings or COMPRESSION_ENCODINGS) in (["off"], ["none"]):
+        logger.info("HTTP response compression disabled")
+        return
+    app.add_middleware(CompressionMiddleware, minimum_size=minimum_size, encodings=encodings)
+    usable = [encoding for encoding in (encodings or COMPRESSION_ENCODINGS) if encoding in available_encodings()]
+    logger.info(f"HTTP response compression enabled ({', '.join(usable)}; threshold {minimum_size or COMPRESSION_MIN_BYTES} bytes)")
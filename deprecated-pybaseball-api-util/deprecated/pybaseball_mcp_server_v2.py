@@ -18,18 +18,10 @@ from mcp.server.stdio import stdio_server
 from mcp.types import Tool as MCPTool, TextContent
 import mcp.types as types
 
-# Import our modules
-from pybaseball_mcp.players import (
-    get_player_stats,
-    get_player_recent_stats,
-    search_player
-)
-from pybaseball_mcp.teams import (
-    get_standings,
-    get_league_leaders,
-    get_team_stats
-)
-from pybaseball_mcp.utils import clear_cache, get_cache_info
+# Tools are declared once in pybaseball_mcp.tools, shared with the native server
+from pybaseball_mcp.executor import run_blocking
+from pybaseball_mcp.lazy import package_version
+from pybaseball_mcp.tools import TOOL_REGISTRY
 
 # For FastAPI web mode
 from fastapi import FastAPI, Request, HTTPException
@@ -69,186 +61,31 @@ app = FastAPI(
 @server.list_tools()
 async def handle_list_tools() -> list[MCPTool]:
     """List available tools."""
-    return [
-        MCPTool(
-            name="player_stats",
-            description="Get season statistics for a specific MLB player",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "player_name": {
-                        "type": "string",
-                        "description": "Full name of the player (e.g., 'Shohei Ohtani')"
-                    },
-                    "year": {
-                        "type": "integer",
-                        "description": "Season year (defaults to current year)",
-                        "minimum": 1871
-                    }
-                },
-                "required": ["player_name"]
-            }
-        ),
-        MCPTool(
-            name="player_recent_performance",
-            description="Get recent game performance for an MLB player",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "player_name": {
-                        "type": "string",
-                        "description": "Full name of the player"
-                    },
-                    "days": {
-                        "type": "integer",
-                        "description": "Number of days to look back (default 30)",
-                        "minimum": 1,
-                        "maximum": 365,
-                        "default": 30
-                    }
-                },
-                "required": ["player_name"]
-            }
-        ),
-        MCPTool(
-            name="search_players",
-            description="Search for MLB players by name",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "search_term": {
-                        "type": "string",
-                        "description": "Partial name to search for"
-                    }
-                },
-                "required": ["search_term"]
-            }
-        ),
-        MCPTool(
-            name="mlb_standings",
-            description="Get current MLB standings by division",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "year": {
-                        "type": "integer",
-                        "description": "Season year (defaults to current year)",
-                        "minimum": 1871
-                    }
-                },
-                "required": []
-            }
-        ),
-        MCPTool(
-            name="stat_leaders",
-            description="Get MLB leaders for a specific statistic",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "stat": {
-                        "type": "string",
-                        "description": "Statistic to rank by (e.g., 'HR', 'AVG', 'ERA', 'SO')"
-                    },
-                    "year": {
-                        "type": "integer",
-                        "description": "Season year (defaults to current year)",
-                        "minimum": 1871
-                    },
-                    "top_n": {
-                        "type": "integer",
-                        "description": "Number of top players to return (default 10)",
-                        "minimum": 1,
-                        "maximum": 50,
-                        "default": 10
-                    },
-                    "player_type": {
-                        "type": "string",
-                        "description": "Type of player statistics",
-                        "enum": ["batting", "pitching"],
-                        "default": "batting"
-                    }
-                },
-                "required": ["stat"]
-            }
-        ),
-        MCPTool(
-            name="team_statistics",
-            description="Get aggregate statistics for an MLB team",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "team_name": {
-                        "type": "string",
-                        "description": "Team name or abbreviation (e.g., 'Yankees', 'NYY')"
-                    },
-                    "year": {
-                        "type": "integer",
-                        "description": "Season year (defaults to current year)",
-                        "minimum": 1871
-                    }
-                },
-                "required": ["team_name"]
-            }
-        ),
-        MCPTool(
-            name="clear_stats_cache",
-            description="Clear the statistics cache to force fresh data retrieval",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        MCPTool(
-            name="health_check",
-            description="Check if the PyBaseball MCP server is running properly",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        )
-    ]
+    return TOOL_REGISTRY.tools()
+
+async def run_tool(name: str, arguments: dict[str, Any]):
+    """
+    Run a declared tool on its executor.
+
+    Raises:
+        ValueError: If the arguments do not match the tool's schema
+    """
+    spec = TOOL_REGISTRY.get(name)
+    invalid = TOOL_REGISTRY.validate(name, arguments)
+    if invalid:
+        raise ValueError(f"Invalid arguments for {name}: {invalid}")
+    return await run_blocking(
+        spec.handler, *TOOL_REGISTRY.call_args(spec, arguments),
+        executor=spec.executor, timeout=spec.timeout
+    )
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict[str, Any]) -> Sequence[types.TextContent]:
     """Handle tool calls."""
+    if name not in TOOL_REGISTRY:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
     try:
-        if name == "player_stats":
-            result = get_player_stats(
-                arguments.get("player_name"),
-                arguments.get("year")
-            )
-        elif name == "player_recent_performance":
-            result = get_player_recent_stats(
-                arguments.get("player_name"),
-                arguments.get("days", 30)
-            )
-        elif name == "search_players":
-            result = search_player(arguments.get("search_term"))
-        elif name == "mlb_standings":
-            result = get_standings(arguments.get("year"))
-        elif name == "stat_leaders":
-            result = get_league_leaders(
-                arguments.get("stat"),
-                arguments.get("year"),
-                arguments.get("top_n", 10),
-                arguments.get("player_type", "batting")
-            )
-        elif name == "team_statistics":
-            result = get_team_stats(
-                arguments.get("team_name"),
-                arguments.get("year")
-            )
-        elif name == "clear_stats_cache":
-            clear_cache()
-            result = "Statistics cache cleared successfully"
-        elif name == "health_check":
-            import pybaseball
-            result = f"PyBaseball MCP Server is running. PyBaseball version: {pybaseball.__version__}"
-        else:
-            result = f"Unknown tool: {name}"
-        
+        result = await run_tool(name, arguments or {})
         return [TextContent(type="text", text=str(result))]
     
     except Exception as e:
@@ -297,10 +134,9 @@ async def root():
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    import pybaseball
     return {
         "status": "healthy",
-        "version": pybaseball.__version__,
+        "version": package_version("pybaseball"),
         "service": "PyBaseball API"
     }
 
@@ -311,41 +147,9 @@ async def call_tool(tool_name: str, request: Request):
         # Parse the request body
         body = await request.json()
         
-        # Call the appropriate function based on the tool name
-        if tool_name == "player_stats":
-            result = get_player_stats(
-                body.get("player_name"),
-                body.get("year")
-            )
-        elif tool_name == "player_recent_performance":
-            result = get_player_recent_stats(
-                body.get("player_name"),
-                body.get("days", 30)
-            )
-        elif tool_name == "search_players":
-            result = search_player(body.get("search_term"))
-        elif tool_name == "mlb_standings":
-            result = get_standings(body.get("year"))
-        elif tool_name == "stat_leaders":
-            result = get_league_leaders(
-                body.get("stat"),
-                body.get("year"),
-                body.get("top_n", 10),
-                body.get("player_type", "batting")
-            )
-        elif tool_name == "team_statistics":
-            result = get_team_stats(
-                body.get("team_name"),
-                body.get("year")
-            )
-        elif tool_name == "clear_stats_cache":
-            clear_cache()
-            result = "Statistics cache cleared successfully"
-        elif tool_name == "health_check":
-            import pybaseball
-            result = f"PyBaseball MCP Server is running. PyBaseball version: {pybaseball.__version__}"
-        else:
+        if tool_name not in TOOL_REGISTRY:
             raise HTTPException(status_code=404, detail=f"Unknown tool: {tool_name}")
+        result = await run_tool(tool_name, body)
         
         return {"result": str(result)}
     
@@ -0,0 +1,145 @@
+"""
+Season archive for PyBaseball MCP Server.
+Completed seasons never change, so their frames are stored once as
+uncompressed Arrow IPC (Feather) files and memory-mapped on load.
+
+Bulk-preload a range of seasons with:
+    python -m pybaseball_mcp.archive --start 2015 --end 2024
+"""
+import argparse
+import logging
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from .expiry import get_expiry_policy
+from .utils import MCP_DATA_DIR
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_DIR = MCP_DATA_DIR / "archive"
+
+ARCHIVE_KINDS = ("batting", "pitching", "standings")
+
+# Column tagging each row of an archived standings file with its division
+_DIVISION_COLUMN = "__division"
+
+
+def is_completed_season(year: int, kind: str = "batting") -> bool:
+    """Check whether a season dataset will no longer change, per the expiry policy."""
+    return get_expiry_policy().is_immutable(kind, year=year)
+
+
+def archive_path(kind: str, year: int, qual: int = None) -> Path:
+    """Get the archive file path for a season dataset."""
+    suffix = f"_q{qual}" if qual is not None else ""
+    return Path(ARCHIVE_DIR) / f"{kind}_{year}{suffix}.feather"
+
+
+def read_archive(kind: str, year: int, qual: int = None):
+    """
+    Load an archived season dataset.
+
+    Returns:
+        DataFrame (a list of division DataFrames for standings), or None if
+        the season is not archived
+    """
+    from pyarrow import feather
+
+    path = archive_path(kind, year, qual)
+    if not path.exists():
+        return None
+    # Memory-mapped read; numeric columns are backed by the file without copying
+    frame = feather.read_table(path, memory_map=True).to_pandas(split_blocks=True)
+    logger.debug(f"Loaded {kind} {year} from archive {path}")
+    if kind == "standings":
+        return [
+            division.drop(columns=_DIVISION_COLUMN).reset_index(drop=True)
+            for _, division in frame.groupby(_DIVISION_COLUMN, sort=True)
+        ]
+    return frame
+
+
+def write_archive(kind: str, year: int, data, qual: int = None) -> Path:
+    """
+    Archive a completed season dataset.
+
+    Args:
+        kind: "batting", "pitching" or "standings"
+        year: Season year
+        data: DataFrame, or a list of division DataFrames for standings
+        qual: Qualifier the frame was fetched with
+
+    Returns:
+        Path of the archive file
+    """
+    from pyarrow import feather
+
+    if kind == "standings":
+        data = pd.concat(
+            [division.assign(**{_DIVISION_COLUMN: i}) for i, division in enumerate(data)],
+            ignore_index=True
+        )
+    path = archive_path(kind, year, qual)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    feather.write_feather(data, tmp_path, compression="uncompressed")
+    os.replace(tmp_path, path)
+    logger.info(f"Archived {kind} {year} to {path}")
+    return path
+
+
+def preload(years, kinds=ARCHIVE_KINDS, qual: int = 1, force: bool = False) -> dict:
+    """
+    Fetch and archive completed seasons.
+
+    Args:
+        years: Iterable of season years
+        kinds: Datasets to archive
+        qual: Qualifier for batting/pitching frames
+        force: Re-fetch seasons that are already archived
+
+    Returns:
+        Dictionary with lists of archived, skipped and failed "kind year" labels
+    """
+    from .frames import _fetch_frame
+
+    summary = {"archived": [], "skipped": [], "failed": []}
+    for year in years:
+        for kind in kinds:
+            label = f"{kind} {year}"
+            kind_qual = None if kind == "standings" else qual
+            if not is_completed_season(year, kind) or (not force and archive_path(kind, year, kind_qual).exists()):
+                summary["skipped"].append(label)
+                continue
+            try:
+                write_archive(kind, year, _fetch_frame(kind, year, kind_qual), kind_qual)
+                summary["archived"].append(label)
+            except Exception as e:
+                logger.error(f"Failed to archive {label}: {e}")
+                summary["failed"].append(label)
+    return summary
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Preload completed MLB seasons into the local archive.")
+    parser.add_argument("--start", type=int, required=True, help="First season to archive")
+    parser.add_argument("--end", type=int, default=datetime.now().year - 1, help="Last season to archive (default: last completed season)")
+    parser.add_argument("--kinds", nargs="+", choices=ARCHIVE_KINDS, default=list(ARCHIVE_KINDS), help="Datasets to archive")
+    parser.add_argument("--qual", type=int, default=1, help="Qualifier for batting/pitching frames (default 1)")
+    parser.add_argument("--force", action="store_true", help="Re-fetch seasons that are already archived")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s', stream=sys.stderr)
+    summary = preload(range(args.start, args.end + 1), args.kinds, args.qual, args.force)
+    print(f"Archived {len(summary['archived'])}, skipped {len(summary['skipped'])}, failed {len(summary['failed'])}")
+    for label in summary["failed"]:
+        print(f"  failed: {label}")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,336 @@
+"""
+Tiered cache for PyBaseball MCP Server.
+An in-memory LRU (L1) with byte-size accounting in front of a size-capped
+on-disk store (L2). Entries evicted from L1 are demoted to disk and entries
+found on disk are promoted back into memory.
+"""
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# Every cache created in this process, for metrics
+_instances = weakref.WeakSet()
+
+
+def live_caches() -> list:
+    """Get every TieredCache that is still alive."""
+    return list(_instances)
+
+
+def estimate_nbytes(value) -> int:
+    """
+    Estimate the in-memory size of a cached value in bytes.
+
+    DataFrames and Series are measured with ``memory_usage(deep=True)``;
+    containers are measured recursively.
+    """
+    memory_usage = getattr(value, "memory_usage", None)
+    if memory_usage is not None:
+        try:
+            usage = memory_usage(deep=True)
+            return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+        except TypeError:
+            pass
+    if isinstance(value, (str, bytes, bytearray)):
+        return sys.getsizeof(value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_nbytes(k) + estimate_nbytes(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_nbytes(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class _Entry:
+    __slots__ = ("value", "nbytes", "expires_at")
+
+    def __init__(self, value, nbytes: int, expires_at: float):
+        self.value = value
+        self.nbytes = nbytes
+        self.expires_at = expires_at
+
+
+class _DiskFile:
+    __slots__ = ("size",)
+
+    def __init__(self, size: int):
+        self.size = size
+
+
+class TieredCache:
+    """
+    Thread-safe two-tier cache.
+
+    Args:
+        name: Name used in logs and stats
+        memory_budget_bytes: Size cap of the in-memory tier
+        disk_dir: Directory for the on-disk tier, or None for memory only
+        disk_budget_bytes: Size cap of the on-disk tier
+        default_ttl: Seconds entries live by default, or None to never expire
+
+    Expiry uses wall-clock time so entries demoted to disk keep their deadline
+    across restarts. Values must be picklable to be demoted; values that are
+    not are simply dropped from memory. Cached values are shared between
+    callers and must be treated as read-only.
+    """
+
+    def __init__(self, name: str, memory_budget_bytes: int, disk_dir=None,
+                 disk_budget_bytes: int = 0, default_ttl: float = None):
+        self.name = name
+        self.memory_budget_bytes = memory_budget_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir and disk_budget_bytes > 0 else None
+        self.disk_budget_bytes = disk_budget_bytes
+        self.default_ttl = default_ttl
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._disk = OrderedDict()  # file name -> _DiskFile, least recently used first
+        self._disk_bytes = 0
+        self._demoting = {}  # key -> entry evicted from memory and being written to disk
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+        # The disk tier is indexed on first use, so creating a cache touches no files
+        self._disk_scanned = self.disk_dir is None
+        _instances.add(self)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Bytes held by the in-memory tier."""
+        return self._memory_bytes
+
+    # --- Public API ---
+
+    def get(self, key, default=None, record_stats: bool = True):
+        """Get a value, promoting it from disk into memory if needed."""
+        entry = self._get_entry(key, record_stats)
+        return default if entry is None else entry.value
+
+    def set(self, key, value, ttl: float = _MISSING):
+        """
+        Store a value in memory.
+
+        Args:
+            key: Hashable key; its repr() names the file on disk
+            value: Value to cache
+            ttl: Seconds until expiry, None to never expire (defaults to default_ttl)
+        """
+        ttl = self.default_ttl if ttl is _MISSING else ttl
+        expires_at = float("inf") if ttl is None else time.time() + ttl
+        nbytes = estimate_nbytes(value)
+        with self._lock:
+            self._ensure_disk()
+            if key in self._memory:
+                self._drop_memory(key)
+            self._demoting.pop(key, None)
+            self._drop_disk(self._file_name(key))
+            demoted = self._put_memory(key, _Entry(value, nbytes, expires_at))
+        self._demote(demoted)
+
+    def remaining_ttl(self, key) -> Optional[float]:
+        """Get the seconds until a key expires (inf if never), or None if it is not cached."""
+        entry = self._get_entry(key, record_stats=False)
+        if entry is None:
+            return None
+        remaining = entry.expires_at - time.time()
+        return remaining if remaining > 0 else None
+
+    def delete(self, key):
+        """Remove a key from both tiers."""
+        with self._lock:
+            self._ensure_disk()
+            if key in self._memory:
+                self._drop_memory(key)
+            self._demoting.pop(key, None)
+            self._drop_disk(self._file_name(key))
+
+    def clear(self):
+        """Remove every entry from both tiers."""
+        with self._lock:
+            self._ensure_disk()
+            self._memory.clear()
+            self._memory_bytes = 0
+            self._demoting.clear()
+            for file_name in list(self._disk):
+                self._drop_disk(file_name)
+        logger.info(f"Cache '{self.name}' cleared")
+
+    def stats(self) -> dict:
+        """Get hit/miss/eviction counters and usage of both tiers."""
+        with self._lock:
+            self._ensure_disk()
+            return {
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "memory_budget_bytes": self.memory_budget_bytes,
+                "disk_entries": len(self._disk),
+                "disk_bytes": self._disk_bytes,
+                "disk_budget_bytes": self.disk_budget_bytes if self.disk_dir else 0,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "disk_evictions": self.disk_evictions,
+            }
+
+    # --- Memory tier ---
+
+    def _live_entry(self, key) -> Optional[_Entry]:
+        entry = self._memory.get(key)
+        if entry is not None:
+            if entry.expires_at > time.time():
+                self._memory.move_to_end(key)
+                return entry
+            self._drop_memory(key)
+        # Entries being written to disk are still served from memory
+        entry = self._demoting.get(key)
+        if entry is not None and entry.expires_at > time.time():
+            return entry
+        return None
+
+    def _put_memory(self, key, entry: _Entry) -> list:
+        """Add an entry; returns the (key, entry) pairs evicted to disk, to pass to _demote once unlocked."""
+        self._memory[key] = entry
+        self._memory_bytes += entry.nbytes
+        demoted = []
+        # Demote least recently used entries, always keeping the newest one
+        while self._memory_bytes > self.memory_budget_bytes and len(self._memory) > 1:
+            oldest_key = next(iter(self._memory))
+            oldest = self._drop_memory(oldest_key)
+            self.evictions += 1
+            if self.disk_dir is not None and oldest.expires_at > time.time():
+                self._demoting[oldest_key] = oldest
+                demoted.append((oldest_key, oldest))
+        return demoted
+
+    def _drop_memory(self, key) -> _Entry:
+        entry = self._memory.pop(key)
+        self._memory_bytes -= entry.nbytes
+        return entry
+
+    # --- Disk tier ---
+    #
+    # Pickling and file reads and writes run without the lock, so one key's
+    # disk I/O never blocks callers of other keys. The lock only guards the
+    # index; results are published under it if nothing changed meanwhile.
+
+    @staticmethod
+    def _file_name(key) -> str:
+        return hashlib.sha1(repr(key).encode("utf-8")).hexdigest() + ".pkl"
+
+    def _ensure_disk(self):
+        if not self._disk_scanned:
+            self._disk_scanned = True
+            self._scan_disk()
+
+    def _scan_disk(self):
+        self.disk_dir.mkdir(parents=True, exist_ok=True)
+        files = []
+        for path in self.disk_dir.glob("*.pkl"):
+            stat = path.stat()
+            files.append((stat.st_mtime, path.name, stat.st_size))
+        for _, file_name, size in sorted(files):
+            self._disk[file_name] = _DiskFile(size)
+            self._disk_bytes += size
+        self._trim_disk()
+
+    def _get_entry(self, key, record_stats: bool) -> Optional[_Entry]:
+        while True:
+            with self._lock:
+                self._ensure_disk()
+                entry = self._live_entry(key)
+                if entry is not None:
+                    if record_stats:
+                        self.hits += 1
+                    return entry
+                file_name = self._file_name(key)
+                disk_file = self._disk.get(file_name) if self.disk_dir is not None else None
+                if disk_file is None:
+                    if record_stats:
+                        self.misses += 1
+                    return None
+            entry = self._read_disk(key, file_name)
+            with self._lock:
+                if self._disk.get(file_name) is not disk_file:
+                    # Set, deleted or rewritten while it was read; look again
+                    continue
+                self._drop_disk(file_name)
+                if entry is None:
+                    if record_stats:
+                        self.misses += 1
+                    return None
+                if record_stats:
+                    self.disk_hits += 1
+                # Promote: the memory tier owns the entry until it is demoted again
+                demoted = self._put_memory(key, entry)
+            self._demote(demoted)
+            return entry
+
+    def _read_disk(self, key, file_name: str) -> Optional[_Entry]:
+        try:
+            with open(self.disk_dir / file_name, "rb") as f:
+                stored_key, expires_at, value = pickle.load(f)
+        except Exception as e:
+            logger.debug(f"Cache '{self.name}' could not read {file_name}: {e}")
+            return None
+        if stored_key != key or expires_at <= time.time():
+            return None
+        return _Entry(value, estimate_nbytes(value), expires_at)
+
+    def _demote(self, demoted: list):
+        for key, entry in demoted:
+            self._write_disk(key, entry)
+
+    def _write_disk(self, key, entry: _Entry):
+        file_name = self._file_name(key)
+        path = self.disk_dir / file_name
+        # One temp file per writer thread, renamed into place under the lock
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump((key, entry.expires_at, entry.value), f, protocol=pickle.HIGHEST_PROTOCOL)
+            size = tmp_path.stat().st_size
+        except Exception as e:
+            logger.debug(f"Cache '{self.name}' could not demote {key!r} to disk: {e}")
+            tmp_path.unlink(missing_ok=True)
+            size = None
+        with self._lock:
+            if self._demoting.get(key) is not entry:
+                # Set or deleted while it was written
+                tmp_path.unlink(missing_ok=True)
+                return
+            del self._demoting[key]
+            if size is None:
+                return
+            os.replace(tmp_path, path)
+            self._drop_disk(file_name, remove_file=False)
+            self._disk[file_name] = _DiskFile(size)
+            self._disk_bytes += size
+            self._trim_disk()
+
+    def _drop_disk(self, file_name: str, remove_file: bool = True):
+        disk_file = self._disk.pop(file_name, None)
+        if disk_file is None:
+            return
+        self._disk_bytes -= disk_file.size
+        if remove_file:
+            (self.disk_dir / file_name).unlink(missing_ok=True)
+
+    def _trim_disk(self):
+        while self._disk_bytes > self.disk_budget_bytes and self._disk:
+            oldest = next(iter(self._disk))
+            self._drop_disk(oldest)
+            self.disk_evictions += 1
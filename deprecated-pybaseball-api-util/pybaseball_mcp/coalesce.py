@@ -0,0 +1,85 @@
+"""
+Single-flight coalescing for PyBaseball MCP Server.
+Concurrent identical tool calls share one execution and its result.
+"""
+import asyncio
+import json
+import logging
+
+from .tracing import current_span, replay_spans, span
+
+logger = logging.getLogger(__name__)
+
+
+def call_key(name: str, arguments: dict = None, variant: str = None) -> str:
+    """
+    Build a canonical key for a tool call.
+
+    Argument order does not matter and arguments explicitly set to None are
+    treated the same as omitted ones. ``variant`` separates calls whose
+    results differ for other reasons (e.g. the response encoding mode).
+    """
+    arguments = {k: v for k, v in (arguments or {}).items() if v is not None}
+    key = name + ":" + json.dumps(arguments, sort_keys=True, separators=(",", ":"), default=str)
+    return key if variant is None else f"{key}#{variant}"
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key.
+
+    The first caller starts the work as a task; callers arriving while it is in
+    flight await the same task and receive the same result (or exception).
+    The task is shielded, so a cancelled caller does not cancel the work for
+    the others. The work is traced once, under a "coalesce.shared" span in
+    the first caller's trace, and its spans are replayed into each other
+    caller's trace when it finishes.
+    """
+
+    def __init__(self):
+        self._inflight = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, func):
+        """
+        Run ``func()`` once per key among concurrent callers.
+
+        Args:
+            key: Coalescing key, usually from call_key()
+            func: Zero-argument callable returning an awaitable
+
+        Returns:
+            The shared result of the call
+        """
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            shared = {}
+
+            async def run():
+                with span("coalesce.shared") as shared_span:
+                    shared["span"] = shared_span
+                    return await func()
+
+            task = asyncio.ensure_future(run())
+            self._inflight[key] = (task, shared)
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            self.started += 1
+            return await asyncio.shield(task)
+        task, shared = inflight
+        self.coalesced += 1
+        logger.debug(f"Coalescing duplicate call: {key}")
+        try:
+            return await asyncio.shield(task)
+        finally:
+            caller = current_span()
+            if caller is not None and task.done() and "span" in shared:
+                replay_spans(shared["span"], caller)
+
+    def stats(self) -> dict:
+        """Get counters for started and coalesced calls."""
+        return {
+            "in_flight": len(self._inflight),
+            "started": self.started,
+            "coalesced": self.coalesced,
+        }
@@ -0,0 +1,50 @@
+"""
+Per-frame derived data for PyBaseball MCP Server.
+Shared season frames are read-only, so anything computed from one (rank
+orders, team aggregates) can be built once and reused for as long as that
+frame object lives.
+"""
+import threading
+import weakref
+from typing import Any, Callable
+
+_derived = {}
+_derived_lock = threading.Lock()
+
+
+def derived(frame, name: str, build: Callable[[], Any]):
+    """
+    Get a value derived from a frame, building it on first use.
+
+    Values are keyed by frame identity and dropped when the frame is garbage
+    collected, so a reloaded frame (a new object) gets fresh values and no
+    frame is kept alive by this cache.
+
+    Args:
+        frame: Shared, read-only frame
+        name: Name of the derived value
+        build: Called without arguments to build the value
+
+    Returns:
+        The derived value
+    """
+    key = (id(frame), name)
+    with _derived_lock:
+        entry = _derived.get(key)
+        if entry is not None and entry[0]() is frame:
+            return entry[1]
+    value = build()
+    with _derived_lock:
+        entry = _derived.get(key)
+        if entry is not None and entry[0]() is frame:
+            return entry[1]
+        _derived[key] = (weakref.ref(frame), value)
+    weakref.finalize(frame, _forget, key, value)
+    return value
+
+
+def _forget(key: tuple, value):
+    with _derived_lock:
+        entry = _derived.get(key)
+        if entry is not None and entry[1] is value:
+            del _derived[key]
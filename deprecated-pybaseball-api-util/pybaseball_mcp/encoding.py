@@ -0,0 +1,136 @@
+"""
+Response encoding for PyBaseball MCP Server.
+Every tool result is serialized through dumps()/dumpb() so output format is
+chosen in one place. Two modes are supported:
+
+- "compact": no whitespace, the default for HTTP
+- "pretty": two-space indentation
+
+orjson is used when installed, with the standard library as a fallback.
+NumPy and pandas scalars, arrays and timestamps are encoded natively.
+The active mode is held in a context variable, so each transport picks its own
+mode and worker threads started through run_blocking() inherit it.
+"""
+import contextvars
+import json
+import logging
+import math
+import os
+from contextlib import contextmanager
+from datetime import date, datetime
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+ENCODING_MODES = ("compact", "pretty")
+
+
+def _mode_from_env(variable: str, default: str) -> str:
+    mode = os.environ.get(variable, default).lower()
+    if mode not in ENCODING_MODES:
+        logger.warning(f"Unknown {variable} '{mode}', using '{default}'")
+        return default
+    return mode
+
+
+# Default mode, and the mode each transport selects for its requests
+DEFAULT_ENCODING_MODE = _mode_from_env("PYBASEBALL_MCP_JSON_MODE", "compact")
+HTTP_ENCODING_MODE = _mode_from_env("PYBASEBALL_MCP_HTTP_JSON_MODE", DEFAULT_ENCODING_MODE)
+STDIO_ENCODING_MODE = _mode_from_env("PYBASEBALL_MCP_STDIO_JSON_MODE", DEFAULT_ENCODING_MODE)
+
+_encoding_mode = contextvars.ContextVar("pybaseball_mcp_encoding_mode", default=DEFAULT_ENCODING_MODE)
+
+
+def encoding_mode() -> str:
+    """Get the encoding mode of the current context."""
+    return _encoding_mode.get()
+
+
+def set_encoding_mode(mode: str) -> contextvars.Token:
+    """Select the encoding mode for the current context; returns a token for reset."""
+    if mode not in ENCODING_MODES:
+        raise ValueError(f"Unknown encoding mode '{mode}'. Choose from: {', '.join(ENCODING_MODES)}")
+    return _encoding_mode.set(mode)
+
+
+def reset_encoding_mode(token: contextvars.Token):
+    """Restore the encoding mode in effect before set_encoding_mode()."""
+    _encoding_mode.reset(token)
+
+
+@contextmanager
+def use_encoding_mode(mode: str):
+    """Temporarily select an encoding mode."""
+    token = set_encoding_mode(mode)
+    try:
+        yield
+    finally:
+        _encoding_mode.reset(token)
+
+
+def _default(value):
+    """Encode values neither serializer handles natively."""
+    # NumPy scalars and arrays (and pandas extension scalars built on them)
+    if hasattr(value, "tolist") and hasattr(value, "dtype"):
+        return value.tolist()
+    # pandas.NA / NaT
+    if type(value).__name__ in ("NAType", "NaTType"):
+        return None
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+
+def _clean_floats(value):
+    """Replace NaN/Infinity with null for the standard library encoder, like orjson does."""
+    if isinstance(value, float):
+        return None if math.isnan(value) or math.isinf(value) else value
+    if isinstance(value, dict):
+        return {k: _clean_floats(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_clean_floats(v) for v in value]
+    return value
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = {
+        "compact": orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        "pretty": orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2,
+    }
+
+    def _encode(value, mode: str) -> bytes:
+        return orjson.dumps(value, default=_default, option=_ORJSON_OPTIONS[mode])
+else:
+    _JSON_OPTIONS = {
+        "compact": {"separators": (",", ":")},
+        "pretty": {"indent": 2},
+    }
+
+    def _encode(value, mode: str) -> bytes:
+        return json.dumps(_clean_floats(value), default=_default, ensure_ascii=False,
+                          **_JSON_OPTIONS[mode]).encode("utf-8")
+
+
+def dumpb(value, mode: str = None) -> bytes:
+    """
+    Serialize a value to UTF-8 JSON bytes.
+
+    Args:
+        value: Value to encode
+        mode: "compact" or "pretty" (defaults to the current context's mode)
+
+    Returns:
+        Encoded JSON
+    """
+    return _encode(value, mode or _encoding_mode.get())
+
+
+def dumps(value, mode: str = None) -> str:
+    """Serialize a value to a JSON string (see dumpb)."""
+    return dumpb(value, mode).decode("utf-8")
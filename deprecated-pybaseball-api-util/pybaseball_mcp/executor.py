@@ -0,0 +1,79 @@
+"""
+Shared tool executors for PyBaseball MCP Server.
+Runs blocking pybaseball calls on long-lived, bounded thread pools so the
+event loop stays free while upstream sites are scraped.
+"""
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Worker count for each executor class; override with PYBASEBALL_MCP_<NAME>_WORKERS
+EXECUTOR_WORKERS = {
+    "default": 8,   # FanGraphs / Baseball-Reference scrapes
+    "statcast": 4,  # Baseball Savant pulls, which are slower and heavier
+    "warmup": 2,    # Background preloads and refreshes, kept off the request pools
+}
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def _worker_count(name: str) -> int:
+    default = EXECUTOR_WORKERS.get(name, EXECUTOR_WORKERS["default"])
+    return int(os.environ.get(f"PYBASEBALL_MCP_{name.upper()}_WORKERS", default))
+
+
+def get_executor(name: str = "default") -> concurrent.futures.ThreadPoolExecutor:
+    """Get (creating on first use) the shared thread pool for an executor class."""
+    executor = _executors.get(name)
+    if executor is None:
+        with _executors_lock:
+            executor = _executors.get(name)
+            if executor is None:
+                workers = _worker_count(name)
+                executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=workers,
+                    thread_name_prefix=f"pybaseball-{name}"
+                )
+                _executors[name] = executor
+                logger.info(f"Started '{name}' executor with {workers} workers")
+    return executor
+
+
+async def run_blocking(func, *args, executor: str = "default", timeout: float = None, **kwargs):
+    """
+    Await a blocking call on a shared executor.
+
+    The caller's context variables are carried into the worker thread. On
+    timeout, asyncio.TimeoutError is raised immediately; the worker finishes
+    in the background and its result is discarded.
+
+    Args:
+        func: Blocking callable
+        executor: Executor class name (see EXECUTOR_WORKERS)
+        timeout: Seconds to wait before giving up, or None to wait forever
+
+    Returns:
+        The return value of func
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    future = loop.run_in_executor(get_executor(executor), call)
+    if timeout is None:
+        return await future
+    return await asyncio.wait_for(future, timeout)
+
+
+def shutdown_executors(wait: bool = False):
+    """Shut down every shared executor."""
+    with _executors_lock:
+        for executor in _executors.values():
+            executor.shutdown(wait=wait, cancel_futures=True)
+        _executors.clear()
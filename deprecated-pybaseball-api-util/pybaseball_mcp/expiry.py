@@ -0,0 +1,137 @@
+"""
+Cache expiry policies for PyBaseball MCP Server.
+Decides how long season frames, standings and Statcast partitions stay fresh.
+"""
+import logging
+import os
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Days of league-wide Statcast kept on disk, and the longest recent window served
+STATCAST_RETENTION_DAYS = int(os.environ.get("PYBASEBALL_STATCAST_RETENTION_DAYS", 60))
+
+
+def utc_today() -> date:
+    """Get today's date in UTC, the calendar the expiry policies use."""
+    return datetime.now(timezone.utc).date()
+
+
+class ExpiryPolicy:
+    """
+    Base class for expiry policies.
+
+    Subclasses implement ttl(); None means the data never changes again.
+    """
+
+    def ttl(self, kind: str, year: int = None, game_date: date = None, now: datetime = None) -> Optional[float]:
+        """
+        Get the number of seconds data stays fresh.
+
+        Args:
+            kind: "batting", "pitching", "standings" or "statcast"
+            year: Season year (season datasets)
+            game_date: Game date (Statcast partitions)
+            now: Current time, for testing (defaults to the current UTC time)
+
+        Returns:
+            Seconds until expiry, or None if the data is immutable
+        """
+        raise NotImplementedError
+
+    def is_immutable(self, kind: str, year: int = None, game_date: date = None, now: datetime = None) -> bool:
+        """Check whether data will never change again."""
+        return self.ttl(kind, year=year, game_date=game_date, now=now) is None
+
+
+class FixedExpiryPolicy(ExpiryPolicy):
+    """Expire everything after the same number of seconds."""
+
+    def __init__(self, ttl_seconds: float = 300):
+        self.ttl_seconds = ttl_seconds
+
+    def ttl(self, kind, year=None, game_date=None, now=None):
+        return self.ttl_seconds
+
+
+class SeasonAwareExpiryPolicy(ExpiryPolicy):
+    """
+    Expiry tied to the baseball calendar.
+
+    - Completed seasons never expire.
+    - During the season, current-season data expires at the next daily
+      refresh hour (after upstream sites finish their overnight updates) or,
+      while games are being played, every ``game_window_ttl`` seconds.
+    - In the offseason, current-season data expires every ``offseason_ttl``.
+    - Statcast partitions older than ``statcast_settle_days`` are immutable;
+      newer ones follow the in-season schedule.
+
+    All hours are UTC.
+    """
+
+    def __init__(self, refresh_hour: int = 11, game_window=(17, 7), game_window_ttl: float = 900,
+                 season_months=(3, 11), offseason_ttl: float = 86400, statcast_settle_days: int = 3):
+        self.refresh_hour = refresh_hour
+        self.game_window = game_window
+        self.game_window_ttl = game_window_ttl
+        self.season_months = season_months
+        self.offseason_ttl = offseason_ttl
+        self.statcast_settle_days = statcast_settle_days
+
+    def ttl(self, kind, year=None, game_date=None, now=None):
+        now = now or datetime.now(timezone.utc)
+        if kind == "statcast":
+            if game_date is None:
+                raise ValueError("Statcast expiry needs a game_date")
+            if (now.date() - game_date).days > self.statcast_settle_days:
+                return None
+            return self._in_season_ttl(now)
+        if year is None:
+            raise ValueError(f"{kind} expiry needs a year")
+        if year < now.year:
+            return None
+        first_month, last_month = self.season_months
+        if not first_month <= now.month <= last_month:
+            return self.offseason_ttl
+        return self._in_season_ttl(now)
+
+    def _in_game_window(self, hour: int) -> bool:
+        start, end = self.game_window
+        return start <= hour or hour < end if start > end else start <= hour < end
+
+    def _in_season_ttl(self, now: datetime) -> float:
+        if self._in_game_window(now.hour):
+            return self.game_window_ttl
+        # Fresh until the nightly refresh lands or the next games start
+        boundaries = []
+        for hour in (self.refresh_hour, self.game_window[0]):
+            boundary = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+            if boundary <= now:
+                boundary += timedelta(days=1)
+            boundaries.append(boundary)
+        return (min(boundaries) - now).total_seconds()
+
+
+def _policy_from_env() -> ExpiryPolicy:
+    name = os.environ.get("PYBASEBALL_EXPIRY_POLICY", "season").lower()
+    if name == "fixed":
+        return FixedExpiryPolicy(int(os.environ.get("PYBASEBALL_EXPIRY_SECONDS", 300)))
+    if name != "season":
+        logger.warning(f"Unknown PYBASEBALL_EXPIRY_POLICY '{name}', using 'season'")
+    return SeasonAwareExpiryPolicy()
+
+
+_policy = _policy_from_env()
+
+
+def get_expiry_policy() -> ExpiryPolicy:
+    """Get the active expiry policy."""
+    return _policy
+
+
+def set_expiry_policy(policy: ExpiryPolicy):
+    """Replace the active expiry policy."""
+    global _policy
+    _policy = policy
+    logger.info(f"Expiry policy set to {type(policy).__name__}")
@@ -0,0 +1,195 @@
+"""
+Season frame store for PyBaseball MCP Server.
+Keeps parsed season frames (FanGraphs batting/pitching, Baseball-Reference
+standings) in memory so every tool shares one copy. Completed seasons are
+read from and written to the local archive instead of being re-scraped.
+"""
+import logging
+import os
+import threading
+
+from pybaseball import batting_stats, pitching_stats, standings
+
+from .archive import is_completed_season, read_archive, write_archive
+from .cache import TieredCache
+from .expiry import ExpiryPolicy, get_expiry_policy
+from .metrics import upstream_call
+from .tracing import span
+from .ranks import rank_index
+from .team_aggregates import team_table
+from .utils import MCP_DATA_DIR, forget_pybaseball_records, setup_cache, suppress_stdout
+
+logger = logging.getLogger(__name__)
+
+# Every tool module imports this one before scraping upstream
+setup_cache()
+
+FRAME_MEMORY_BUDGET_BYTES = int(os.environ.get("PYBASEBALL_FRAME_MEMORY_MB", 512)) * 1024 * 1024
+FRAME_DISK_BUDGET_BYTES = int(os.environ.get("PYBASEBALL_FRAME_DISK_MB", 1024)) * 1024 * 1024
+
+FRAME_KINDS = ("batting", "pitching", "standings")
+
+# Names PyBaseball's disk cache records each frame kind's upstream call under
+PYBASEBALL_CACHE_FUNCTIONS = {
+    "batting": "FangraphsBattingStatsTable.fetch",
+    "pitching": "FangraphsPitchingStatsTable.fetch",
+    "standings": "standings",
+}
+
+# Load locks are striped over a fixed array, so they do not grow with the
+# number of distinct seasons requested; unrelated keys rarely share a stripe
+FRAME_LOAD_LOCK_STRIPES = 64
+
+
+def _fetch_frame(kind: str, year: int, qual: int):
+    """Fetch a season frame from upstream via pybaseball."""
+    if kind == "batting":
+        with suppress_stdout(), upstream_call("batting_stats"):
+            return batting_stats(year, qual=qual)
+    if kind == "pitching":
+        with suppress_stdout(), upstream_call("pitching_stats"):
+            return pitching_stats(year, qual=qual)
+    if kind == "standings":
+        with suppress_stdout(), upstream_call("standings"):
+            return standings(year)
+    raise ValueError(f"Unknown frame kind: {kind}")
+
+
+def _load_frame(kind: str, year: int, qual: int):
+    """Load a season frame from the archive for completed seasons, else from upstream."""
+    if not is_completed_season(year, kind):
+        # PyBaseball would serve its copy for days; the expiry policy decided this one is stale
+        forget_pybaseball_records(PYBASEBALL_CACHE_FUNCTIONS[kind], lambda call: call.get("args", [])[:1] == [year])
+        return _fetch_frame(kind, year, qual)
+    try:
+        frame = read_archive(kind, year, qual)
+        if frame is not None:
+            return frame
+    except Exception as e:
+        logger.warning(f"Could not read archived {kind} {year}, fetching from upstream: {e}")
+    frame = _fetch_frame(kind, year, qual)
+    try:
+        write_archive(kind, year, frame, qual)
+    except Exception as e:
+        logger.warning(f"Could not archive {kind} {year}: {e}")
+    return frame
+
+
+class SeasonFrameStore:
+    """
+    Store of season frames keyed by (kind, year, qual), backed by a TieredCache.
+
+    Entries expire according to the expiry policy (the active policy from
+    pybaseball_mcp.expiry unless one is given), so completed seasons stay
+    cached and the current season follows the game-day schedule. Once the deep memory size of all
+    frames exceeds ``memory_budget_bytes`` the least recently used frames are
+    demoted to disk (when ``disk_dir`` is set) or dropped.
+    Frames are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, policy: ExpiryPolicy = None, memory_budget_bytes: int = FRAME_MEMORY_BUDGET_BYTES,
+                 disk_dir=None, disk_budget_bytes: int = 0):
+        self.policy = policy
+        self._cache = TieredCache("season_frames", memory_budget_bytes, disk_dir, disk_budget_bytes)
+        self._load_locks = tuple(threading.Lock() for _ in range(FRAME_LOAD_LOCK_STRIPES))
+
+    def get(self, kind: str, year: int, qual: int = 1):
+        """
+        Get a season frame, fetching it from upstream on a miss.
+
+        Args:
+            kind: "batting", "pitching" or "standings"
+            year: Season year
+            qual: Minimum plate appearances / innings qualifier (None for standings)
+
+        Returns:
+            Shared pandas DataFrame for the season (a list of division
+            DataFrames for standings)
+        """
+        if kind not in FRAME_KINDS:
+            raise ValueError(f"Unknown frame kind: {kind}")
+        key = (kind, year, qual)
+
+        with span("fetch.frame", phase="fetch", kind=kind, year=year) as fetch:
+            frame = self._cache.get(key)
+            if frame is not None:
+                fetch.set("cache", "hit")
+                return frame
+
+            with self._load_lock(key):
+                frame = self._cache.get(key, record_stats=False)
+                if frame is not None:
+                    fetch.set("cache", "coalesced")
+                    return frame
+                fetch.set("cache", "miss")
+                return self._load(key)
+
+    def refresh(self, kind: str, year: int, qual: int = 1, ahead: float = 0) -> bool:
+        """
+        Reload a season frame if it is missing or expires within ``ahead`` seconds.
+
+        Readers keep getting the current frame until the new one replaces it,
+        so a refresh ahead of expiry means no request waits on upstream.
+
+        Returns:
+            True if the frame was reloaded
+        """
+        if kind not in FRAME_KINDS:
+            raise ValueError(f"Unknown frame kind: {kind}")
+        key = (kind, year, qual)
+        remaining = self._cache.remaining_ttl(key)
+        if remaining is not None and remaining > ahead:
+            return False
+        with self._load_lock(key):
+            remaining = self._cache.remaining_ttl(key)
+            if remaining is not None and remaining > ahead:
+                return False
+            self._load(key)
+            return True
+
+    def _load_lock(self, key: tuple) -> threading.Lock:
+        # Only one thread loads a given key; the others wait and reuse its frame
+        return self._load_locks[hash(key) % len(self._load_locks)]
+
+    def _load(self, key: tuple):
+        kind, year, qual = key
+        logger.info(f"Loading {kind} frame for {year} (qual={qual})")
+        frame = _load_frame(kind, year, qual)
+        if kind != "standings":
+            # Leaderboards slice these orders and team stats look up these
+            # aggregates instead of scanning the frame per call
+            rank_index(frame).prebuild(frame)
+            team_table(frame, kind)
+        policy = self.policy or get_expiry_policy()
+        self._cache.set(key, frame, ttl=policy.ttl(kind, year=year))
+        return frame
+
+    def clear(self):
+        """Drop every cached frame."""
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        """Get hit/miss counters and memory usage of the store."""
+        return {**self._cache.stats(), "expiry_policy": type(self.policy or get_expiry_policy()).__name__}
+
+
+# Shared store used by every tool
+season_frames = SeasonFrameStore(
+    disk_dir=MCP_DATA_DIR / "cache" / "frames",
+    disk_budget_bytes=FRAME_DISK_BUDGET_BYTES
+)
+
+
+def get_batting_frame(year: int, qual: int = 1):
+    """Get the shared FanGraphs batting frame for a season."""
+    return season_frames.get("batting", year, qual)
+
+
+def get_pitching_frame(year: int, qual: int = 1):
+    """Get the shared FanGraphs pitching frame for a season."""
+    return season_frames.get("pitching", year, qual)
+
+
+def get_standings_frames(year: int):
+    """Get the shared Baseball-Reference division standings frames for a season."""
+    return season_frames.get("standings", year, None)
@@ -0,0 +1,140 @@
+"""
+Statcast aggregation kernels for PyBaseball MCP Server.
+Batting and pitching summaries are computed in a single pass over NumPy
+arrays: categorical columns are factorized once and counted with one
+bincount per column, speeds are reduced with bincount/ufunc.at. Every
+kernel works on one player's pitches or on a multi-player frame grouped
+by a key column.
+"""
+import numpy as np
+import pandas as pd
+
+HIT_EVENTS = ("single", "double", "triple", "home_run")
+
+
+def _group_codes(frame: pd.DataFrame, by: str = None):
+    """Get a group index per row and the group labels (a single None group when by is None)."""
+    if by is None:
+        return np.zeros(len(frame), dtype=np.intp), [None]
+    codes, labels = pd.factorize(frame[by], sort=True)
+    return codes.astype(np.intp, copy=False), list(labels)
+
+
+def value_counts(values, codes: np.ndarray, n_groups: int):
+    """
+    Count each distinct value per group in one pass.
+
+    Args:
+        values: Column values (missing values are counted separately)
+        codes: Group index of each row
+        n_groups: Number of groups
+
+    Returns:
+        Tuple of (counts, labels): counts has shape (n_groups, len(labels) + 1)
+        with column 0 holding missing values and column i + 1 holding labels[i]
+    """
+    value_codes, labels = pd.factorize(values)
+    width = len(labels) + 1
+    counts = np.bincount(codes * width + (value_codes + 1), minlength=n_groups * width)
+    return counts.reshape(n_groups, width), list(labels)
+
+
+def _label_count(counts: np.ndarray, labels: list, wanted) -> np.ndarray:
+    columns = [labels.index(label) + 1 for label in wanted if label in labels]
+    return counts[:, columns].sum(axis=1) if columns else np.zeros(counts.shape[0], dtype=np.int64)
+
+
+def speed_stats(values, codes: np.ndarray, n_groups: int):
+    """
+    Reduce a speed column to per-group max and mean, ignoring missing values.
+
+    Returns:
+        Tuple of (max, mean) float arrays; NaN where a group has no values
+    """
+    values = np.asarray(values, dtype=np.float64)
+    valid = ~np.isnan(values)
+    group, values = codes[valid], values[valid]
+    counts = np.bincount(group, minlength=n_groups)
+    sums = np.bincount(group, weights=values, minlength=n_groups)
+    maxima = np.full(n_groups, -np.inf)
+    np.maximum.at(maxima, group, values)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / counts
+    maxima[counts == 0] = np.nan
+    return maxima, means
+
+
+def _rounded(value: float, digits: int = 1):
+    return None if np.isnan(value) else round(float(value), digits)
+
+
+def _speed_columns(frame: pd.DataFrame, column: str, codes: np.ndarray, n_groups: int):
+    if column not in frame:
+        return [None] * n_groups, [None] * n_groups
+    maxima, means = speed_stats(frame[column].to_numpy(dtype=np.float64, na_value=np.nan), codes, n_groups)
+    return [_rounded(v) for v in maxima], [_rounded(v) for v in means]
+
+
+def _collect(labels: list, rows: list, by: str):
+    return rows[0] if by is None else dict(zip(labels, rows))
+
+
+def batting_summary(frame: pd.DataFrame, by: str = None):
+    """
+    Summarize pitches as a batter.
+
+    Args:
+        frame: Statcast pitches with an ``events`` column
+        by: Column to group by (e.g. "batter"), or None for a single summary
+
+    Returns:
+        Summary dict, or a dict of summaries keyed by group when ``by`` is set
+    """
+    codes, labels = _group_codes(frame, by)
+    n_groups = len(labels)
+    counts, events = value_counts(frame["events"].to_numpy(), codes, n_groups)
+    at_bats = counts.sum(axis=1) - counts[:, 0]
+    hits = _label_count(counts, events, HIT_EVENTS)
+    home_runs = _label_count(counts, events, ("home_run",))
+    max_ev, avg_ev = _speed_columns(frame, "launch_speed", codes, n_groups)
+    rows = [
+        {
+            "at_bats": int(at_bats[i]),
+            "hits": int(hits[i]),
+            "avg": round(int(hits[i]) / int(at_bats[i]), 3) if at_bats[i] > 0 else 0,
+            "home_runs": int(home_runs[i]),
+            "max_exit_velocity": max_ev[i],
+            "avg_exit_velocity": avg_ev[i],
+        }
+        for i in range(n_groups)
+    ]
+    return _collect(labels, rows, by)
+
+
+def pitching_summary(frame: pd.DataFrame, by: str = None):
+    """
+    Summarize pitches as a pitcher.
+
+    Args:
+        frame: Statcast pitches with a ``type`` column (B/S/X)
+        by: Column to group by (e.g. "pitcher"), or None for a single summary
+
+    Returns:
+        Summary dict, or a dict of summaries keyed by group when ``by`` is set
+    """
+    codes, labels = _group_codes(frame, by)
+    n_groups = len(labels)
+    counts, types = value_counts(frame["type"].to_numpy(), codes, n_groups)
+    pitches = counts.sum(axis=1)
+    strikes = _label_count(counts, types, ("S",))
+    max_velo, avg_velo = _speed_columns(frame, "release_speed", codes, n_groups)
+    rows = [
+        {
+            "pitches_thrown": int(pitches[i]),
+            "avg_velocity": avg_velo[i],
+            "max_velocity": max_velo[i],
+            "strike_percentage": round(int(strikes[i]) / int(pitches[i]) * 100, 1) if pitches[i] > 0 else 0,
+        }
+        for i in range(n_groups)
+    ]
+    return _collect(labels, rows, by)
@@ -0,0 +1,37 @@
+"""
+Lazy loading for PyBaseball MCP Server.
+The tool modules pull in pybaseball and pandas, which take seconds to import.
+The server refers to tool functions through stand-ins that import their
+module on first call, so `initialize` and `tools/list` are answered before
+any of that work happens.
+"""
+import importlib
+from importlib import metadata
+
+
+def lazy_function(module: str, name: str):
+    """
+    Get a stand-in for ``module.name`` that imports the module on first call.
+
+    Args:
+        module: Absolute module path (e.g. "pybaseball_mcp.players")
+        name: Function name in that module
+
+    Returns:
+        Callable forwarding every call to the real function
+    """
+    def call(*args, **kwargs):
+        return getattr(importlib.import_module(module), name)(*args, **kwargs)
+
+    call.__name__ = call.__qualname__ = name
+    call.__module__ = module
+    call.__doc__ = f"Lazily imported {module}.{name}."
+    return call
+
+
+def package_version(package: str) -> str:
+    """Get an installed package's version without importing it."""
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return "unknown"
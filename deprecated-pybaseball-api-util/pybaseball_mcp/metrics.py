@@ -0,0 +1,361 @@
+"""
+Metrics for PyBaseball MCP Server.
+Counters, gauges and histograms rendered in the Prometheus text exposition
+format: per-tool latency, in-flight calls, outcomes and timeouts, upstream
+pybaseball fetch durations by function, and hit/miss/eviction counters of
+every tiered cache. The HTTP transport serves them on /metrics; STDIO mode
+writes them to a file on an interval.
+"""
+import asyncio
+import logging
+import math
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from .cache import live_caches
+from .tracing import span
+from .utils import MCP_DATA_DIR
+
+logger = logging.getLogger(__name__)
+
+# File STDIO mode writes metrics to (empty to disable), and seconds between writes
+METRICS_FILE = os.environ.get("PYBASEBALL_MCP_METRICS_FILE", str(MCP_DATA_DIR / "metrics.prom"))
+METRICS_DUMP_INTERVAL_SECONDS = float(os.environ.get("PYBASEBALL_MCP_METRICS_INTERVAL", 15))
+
+# Histogram bucket upper bounds in seconds
+TOOL_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60)
+UPSTREAM_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+class _Metric:
+    """Base of the metric types: a name, help text, label names and a lock."""
+
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> tuple:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> List[Tuple[str, tuple, tuple, float]]:
+        """(name suffix, extra label names, label values, value) of every sample."""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+        for suffix, extra_names, values, value in self.samples():
+            labels = _format_labels(self.labelnames + extra_names, values)
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing count per label set."""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        with self._lock:
+            return [("", (), key, value) for key, value in sorted(self._values.items())]
+
+
+class Gauge(_Metric):
+    """Value per label set that can go up and down."""
+
+    type = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        with self._lock:
+            return [("", (), key, value) for key, value in sorted(self._values.items())]
+
+
+class Histogram(_Metric):
+    """Cumulative bucket counts, sum and count of observations per label set."""
+
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = TOOL_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._series = {}  # label values -> [per-bucket counts, sum, count]
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][i] += 1
+                    break
+            series[1] += value
+            series[2] += 1
+
+    def count(self, **labels) -> int:
+        series = self._series.get(self._key(labels))
+        return series[2] if series else 0
+
+    def samples(self):
+        samples = []
+        with self._lock:
+            for key, (counts, total, count) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, counts):
+                    cumulative += bucket_count
+                    samples.append(("_bucket", ("le",), key + (_format_value(bound),), cumulative))
+                samples.append(("_sum", (), key, total))
+                samples.append(("_count", (), key, count))
+        return samples
+
+
+class CallbackMetric(_Metric):
+    """Counter or gauge whose values are read from existing state when rendered."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str],
+                 read: Callable[[], Dict[tuple, float]], type: str = "counter"):
+        super().__init__(name, documentation, labelnames)
+        self.read = read
+        self.type = type
+
+    def samples(self):
+        return [("", (), key, value) for key, value in sorted(self.read().items())]
+
+
+class MetricsRegistry:
+    """Ordered collection of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def __iter__(self) -> Iterable[_Metric]:
+        return iter(self._metrics)
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format (version 0.0.4)."""
+        lines = []
+        for metric in self._metrics:
+            try:
+                lines.extend(metric.render())
+            except Exception as e:
+                logger.warning(f"Could not collect metric {metric.name}: {e}")
+        return "\n".join(lines) + "\n"
+
+
+# --- Server metrics ---
+
+registry = MetricsRegistry()
+
+TOOL_CALLS = registry.register(Counter(
+    "pybaseball_mcp_tool_calls_total", "Tool calls by outcome (ok, error, invalid, timeout, exception).", ("tool", "outcome")))
+TOOL_DURATION = registry.register(Histogram(
+    "pybaseball_mcp_tool_duration_seconds", "Tool call latency in seconds.", ("tool",), TOOL_BUCKETS))
+TOOL_IN_FLIGHT = registry.register(Gauge(
+    "pybaseball_mcp_tool_in_flight", "Tool calls currently running.", ("tool",)))
+TOOL_TIMEOUTS = registry.register(Counter(
+    "pybaseball_mcp_tool_timeouts_total", "Tool calls abandoned after their timeout.", ("tool",)))
+UPSTREAM_DURATION = registry.register(Histogram(
+    "pybaseball_mcp_upstream_duration_seconds", "Upstream pybaseball fetch latency in seconds.",
+    ("function",), UPSTREAM_BUCKETS))
+UPSTREAM_ERRORS = registry.register(Counter(
+    "pybaseball_mcp_upstream_errors_total", "Upstream pybaseball fetches that raised.", ("function",)))
+
+
+def _cache_counters(*attributes: Tuple[str, str]) -> Callable[[], Dict[tuple, float]]:
+    """Read counter attributes of every live cache, summed per cache name and label."""
+    def read():
+        values = {}
+        for cache in live_caches():
+            for label, attribute in attributes:
+                key = (cache.name, label) if label else (cache.name,)
+                values[key] = values.get(key, 0) + getattr(cache, attribute)
+        return values
+    return read
+
+
+registry.register(CallbackMetric(
+    "pybaseball_mcp_cache_hits_total", "Cache hits by tier.", ("cache", "tier"),
+    _cache_counters(("memory", "hits"), ("disk", "disk_hits"))))
+registry.register(CallbackMetric(
+    "pybaseball_mcp_cache_misses_total", "Cache misses.", ("cache",),
+    _cache_counters(("", "misses"))))
+registry.register(CallbackMetric(
+    "pybaseball_mcp_cache_evictions_total", "Entries evicted from a cache tier to stay under its budget.",
+    ("cache", "tier"), _cache_counters(("memory", "evictions"), ("disk", "disk_evictions"))))
+registry.register(CallbackMetric(
+    "pybaseball_mcp_cache_memory_bytes", "Bytes held by the in-memory tier.", ("cache",),
+    _cache_counters(("", "memory_bytes")), type="gauge"))
+
+
+class track_tool:
+    """
+    Context manager recording one tool call.
+
+    Set ``outcome`` to "error" or "timeout" before leaving; exceptions are
+    recorded as "exception".
+    """
+
+    __slots__ = ("tool", "outcome", "_start")
+
+    def __init__(self, tool: str):
+        self.tool = tool
+        self.outcome = "ok"
+
+    def __enter__(self):
+        TOOL_IN_FLIGHT.inc(tool=self.tool)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        TOOL_DURATION.observe(time.perf_counter() - self._start, tool=self.tool)
+        TOOL_IN_FLIGHT.dec(tool=self.tool)
+        if exc_type is None:
+            outcome = self.outcome
+        elif issubclass(exc_type, asyncio.TimeoutError):
+            outcome = "timeout"
+        else:
+            outcome = "exception"
+        if outcome == "timeout":
+            TOOL_TIMEOUTS.inc(tool=self.tool)
+        TOOL_CALLS.inc(tool=self.tool, outcome=outcome)
+        return False
+
+
+class upstream_call:
+    """
+    Context manager timing one upstream pybaseball fetch (e.g. ``upstream_call("batting_stats")``).
+
+    The fetch is also traced as a span of the "fetch" phase.
+    """
+
+    __slots__ = ("function", "_start", "_span")
+
+    def __init__(self, function: str):
+        self.function = function
+
+    def __enter__(self):
+        self._span = span(f"upstream.{self.function}", phase="fetch", function=self.function).__enter__()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        UPSTREAM_DURATION.observe(time.perf_counter() - self._start, function=self.function)
+        if exc_type is not None:
+            UPSTREAM_ERRORS.inc(function=self.function)
+        return self._span.__exit__(exc_type, exc, tb)
+
+
+def render_metrics() -> str:
+    """Current metrics in the Prometheus text format."""
+    return registry.render()
+
+
+# --- STDIO file dump ---
+
+def write_metrics_file(path=None) -> Path:
+    """Write the current metrics to a file, replacing it atomically."""
+    path = Path(path or METRICS_FILE)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(render_metrics(), encoding="utf-8")
+    os.replace(tmp_path, path)
+    return path
+
+
+async def _dump_forever(path: str, interval: float):
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            write_metrics_file(path)
+        except OSError as e:
+            logger.warning(f"Could not write metrics to {path}: {e}")
+
+
+_dump_task = None
+
+
+def start_metrics_dump(path: str = None, interval: float = METRICS_DUMP_INTERVAL_SECONDS):
+    """Write metrics to a file every ``interval`` seconds (disable with PYBASEBALL_MCP_METRICS_FILE='')."""
+    global _dump_task
+    path = METRICS_FILE if path is None else path
+    if not path or (_dump_task is not None and not _dump_task.done()):
+        return None
+    _dump_task = asyncio.create_task(_dump_forever(path, interval), name="metrics-dump")
+    logger.info(f"Writing metrics to {path} every {interval:.0f}s")
+    return _dump_task
+
+
+async def stop_metrics_dump(path: str = None):
+    """Stop the periodic writes and write the final metrics."""
+    global _dump_task
+    if _dump_task is None:
+        return
+    _dump_task.cancel()
+    await asyncio.gather(_dump_task, return_exceptions=True)
+    _dump_task = None
+    path = METRICS_FILE if path is None else path
+    try:
+        write_metrics_file(path)
+    except OSError as e:
+        logger.warning(f"Could not write metrics to {path}: {e}")
@@ -3,42 +3,60 @@ Player statistics module for PyBaseball MCP Server.
 Handles fetching individual player stats from MLB data.
 """
 import pybaseball as pyb
-from pybaseball import playerid_lookup, batting_stats, pitching_stats, statcast_batter, statcast_pitcher
+from pybaseball import statcast_batter, statcast_pitcher
 import pandas as pd
-from datetime import datetime, timedelta
-import json
+from datetime import datetime, timedelta, timezone
 import logging
-import asyncio
-import concurrent.futures
-from functools import wraps
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
 # Import cache utilities
-from .utils import setup_cache, suppress_stdout
+from .utils import suppress_stdout
+from .frames import get_batting_frame, get_pitching_frame
+from .register import resolve_player
+from .search import search_players
+from .statcast_store import statcast_store
+from .kernels import batting_summary, pitching_summary
+from .records import FieldSpec, build_records
+from .encoding import dumps
+from .metrics import upstream_call
+from .tracing import span
 
-# Initialize cache
-setup_cache()
+# Fields of a player_stats result per FanGraphs frame kind
+SEASON_FIELDS = {
+    "batting": [
+        FieldSpec("G", "games", "int", default=0),
+        FieldSpec("AVG", "avg", "float", 3, default=0.0),
+        FieldSpec("OBP", "obp", "float", 3, default=0.0),
+        FieldSpec("SLG", "slg", "float", 3, default=0.0),
+        FieldSpec("OPS", "ops", "float", 3, default=0.0),
+        FieldSpec("HR", "hr", "int", default=0),
+        FieldSpec("RBI", "rbi", "int", default=0),
+        FieldSpec("R", "runs", "int", default=0),
+        FieldSpec("SB", "sb", "int", default=0),
+        FieldSpec("WAR", "war", "float", 1, default=0.0),
+    ],
+    "pitching": [
+        FieldSpec("G", "games", "int", default=0),
+        FieldSpec("GS", "games_started", "int", default=0),
+        FieldSpec("W", "wins", "int", default=0),
+        FieldSpec("L", "losses", "int", default=0),
+        FieldSpec("SV", "saves", "int", default=0),
+        FieldSpec("ERA", "era", "float", 2, default=0.0),
+        FieldSpec("WHIP", "whip", "float", 3, default=0.0),
+        FieldSpec("IP", "ip", "float", 1, default=0.0),
+        FieldSpec("SO", "so", "int", default=0),
+        FieldSpec("K/9", "k9", "float", 1, default=0.0),
+        FieldSpec("WAR", "war", "float", 1, default=0.0),
+    ],
+}
+
+
+def _season_result(player_name: str, year: int, kind: str, record: dict) -> dict:
+    """Format a built season record as a player_stats result."""
+    return {"player": player_name, "year": year, "type": kind, **record}
 
-# Timeout decorator for long-running operations
-def timeout_handler(timeout_seconds=30):
-    """Decorator to add timeout handling to functions"""
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            try:
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(func, *args, **kwargs)
-                    return future.result(timeout=timeout_seconds)
-            except concurrent.futures.TimeoutError:
-                logger.error(f"Function {func.__name__} timed out after {timeout_seconds} seconds")
-                return f"Error: Request timed out after {timeout_seconds} seconds. Please try again later."
-            except Exception as e:
-                logger.error(f"Error in {func.__name__}: {str(e)}")
-                return f"Error: {str(e)}"
-        return wrapper
-    return decorator
 
 def _get_player_stats_impl(player_name: str, year: int = None) -> str:
     """
@@ -55,86 +73,132 @@ def _get_player_stats_impl(player_name: str, year: int = None) -> str:
     if year is None:
         year = datetime.now().year
         
-    # Split name into first and last
+    # Require both first and last name
     name_parts = player_name.strip().split()
     if len(name_parts) < 2:
         return f"Error: Please provide both first and last name for '{player_name}'"
-        
-    first_name = name_parts[0]
-    last_name = " ".join(name_parts[1:])  # Handle names like "De La Cruz"
     
-    # Look up player ID
-    logger.info(f"Looking up player: {first_name} {last_name}")
-    with suppress_stdout():
-        player_lookup = playerid_lookup(last_name, first_name)
+    # Look up player ID (most recent player entry in case of multiple matches)
+    logger.info(f"Looking up player: {player_name}")
+    player_info = resolve_player(player_name)
     
-    if player_lookup.empty:
+    if player_info is None:
         return f"Player '{player_name}' not found in database"
-        
-    # Get the most recent player entry (in case of multiple matches)
-    player_info = player_lookup.iloc[0]
-    player_id = int(player_info['key_mlbam'])
     
-    # Try batting stats first
+    # Try batting stats first, then pitching; an upstream failure is an
+    # error, not "no stats", so it is never cached as the answer
     try:
-        with suppress_stdout():
-            batting_df = batting_stats(year, qual=1)
-        player_batting = batting_df[batting_df['IDfg'] == player_info['key_fangraphs']]
-        
-        if not player_batting.empty:
-            stats = player_batting.iloc[0]
-            return json.dumps({
-                "player": player_name,
-                "year": year,
-                "type": "batting",
-                "games": int(stats.get('G', 0)),
-                "avg": round(float(stats.get('AVG', 0)), 3),
-                "obp": round(float(stats.get('OBP', 0)), 3),
-                "slg": round(float(stats.get('SLG', 0)), 3),
-                "ops": round(float(stats.get('OPS', 0)), 3),
-                "hr": int(stats.get('HR', 0)),
-                "rbi": int(stats.get('RBI', 0)),
-                "runs": int(stats.get('R', 0)),
-                "sb": int(stats.get('SB', 0)),
-                "war": round(float(stats.get('WAR', 0)), 1)
-            }, indent=2)
+        for kind, get_frame in (("batting", get_batting_frame), ("pitching", get_pitching_frame)):
+            frame = get_frame(year)
+            with span("aggregate.player_row", phase="aggregate", kind=kind):
+                player_rows = frame[frame['IDfg'] == player_info.key_fangraphs]
+
+            if not player_rows.empty:
+                record = build_records(player_rows.head(1), SEASON_FIELDS[kind])[0]
+                with span("serialize.player_stats", phase="serialize"):
+                    return dumps(_season_result(player_name, year, kind, record))
     except Exception as e:
-        logger.debug(f"No batting stats found: {e}")
+        logger.error(f"Error fetching player stats: {str(e)}")
+        return f"Error retrieving stats for {player_name} in {year}: {str(e)}"
         
-    # Try pitching stats if no batting stats found
+    return f"No stats found for {player_name} in {year}"
+
+
+# Largest number of players accepted by one batch request
+MAX_BATCH_PLAYERS = 50
+
+
+def _join_season_frame(frame: pd.DataFrame, requests: pd.DataFrame, kind: str) -> dict:
+    """Join requested FanGraphs ids against a season frame; returns season records keyed by request position."""
+    rows = frame.drop_duplicates("IDfg").merge(requests, left_on="IDfg", right_on="key_fangraphs", how="inner")
+    return dict(zip(rows["position"].tolist(), build_records(rows, SEASON_FIELDS[kind])))
+
+
+def _get_players_stats_batch_impl(player_names: list, years=None) -> str:
+    """
+    Get season statistics for many players at once.
+    
+    Names are resolved together and each season's batting and pitching
+    frames are joined against all requested FanGraphs ids in one merge.
+    
+    Args:
+        player_names: Full names of the players
+        years: Season year for every player, or a list with one year per
+            player (defaults to current year)
+    
+    Returns:
+        JSON string with one result per requested player, in request order
+    """
     try:
-        with suppress_stdout():
-            pitching_df = pitching_stats(year, qual=1)
-        player_pitching = pitching_df[pitching_df['IDfg'] == player_info['key_fangraphs']]
-        
-        if not player_pitching.empty:
-            stats = player_pitching.iloc[0]
-            return json.dumps({
-                "player": player_name,
-                "year": year,
-                "type": "pitching",
-                "games": int(stats.get('G', 0)),
-                "games_started": int(stats.get('GS', 0)),
-                "wins": int(stats.get('W', 0)),
-                "losses": int(stats.get('L', 0)),
-                "saves": int(stats.get('SV', 0)),
-                "era": round(float(stats.get('ERA', 0)), 2),
-                "whip": round(float(stats.get('WHIP', 0)), 3),
-                "ip": round(float(stats.get('IP', 0)), 1),
-                "so": int(stats.get('SO', 0)),
-                "k9": round(float(stats.get('K/9', 0)), 1),
-                "war": round(float(stats.get('WAR', 0)), 1)
-            }, indent=2)
+        if not player_names:
+            return "Error: Please provide at least one player name"
+        if len(player_names) > MAX_BATCH_PLAYERS:
+            return f"Error: At most {MAX_BATCH_PLAYERS} players can be requested at once"
+        current_year = datetime.now().year
+        if isinstance(years, (list, tuple)):
+            if len(years) != len(player_names):
+                return "Error: Provide one year per player or a single year"
+            years = [year or current_year for year in years]
+        else:
+            years = [years or current_year] * len(player_names)
+
+        results = [None] * len(player_names)
+        requests = []
+        for position, (player_name, year) in enumerate(zip(player_names, years)):
+            if len(player_name.strip().split()) < 2:
+                results[position] = {"player": player_name, "error": "Please provide both first and last name"}
+                continue
+            player_info = resolve_player(player_name)
+            if player_info is None or player_info.key_fangraphs is None:
+                results[position] = {"player": player_name, "error": "Player not found in database"}
+                continue
+            requests.append((position, year, player_info.key_fangraphs))
+
+        requests = pd.DataFrame(requests, columns=["position", "year", "key_fangraphs"])
+        for year, year_requests in requests.groupby("year"):
+            year = int(year)
+            pending = year_requests
+            for kind, get_frame in (("batting", get_batting_frame), ("pitching", get_pitching_frame)):
+                if pending.empty:
+                    break
+                # Upstream failures fail the whole call rather than reading as "no stats"
+                matched = _join_season_frame(get_frame(year), pending, kind)
+                for position, record in matched.items():
+                    results[position] = _season_result(player_names[position], year, kind, record)
+                pending = pending[~pending["position"].isin(list(matched))]
+            for position in pending["position"]:
+                results[position] = {"player": player_names[position], "error": f"No stats found in {year}"}
+
+        with span("serialize.players_stats_batch", phase="serialize"):
+            return dumps({"count": len(results), "players": results})
     except Exception as e:
-        logger.debug(f"No pitching stats found: {e}")
-        
-    return f"No stats found for {player_name} in {year}"
+        logger.error(f"Error fetching batch player stats: {str(e)}")
+        return f"Error retrieving batch player stats: {str(e)}"
+
 
-# Wrapper function with timeout handling
-@timeout_handler(timeout_seconds=30)
-def get_player_stats(player_name: str, year: int = None) -> str:
-    """Get season statistics for a specific player with timeout handling."""
-    return _get_player_stats_impl(player_name, year)
+# Statcast columns the recent-performance summaries read
+RECENT_STATCAST_COLUMNS = ["game_date", "events", "launch_speed", "release_speed", "type"]
+
+
+def _recent_statcast(player_id: int, role: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+    """
+    Get a player's Statcast pitches for a date window as batter or pitcher.
+
+    Reads the league-wide daily partitions, falling back to the per-player
+    upstream query if the store is unavailable.
+    """
+    try:
+        return statcast_store.load(start_date.date(), end_date.date(), columns=RECENT_STATCAST_COLUMNS,
+                                   player_id=player_id, role=role)
+    except Exception as e:
+        logger.warning(f"Statcast store unavailable, querying {role} {player_id} directly: {e}")
+    fetch, function = (statcast_batter, "statcast_batter") if role == "batter" else (statcast_pitcher, "statcast_pitcher")
+    with suppress_stdout(), upstream_call(function):
+        return fetch(
+            start_dt=start_date.strftime('%Y-%m-%d'),
+            end_dt=end_date.strftime('%Y-%m-%d'),
+            player_id=player_id
+        )
 
 
 def _get_player_recent_stats_impl(player_name: str, days: int = 30) -> str:
@@ -149,77 +213,46 @@ def _get_player_recent_stats_impl(player_name: str, days: int = 30) -> str:
         JSON string with recent stats summary
     """
     try:
-        # Calculate date range
-        end_date = datetime.now()
+        # Calculate date range on the UTC calendar the Statcast store and expiry policy use
+        end_date = datetime.now(timezone.utc)
         start_date = end_date - timedelta(days=days)
         
-        # Split name
+        # Require both first and last name
         name_parts = player_name.strip().split()
         if len(name_parts) < 2:
             return f"Error: Please provide both first and last name"
-            
-        first_name = name_parts[0]
-        last_name = " ".join(name_parts[1:])
         
         # Look up player
-        with suppress_stdout():
-            player_lookup = playerid_lookup(last_name, first_name)
-        if player_lookup.empty:
+        player_info = resolve_player(player_name)
+        if player_info is None:
             return f"Player '{player_name}' not found"
             
-        player_info = player_lookup.iloc[0]
-        player_id = int(player_info['key_mlbam'])
+        player_id = player_info.key_mlbam
         
-        # Get statcast data for recent games
-        try:
-            # Try as a batter first
-            with suppress_stdout():
-                recent_data = statcast_batter(
-                    start_dt=start_date.strftime('%Y-%m-%d'),
-                    end_dt=end_date.strftime('%Y-%m-%d'),
-                    player_id=player_id
-                )
-            
-            if not recent_data.empty:
-                # Calculate batting stats
-                hits = len(recent_data[recent_data['events'].isin(['single', 'double', 'triple', 'home_run'])])
-                at_bats = len(recent_data[recent_data['events'].notna()])
-                avg = round(hits / at_bats, 3) if at_bats > 0 else 0
-                
-                home_runs = len(recent_data[recent_data['events'] == 'home_run'])
-                
-                return json.dumps({
+        # Try as a batter first, then as a pitcher
+        recent_data = _recent_statcast(player_id, "batter", start_date, end_date)
+        if not recent_data.empty:
+            with span("aggregate.statcast_summary", phase="aggregate", role="batter"):
+                summary = batting_summary(recent_data)
+            with span("serialize.player_recent_performance", phase="serialize"):
+                return dumps({
                     "player": player_name,
                     "period": f"Last {days} days",
                     "type": "batting",
-                    "at_bats": at_bats,
-                    "hits": hits,
-                    "avg": avg,
-                    "home_runs": home_runs,
-                    "max_exit_velocity": round(recent_data['launch_speed'].max(), 1) if 'launch_speed' in recent_data else None,
-                    "avg_exit_velocity": round(recent_data['launch_speed'].mean(), 1) if 'launch_speed' in recent_data else None
-                }, indent=2)
-                
-        except:
-            # Try as pitcher
-            with suppress_stdout():
-                recent_data = statcast_pitcher(
-                    start_dt=start_date.strftime('%Y-%m-%d'),
-                    end_dt=end_date.strftime('%Y-%m-%d'),
-                    player_id=player_id
-                )
-            
-            if not recent_data.empty:
-                # Calculate pitching stats
-                return json.dumps({
+                    **summary
+                })
+        
+        recent_data = _recent_statcast(player_id, "pitcher", start_date, end_date)
+        if not recent_data.empty:
+            with span("aggregate.statcast_summary", phase="aggregate", role="pitcher"):
+                summary = pitching_summary(recent_data)
+            with span("serialize.player_recent_performance", phase="serialize"):
+                return dumps({
                     "player": player_name,
                     "period": f"Last {days} days",
                     "type": "pitching",
-                    "pitches_thrown": len(recent_data),
-                    "avg_velocity": round(recent_data['release_speed'].mean(), 1) if 'release_speed' in recent_data else None,
-                    "max_velocity": round(recent_data['release_speed'].max(), 1) if 'release_speed' in recent_data else None,
-                    "strike_percentage": round(len(recent_data[recent_data['type'] == 'S']) / len(recent_data) * 100, 1) if len(recent_data) > 0 else 0
-                }, indent=2)
+                    **summary
+                })
                 
         return f"No recent data found for {player_name}"
         
@@ -227,16 +260,32 @@ def _get_player_recent_stats_impl(player_name: str, days: int = 30) -> str:
         logger.error(f"Error fetching recent stats: {str(e)}")
         return f"Error retrieving recent stats: {str(e)}"
 
-@timeout_handler(timeout_seconds=20)        
-def get_player_recent_stats(player_name: str, days: int = 30) -> str:
-    """Get recent game statistics for a player with timeout handling."""
-    return _get_player_recent_stats_impl(player_name, days)
+
+# Fields of a fallback search result
+SEARCH_FIELDS = [FieldSpec("Name", "name"), FieldSpec("Team", "team", default="Unknown")]
+
+
+def _search_current_batters(search_term: str) -> list:
+    """Fallback search over the current season's batters when the register is unavailable."""
+    current_year = datetime.now().year
+    batting_df = get_batting_frame(current_year)
+    
+    # Search for matches in player names
+    matches = batting_df[batting_df['Name'].str.contains(search_term, case=False, na=False)]
+    
+    return [
+        {**record, "position": "Batter", "stats_available": True}
+        for record in build_records(matches.head(10), SEARCH_FIELDS)
+    ]
 
 
 def _search_player_impl(search_term: str) -> str:
     """
     Search for players by partial name match.
     
+    Searches the full player register (batters, pitchers and historical
+    players) by prefix, substring and misspelled names, most recent players first.
+    
     Args:
         search_term: Partial name to search for
         
@@ -244,37 +293,28 @@ def _search_player_impl(search_term: str) -> str:
         JSON string with list of matching players
     """
     try:
-        # Try to find players with the search term
-        # PyBaseball doesn't have a direct search, so we'll be creative
-        results = []
-        
-        # Search in recent batting stats
-        current_year = datetime.now().year
-        with suppress_stdout():
-            batting_df = batting_stats(current_year, qual=1)
-        
-        # Search for matches in player names
-        matches = batting_df[batting_df['Name'].str.contains(search_term, case=False, na=False)]
-        
-        for _, player in matches.head(10).iterrows():
-            results.append({
-                "name": player['Name'],
-                "team": player.get('Team', 'Unknown'),
-                "position": "Batter",
-                "stats_available": True
-            })
+        try:
+            matches = search_players(search_term, limit=10)
+        except Exception as e:
+            logger.warning(f"Player search index unavailable, scanning current batters: {e}")
+            results = _search_current_batters(search_term)
+        else:
+            results = [{
+                "name": match.player.name,
+                "mlb_played_first": match.player.mlb_played_first,
+                "mlb_played_last": match.player.mlb_played_last,
+                "key_mlbam": match.player.key_mlbam,
+                "key_fangraphs": match.player.key_fangraphs,
+                "match": match.match
+            } for match in matches]
             
-        return json.dumps({
-            "search_term": search_term,
-            "results": results,
-            "count": len(results)
-        }, indent=2)
+        with span("serialize.search_players", phase="serialize"):
+            return dumps({
+                "search_term": search_term,
+                "results": results,
+                "count": len(results)
+            })
         
     except Exception as e:
         logger.error(f"Error searching for players: {str(e)}")
         return f"Error searching: {str(e)}"
-
-@timeout_handler(timeout_seconds=15)
-def search_player(search_term: str) -> str:
-    """Search for players by partial name match with timeout handling."""
-    return _search_player_impl(search_term)
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""
+Rank indexes for PyBaseball MCP Server.
+Season frames only change when they are reloaded, so the sort order of each
+stat column is computed once per frame and reused: a leaderboard query is a
+slice of the first top_n positions instead of a full sort.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+from .derived import derived
+
+# Pitching stats where a lower value ranks first
+LOWER_IS_BETTER = frozenset({"ERA", "WHIP", "BB/9"})
+
+
+def default_ascending(column: str) -> bool:
+    """Get the natural ranking direction of a stat column."""
+    return column in LOWER_IS_BETTER
+
+
+def _sort_key(values: np.ndarray, ascending: bool) -> np.ndarray:
+    # Negating keeps NaN as NaN, so missing values sort last in both directions
+    return values if ascending else -values
+
+
+class RankIndex:
+    """
+    Sorted row positions of a frame's columns, built once and reused.
+
+    The index does not keep the frame alive; pass the frame to top().
+    Orders match ``sort_values(kind="stable", na_position="last")``.
+    """
+
+    def __init__(self):
+        self._orders = {}
+        self._lock = threading.Lock()
+
+    def prebuild(self, frame: pd.DataFrame):
+        """Build the order of every numeric column in its natural direction in one pass."""
+        numeric = [column for column in frame.columns
+                   if pd.api.types.is_numeric_dtype(frame[column]) and not pd.api.types.is_bool_dtype(frame[column])]
+        if not numeric:
+            return
+        values = frame[numeric].to_numpy(dtype=np.float64, na_value=np.nan)
+        ascending = np.array([default_ascending(column) for column in numeric])
+        keys = np.where(ascending, values, -values)
+        orders = np.argsort(keys, axis=0, kind="stable")
+        with self._lock:
+            for i, column in enumerate(numeric):
+                self._orders[(column, bool(ascending[i]))] = np.ascontiguousarray(orders[:, i])
+
+    def order(self, frame: pd.DataFrame, column: str, ascending: bool = None) -> np.ndarray:
+        """Get the row positions of ``frame`` sorted by a column."""
+        if ascending is None:
+            ascending = default_ascending(column)
+        key = (column, ascending)
+        order = self._orders.get(key)
+        if order is None:
+            series = frame[column]
+            if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+                values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+                order = np.argsort(_sort_key(values, ascending), kind="stable")
+            else:
+                ranked = series.reset_index(drop=True).sort_values(ascending=ascending, kind="stable", na_position="last")
+                order = ranked.index.to_numpy()
+            with self._lock:
+                self._orders[key] = order
+        return order
+
+    def top(self, frame: pd.DataFrame, column: str, n: int, ascending: bool = None) -> pd.DataFrame:
+        """Get the first ``n`` rows of ``frame`` ranked by a column."""
+        return frame.iloc[self.order(frame, column, ascending)[:max(n, 0)]]
+
+
+def rank_index(frame: pd.DataFrame) -> RankIndex:
+    """
+    Get the rank index of a frame, creating it on first use.
+
+    Indexes live as long as their frame: a refreshed season frame is a new
+    object and gets a fresh index.
+    """
+    return derived(frame, "rank_index", RankIndex)
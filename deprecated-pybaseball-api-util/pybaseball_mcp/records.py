@@ -0,0 +1,76 @@
+"""
+Columnar response building for PyBaseball MCP Server.
+Tools declare the fields of their result rows once; build_records() then
+converts whole columns with NumPy and zips them into row dicts, instead of
+boxing every DataFrame row into a Series with iterrows().
+"""
+from typing import Any, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .tracing import span
+
+
+class FieldSpec(NamedTuple):
+    """
+    One field of a result row.
+
+    Args:
+        column: Source column in the frame
+        name: Output key (defaults to the column name)
+        cast: "int", "float", "str" or None to pass values through
+        digits: Decimal places to round floats to
+        default: Value used for missing and NaN values, and for every row
+            when the column is absent
+    """
+    column: str
+    name: Optional[str] = None
+    cast: Optional[str] = None
+    digits: Optional[int] = None
+    default: Any = None
+
+
+def _column_values(frame: pd.DataFrame, field: FieldSpec) -> list:
+    """Convert one column to a list of output values in a single vectorized pass."""
+    if field.column not in frame.columns:
+        return [field.default] * len(frame)
+    series = frame[field.column]
+
+    if field.cast in ("int", "float"):
+        values = pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+        missing = np.isnan(values)
+        if field.cast == "int":
+            values = np.where(missing, 0, values).astype(np.int64)
+        elif field.digits is not None:
+            values = np.round(values, field.digits)
+    else:
+        values = series.to_numpy(dtype=object)
+        missing = pd.isna(values)
+        if field.cast == "str":
+            values = values.astype(str)
+
+    values = values.tolist()
+    if missing.any():
+        for position in np.flatnonzero(missing).tolist():
+            values[position] = field.default
+    return values
+
+
+def build_records(frame: pd.DataFrame, fields: Sequence[FieldSpec]) -> List[dict]:
+    """
+    Build result rows from a frame.
+
+    Args:
+        frame: Source rows
+        fields: Output fields, in key order
+
+    Returns:
+        One dict per frame row with plain Python values
+    """
+    with span("aggregate.records", phase="aggregate", rows=len(frame)):
+        names = [field.name or field.column for field in fields]
+        columns = [_column_values(frame, field) for field in fields]
+        if not columns:
+            return [{} for _ in range(len(frame))]
+        return [dict(zip(names, row)) for row in zip(*columns)]
@@ -0,0 +1,247 @@
+"""
+Player register index for PyBaseball MCP Server.
+Resolves player names to MLBAM, FanGraphs and Baseball-Reference IDs with
+hash lookups over a prebuilt copy of the Chadwick register.
+"""
+import logging
+import os
+import re
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from pybaseball import chadwick_register, playerid_lookup
+
+from .metrics import upstream_call
+from .tracing import span
+from .utils import MCP_DATA_DIR, suppress_stdout
+
+logger = logging.getLogger(__name__)
+
+REGISTER_FILE = MCP_DATA_DIR / "player_register.feather"
+REGISTER_MAX_AGE_SECONDS = 7 * 86400  # Rebuild weekly to pick up debuts
+
+REGISTER_COLUMNS = [
+    "name_first", "name_last", "key_mlbam", "key_fangraphs", "key_bbref",
+    "mlb_played_first", "mlb_played_last",
+]
+
+_NAME_SUFFIXES = {"jr", "sr", "ii", "iii", "iv"}
+_PUNCTUATION = re.compile(r"[.'`’]")
+_SEPARATORS = re.compile(r"[\s\-_,]+")
+
+
+class PlayerEntry(NamedTuple):
+    name: str
+    key_mlbam: int
+    key_fangraphs: int
+    key_bbref: Optional[str]
+    mlb_played_first: Optional[int]
+    mlb_played_last: Optional[int]
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a player name for lookups.
+
+    Accents are folded, case is folded, punctuation is dropped and generational
+    suffixes are removed, so "Ronald Acuña Jr." becomes "ronald acuna".
+    """
+    folded = unicodedata.normalize("NFKD", name)
+    folded = "".join(ch for ch in folded if not unicodedata.combining(ch)).casefold()
+    parts = _SEPARATORS.split(_PUNCTUATION.sub("", folded).strip())
+    while len(parts) > 1 and parts[-1] in _NAME_SUFFIXES:
+        parts.pop()
+    return " ".join(part for part in parts if part)
+
+
+def _optional_year(value) -> Optional[int]:
+    return None if value is None or value != value else int(value)
+
+
+def _optional_text(value) -> Optional[str]:
+    return None if value is None or value != value or value == "" else str(value)
+
+
+def _recency(entry: PlayerEntry):
+    # Prefer players with an MLBAM id, then the most recent career
+    return (entry.key_mlbam != -1, entry.mlb_played_last or 0, entry.mlb_played_first or 0)
+
+
+def build_register_file(path: Path = REGISTER_FILE) -> Path:
+    """Download the Chadwick register and write the compact index file."""
+    from pyarrow import feather
+
+    with suppress_stdout(), upstream_call("chadwick_register"):
+        table = chadwick_register()
+    table = table.loc[:, REGISTER_COLUMNS].reset_index(drop=True)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    # Uncompressed Arrow IPC so the file can be memory-mapped on load
+    feather.write_feather(table, tmp_path, compression="uncompressed")
+    os.replace(tmp_path, path)
+    logger.info(f"Player register written to {path} ({len(table)} players)")
+    return path
+
+
+class PlayerRegister:
+    """
+    Hash index over the Chadwick register.
+
+    Entries are built once when the register is loaded; lookups are a name
+    normalization plus one or two dict probes.
+    """
+
+    def __init__(self, path: Path = REGISTER_FILE):
+        self.path = Path(path)
+        self.entries = ()
+        self._by_name = {}
+        self._by_compact_name = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def load(self):
+        """Load the register index, building the file first if missing or stale."""
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            if self._is_stale():
+                try:
+                    build_register_file(self.path)
+                except Exception as e:
+                    if not self.path.exists():
+                        raise
+                    logger.warning(f"Could not refresh player register, using existing file: {e}")
+            self._read()
+
+    def refresh(self) -> bool:
+        """
+        Load the register, or rebuild and re-index it once its file is stale.
+
+        Lookups keep using the current index while the file is rebuilt.
+
+        Returns:
+            True if the register was (re)loaded
+        """
+        if not self._loaded:
+            self.load()
+            return True
+        if not self._is_stale():
+            return False
+        with self._lock:
+            if not self._is_stale():
+                return False
+            build_register_file(self.path)
+            self._read()
+            return True
+
+    def clear(self):
+        """Delete the register file so the next lookup downloads and re-indexes it."""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
+            self._loaded = False
+
+    def _is_stale(self) -> bool:
+        return not self.path.exists() or time.time() - self.path.stat().st_mtime > REGISTER_MAX_AGE_SECONDS
+
+    def _read(self):
+        from pyarrow import feather
+
+        start = time.perf_counter()
+        table = feather.read_table(self.path, memory_map=True)
+        self._index(table.to_pydict())
+        self._loaded = True
+        logger.info(f"Player register loaded: {len(self.entries)} players in {time.perf_counter() - start:.2f}s")
+
+    def _index(self, columns: dict):
+        entries = []
+        by_name = {}
+        by_compact_name = {}
+        rows = zip(*(columns[col] for col in REGISTER_COLUMNS))
+        for first, last, mlbam, fangraphs, bbref, played_first, played_last in rows:
+            if not last:
+                continue
+            name = f"{first} {last}" if first else last
+            entry = PlayerEntry(
+                name=name,
+                key_mlbam=int(mlbam),
+                key_fangraphs=int(fangraphs),
+                key_bbref=_optional_text(bbref),
+                mlb_played_first=_optional_year(played_first),
+                mlb_played_last=_optional_year(played_last),
+            )
+            entries.append(entry)
+            key = normalize_name(name)
+            by_name.setdefault(key, []).append(entry)
+            by_compact_name.setdefault(key.replace(" ", ""), []).append(entry)
+        self.entries = tuple(entries)
+        self._by_name = {key: tuple(sorted(group, key=_recency, reverse=True)) for key, group in by_name.items()}
+        self._by_compact_name = {key: tuple(sorted(group, key=_recency, reverse=True)) for key, group in by_compact_name.items()}
+
+    def lookup_all(self, player_name: str) -> tuple:
+        """Get every entry matching a name, most recent career first."""
+        self.load()
+        key = normalize_name(player_name)
+        matches = self._by_name.get(key)
+        if matches is None:
+            # "J.D. Martinez" is "J. D. Martinez" in the register
+            matches = self._by_compact_name.get(key.replace(" ", ""), ())
+        return matches
+
+    def lookup(self, player_name: str) -> Optional[PlayerEntry]:
+        """Get the best entry for a name, or None if it is not in the register."""
+        matches = self.lookup_all(player_name)
+        return matches[0] if matches else None
+
+
+# Shared register used by every tool
+player_register = PlayerRegister()
+
+
+def _lookup_upstream(player_name: str) -> Optional[PlayerEntry]:
+    name_parts = player_name.strip().split()
+    first_name = name_parts[0]
+    last_name = " ".join(name_parts[1:])  # Handle names like "De La Cruz"
+    with suppress_stdout(), upstream_call("playerid_lookup"):
+        player_lookup = playerid_lookup(last_name, first_name)
+    if player_lookup.empty:
+        return None
+    row = player_lookup.iloc[0]
+    return PlayerEntry(
+        name=player_name,
+        key_mlbam=int(row["key_mlbam"]),
+        key_fangraphs=int(row["key_fangraphs"]),
+        key_bbref=_optional_text(row.get("key_bbref")),
+        mlb_played_first=_optional_year(row.get("mlb_played_first")),
+        mlb_played_last=_optional_year(row.get("mlb_played_last")),
+    )
+
+
+def resolve_player(player_name: str) -> Optional[PlayerEntry]:
+    """
+    Resolve a player name to its register entry.
+
+    Uses the prebuilt index, falling back to pybaseball's playerid_lookup if
+    the register cannot be loaded.
+
+    Args:
+        player_name: Full name of the player (e.g., "Shohei Ohtani")
+
+    Returns:
+        PlayerEntry for the most recent matching player, or None
+    """
+    with span("lookup.player", phase="lookup"):
+        try:
+            player_register.load()
+        except Exception as e:
+            logger.warning(f"Player register unavailable, falling back to playerid_lookup: {e}")
+            return _lookup_upstream(player_name)
+        return player_register.lookup(player_name)
@@ -0,0 +1,229 @@
+"""
+Tool registry for PyBaseball MCP Server.
+Each tool is declared once as a ToolSpec (schema, handler, executor, timeout,
+cache rule, stream function). The registry dispatches by name with a dict
+lookup, compiles argument validators once, and builds the tools/list payload
+once for every transport.
+"""
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from .encoding import dumpb, encoding_mode
+from .response_cache import CacheRule
+
+
+class ToolSpec(NamedTuple):
+    """
+    Declaration of one tool.
+
+    Args:
+        name: Tool name
+        description: Description shown to clients
+        input_schema: JSON Schema of the arguments
+        handler: Blocking callable taking the parameters positionally
+        parameters: Argument names passed to the handler, in order; missing
+            arguments take the schema default (or None)
+        executor: Executor class the handler runs on
+        timeout: Seconds before the call is abandoned, or None
+        cache: How HTTP responses are cached, or None to not cache them
+        stream: Blocking callable returning a RowStream for the chunked HTTP
+            routes, taking the same parameters, or None
+    """
+    name: str
+    description: str
+    input_schema: Dict[str, Any]
+    handler: Callable
+    parameters: Sequence[str] = ()
+    executor: str = "default"
+    timeout: Optional[float] = None
+    cache: Optional[CacheRule] = None
+    stream: Optional[Callable] = None
+
+
+# --- Argument validation ---
+
+_JSON_TYPES = {
+    "object": (dict,),
+    "array": (list, tuple),
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+}
+
+
+def compile_validator(schema: Dict[str, Any]) -> Callable[[Any, str], Optional[str]]:
+    """
+    Compile a JSON Schema into a check function.
+
+    Supports the keywords tool schemas use: type, properties, required,
+    enum, minimum, maximum, items, minItems, maxItems and oneOf.
+
+    Returns:
+        Function of (value, path) returning an error message or None
+    """
+    checks = []
+
+    if "type" in schema:
+        expected = schema["type"]
+        python_types = _JSON_TYPES[expected]
+
+        def check_type(value, path):
+            # bool is an int subclass but not a JSON integer
+            if not isinstance(value, python_types) or (isinstance(value, bool) and expected != "boolean"):
+                return f"{path} must be of type {expected}"
+        checks.append(check_type)
+
+    if "enum" in schema:
+        allowed = tuple(schema["enum"])
+
+        def check_enum(value, path):
+            if value not in allowed:
+                return f"{path} must be one of: {', '.join(map(str, allowed))}"
+        checks.append(check_enum)
+
+    if "minimum" in schema or "maximum" in schema:
+        minimum, maximum = schema.get("minimum"), schema.get("maximum")
+
+        def check_range(value, path):
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                if minimum is not None and value < minimum:
+                    return f"{path} must be at least {minimum}"
+                if maximum is not None and value > maximum:
+                    return f"{path} must be at most {maximum}"
+        checks.append(check_range)
+
+    if "minItems" in schema or "maxItems" in schema:
+        min_items, max_items = schema.get("minItems"), schema.get("maxItems")
+
+        def check_length(value, path):
+            if isinstance(value, (list, tuple)):
+                if min_items is not None and len(value) < min_items:
+                    return f"{path} must have at least {min_items} items"
+                if max_items is not None and len(value) > max_items:
+                    return f"{path} must have at most {max_items} items"
+        checks.append(check_length)
+
+    if "items" in schema:
+        check_item = compile_validator(schema["items"])
+
+        def check_items(value, path):
+            if isinstance(value, (list, tuple)):
+                for i, item in enumerate(value):
+                    error = check_item(item, f"{path}[{i}]")
+                    if error:
+                        return error
+        checks.append(check_items)
+
+    if "oneOf" in schema:
+        options = [compile_validator(option) for option in schema["oneOf"]]
+
+        def check_one_of(value, path):
+            errors = [option(value, path) for option in options]
+            if sum(error is None for error in errors) != 1:
+                return next((error for error in errors if error), f"{path} matches more than one schema")
+        checks.append(check_one_of)
+
+    if "properties" in schema or "required" in schema:
+        properties = {name: compile_validator(sub) for name, sub in schema.get("properties", {}).items()}
+        required = tuple(schema.get("required", ()))
+
+        def check_properties(value, path):
+            if not isinstance(value, dict):
+                return None
+            for name in required:
+                if value.get(name) is None:
+                    return f"missing required argument '{name}'"
+            for name, check in properties.items():
+                # None means "use the default", as the handlers treat it
+                if value.get(name) is not None:
+                    error = check(value[name], name)
+                    if error:
+                        return error
+        checks.append(check_properties)
+
+    def validate(value, path: str = "arguments") -> Optional[str]:
+        for check in checks:
+            error = check(value, path)
+            if error:
+                return error
+        return None
+
+    return validate
+
+
+# --- Registry ---
+
+class ToolRegistry:
+    """
+    Lookup, validation and listing of declared tools.
+
+    Validators and schema defaults are compiled when the registry is
+    created; the tools/list payloads are built on first use and then reused.
+    """
+
+    def __init__(self, specs: Sequence[ToolSpec]):
+        self._specs = {spec.name: spec for spec in specs}
+        self._validators = {spec.name: compile_validator(spec.input_schema) for spec in specs}
+        self._defaults = {
+            spec.name: {
+                name: prop["default"]
+                for name, prop in spec.input_schema.get("properties", {}).items()
+                if "default" in prop
+            }
+            for spec in specs
+        }
+        self._tools = None
+        self._summaries = None
+        self._summaries_json = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._specs
+
+    def __iter__(self):
+        return iter(self._specs.values())
+
+    def get(self, name: str) -> Optional[ToolSpec]:
+        """Get a tool's declaration, or None if there is no such tool."""
+        return self._specs.get(name)
+
+    def validate(self, name: str, arguments: Dict[str, Any]) -> Optional[str]:
+        """Check call arguments against the tool's schema; returns an error message or None."""
+        return self._validators[name](arguments or {})
+
+    def call_args(self, spec: ToolSpec, arguments: Dict[str, Any]) -> tuple:
+        """Positional handler arguments for a call, with schema defaults filled in."""
+        arguments = arguments or {}
+        defaults = self._defaults[spec.name]
+        return tuple(
+            arguments[name] if arguments.get(name) is not None else defaults.get(name)
+            for name in spec.parameters
+        )
+
+    def cache_rules(self) -> Dict[str, CacheRule]:
+        """Response cache rules of every cacheable tool."""
+        return {spec.name: spec.cache for spec in self if spec.cache is not None}
+
+    def tools(self) -> List[Any]:
+        """MCP Tool objects for tools/list, built once."""
+        if self._tools is None:
+            from mcp.types import Tool
+
+            self._tools = [
+                Tool(name=spec.name, description=spec.description, inputSchema=spec.input_schema)
+                for spec in self
+            ]
+        return self._tools
+
+    def summaries(self) -> List[Dict[str, str]]:
+        """Name and description of every tool, as listed over HTTP."""
+        if self._summaries is None:
+            self._summaries = [{"name": spec.name, "description": spec.description} for spec in self]
+        return self._summaries
+
+    def summaries_json(self, mode: str = None) -> bytes:
+        """Encoded summaries, serialized once per encoding mode."""
+        mode = mode or encoding_mode()
+        payload = self._summaries_json.get(mode)
+        if payload is None:
+            payload = self._summaries_json[mode] = dumpb(self.summaries(), mode)
+        return payload
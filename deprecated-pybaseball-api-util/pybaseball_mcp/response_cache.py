@@ -0,0 +1,162 @@
+"""
+Serialized-response cache for PyBaseball MCP Server.
+Stores the final encoded bytes of tool results for the HTTP transport,
+keyed by tool name plus canonicalized arguments, together with a strong
+ETag and a deadline taken from the expiry policy.
+"""
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+from .cache import TieredCache
+from .encoding import dumps
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_MEMORY_BYTES = int(os.environ.get("PYBASEBALL_RESPONSE_CACHE_MB", 32)) * 1024 * 1024
+
+# max-age sent for data that never changes again
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+
+class CacheRule(NamedTuple):
+    """
+    How a tool's arguments are canonicalized and how long its result stays fresh.
+
+    Args:
+        defaults: Argument defaults; callables are called when the argument is missing
+        folded: String arguments compared case- and whitespace-insensitively;
+            only arguments the result does not echo back, so every request
+            sharing a key gets the same bytes
+        expiry: Function of the canonical arguments returning seconds to live,
+            or None if the result never changes
+    """
+    defaults: Dict[str, Any]
+    folded: Tuple[str, ...]
+    expiry: Callable[[Dict[str, Any]], Optional[float]]
+
+
+class CachedResponse(NamedTuple):
+    data: bytes
+    digest: str
+    expires_at: float
+
+    def etag(self, tag: str = "") -> str:
+        """Strong ETag for a response body built from ``data`` plus a route-specific envelope ``tag``."""
+        if not tag:
+            return f'"{self.digest}"'
+        return '"' + hashlib.blake2b(f"{self.digest}:{tag}".encode("utf-8"), digest_size=16).hexdigest() + '"'
+
+    def cache_control(self) -> str:
+        """Cache-Control header value matching the remaining lifetime."""
+        if self.expires_at == float("inf"):
+            return f"public, max-age={IMMUTABLE_MAX_AGE}, immutable"
+        return f"public, max-age={max(0, round(self.expires_at - time.time()))}"
+
+
+def _canonical_value(value, folded: bool):
+    if isinstance(value, str):
+        return " ".join(value.split()).casefold() if folded else value
+    if isinstance(value, (list, tuple)):
+        return [_canonical_value(item, folded) for item in value]
+    return value
+
+
+def canonical_arguments(arguments: Dict[str, Any], rule: CacheRule) -> Dict[str, Any]:
+    """
+    Canonicalize tool arguments so equivalent calls share a cache entry.
+
+    Folded arguments have whitespace collapsed and case folded, defaults are
+    filled in (so an omitted year and the current year match) and arguments
+    set to None are dropped. Arguments echoed in the result (player and team
+    names, search terms) are kept as given.
+    """
+    canonical = {
+        name: _canonical_value(value, name in rule.folded)
+        for name, value in (arguments or {}).items()
+        if value is not None
+    }
+    for name, default in rule.defaults.items():
+        if canonical.get(name) is None:
+            canonical[name] = default() if callable(default) else default
+    return canonical
+
+
+def is_error_data(data: bytes) -> bool:
+    """
+    Check whether encoded tool output is an error (never cached).
+
+    Errors are an "Error..." message or a result object with a top-level
+    "error" member, either as the object itself (streamed results) or as its
+    JSON text (buffered results).
+    """
+    if data.startswith(b'"Error'):
+        return True
+    if b"error" not in data:
+        return False
+    try:
+        result = json.loads(data)
+        if isinstance(result, str) and result.startswith("{"):
+            result = json.loads(result)
+    except ValueError:
+        return False
+    return isinstance(result, dict) and "error" in result
+
+
+class ResponseCache:
+    """
+    Cache of encoded tool responses with ETags.
+
+    Args:
+        rules: Tool name -> CacheRule; tools without a rule are not cached
+        memory_budget_bytes: Size cap of the cache
+    """
+
+    def __init__(self, rules: Dict[str, CacheRule], memory_budget_bytes: int = RESPONSE_CACHE_MEMORY_BYTES):
+        self.rules = rules
+        self._cache = TieredCache("responses", memory_budget_bytes)
+
+    def key(self, name: str, arguments: Dict[str, Any], variant: str = "") -> Optional[tuple]:
+        """Get the cache key for a call, or None if the tool is not cacheable."""
+        rule = self.rules.get(name)
+        if rule is None:
+            return None
+        canonical = dumps(canonical_arguments(arguments, rule), "compact")
+        return (name, canonical, variant)
+
+    def get(self, key: tuple) -> Optional[CachedResponse]:
+        """Get a fresh cached response."""
+        return self._cache.get(key)
+
+    def put(self, key: tuple, data: bytes) -> Optional[CachedResponse]:
+        """
+        Cache encoded tool output.
+
+        Returns:
+            The cached response, or None if the output is an error message
+        """
+        if is_error_data(data):
+            return None
+        name, canonical, _ = key
+        ttl = self.rules[name].expiry(json.loads(canonical))
+        expires_at = float("inf") if ttl is None else time.time() + ttl
+        response = CachedResponse(data, hashlib.blake2b(data, digest_size=16).hexdigest(), expires_at)
+        self._cache.set(key, response, ttl)
+        return response
+
+    async def tee(self, key: tuple, chunks):
+        """Pass a stream of encoded chunks through, caching the whole output once it completes."""
+        parts = []
+        async for chunk in chunks:
+            parts.append(chunk)
+            yield chunk
+        self.put(key, b"".join(parts))
+
+    def clear(self):
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
@@ -0,0 +1,167 @@
+"""
+Player search index for PyBaseball MCP Server.
+Prefix, substring and typo-tolerant name search over the player register,
+ranked by how recently each player appeared in MLB.
+"""
+import bisect
+import logging
+import threading
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from .register import PlayerEntry, normalize_name, player_register
+from .tracing import span
+
+logger = logging.getLogger(__name__)
+
+# Minimum share of trigrams a fuzzy match must have in common with the query
+FUZZY_THRESHOLD = 0.35
+
+# Match tiers, best first
+EXACT, PREFIX, SUBSTRING, FUZZY = "exact", "prefix", "substring", "fuzzy"
+
+
+class SearchMatch(NamedTuple):
+    player: PlayerEntry
+    match: str
+
+
+def _trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class PlayerSearchIndex:
+    """
+    In-memory search index over register entries.
+
+    - Prefix: a sorted array of every name and every name suffix starting at a
+      word boundary ("mike trout", "trout"), searched with bisect.
+    - Substring and fuzzy: a trigram inverted index of NumPy posting lists.
+    Candidates within a tier are ranked by last MLB season, most recent first.
+    """
+
+    def __init__(self, entries):
+        self.entries = tuple(entries)
+        self.names = [normalize_name(entry.name) for entry in self.entries]
+        self.recency = np.array([entry.mlb_played_last or 0 for entry in self.entries], dtype=np.int32)
+
+        prefix_keys = []
+        postings = {}
+        exact = {}
+        for idx, name in enumerate(self.names):
+            exact.setdefault(name, []).append(idx)
+            words = name.split(" ")
+            for start in range(len(words)):
+                prefix_keys.append((" ".join(words[start:]), idx))
+            for gram in _trigrams(f" {name} "):
+                postings.setdefault(gram, []).append(idx)
+
+        prefix_keys.sort()
+        self._prefix_keys = [key for key, _ in prefix_keys]
+        self._prefix_ids = np.array([idx for _, idx in prefix_keys], dtype=np.int32)
+        self._postings = {gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()}
+        self._exact = {name: np.array(ids, dtype=np.int32) for name, ids in exact.items()}
+
+    def _top(self, ids: np.ndarray, limit: int) -> np.ndarray:
+        """Pick the ``limit`` most recent ids, best first."""
+        ids = np.unique(ids)
+        if len(ids) > limit:
+            ids = ids[np.argpartition(-self.recency[ids], limit - 1)[:limit]]
+        return ids[np.argsort(-self.recency[ids], kind="stable")]
+
+    def _prefix(self, query: str, limit: int) -> np.ndarray:
+        lo = bisect.bisect_left(self._prefix_keys, query)
+        hi = bisect.bisect_left(self._prefix_keys, query + "\uffff", lo)
+        return self._top(self._prefix_ids[lo:hi], limit)
+
+    def _substring(self, query: str, limit: int) -> np.ndarray:
+        grams = _trigrams(query)
+        if not grams or any(gram not in self._postings for gram in grams):
+            return np.empty(0, dtype=np.int32)
+        lists = sorted((self._postings[gram] for gram in grams), key=len)
+        candidates = lists[0]
+        for other in lists[1:]:
+            candidates = np.intersect1d(candidates, other, assume_unique=True)
+            if len(candidates) == 0:
+                return candidates
+        if len(grams) > 1:
+            # Trigram hits can be scattered; confirm the query is contiguous
+            candidates = np.array([idx for idx in candidates if query in self.names[idx]], dtype=np.int32)
+        return self._top(candidates, limit)
+
+    def _fuzzy(self, query: str, limit: int) -> np.ndarray:
+        grams = [gram for gram in _trigrams(f" {query} ") if gram in self._postings]
+        if not grams:
+            return np.empty(0, dtype=np.int32)
+        counts = np.bincount(np.concatenate([self._postings[gram] for gram in grams]), minlength=len(self.entries))
+        needed = max(1, int(np.ceil(FUZZY_THRESHOLD * len(_trigrams(f" {query} ")))))
+        ids = np.nonzero(counts >= needed)[0]
+        if len(ids) > limit:
+            ids = ids[np.argpartition(-counts[ids], limit - 1)[:limit]]
+        # Most shared trigrams first, recency breaks ties
+        return ids[np.lexsort((-self.recency[ids], -counts[ids]))]
+
+    def search(self, search_term: str, limit: int = 10) -> list:
+        """
+        Search for players by name.
+
+        Args:
+            search_term: Full or partial name, possibly misspelled
+            limit: Maximum number of matches
+
+        Returns:
+            List of SearchMatch, best match first
+        """
+        query = normalize_name(search_term)
+        if not query:
+            return []
+        results = []
+        seen = set()
+
+        def add(ids, tier):
+            for idx in ids.tolist():
+                if idx not in seen and len(results) < limit:
+                    seen.add(idx)
+                    results.append(SearchMatch(self.entries[idx], tier))
+
+        if query in self._exact:
+            add(self._top(self._exact[query], limit), EXACT)
+        if len(results) < limit:
+            add(self._prefix(query, limit + len(results)), PREFIX)
+        if len(results) < limit and len(query) >= 3:
+            add(self._substring(query, limit + len(results)), SUBSTRING)
+        if len(results) < limit:
+            add(self._fuzzy(query, limit + len(results)), FUZZY)
+        return results
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_search_index() -> PlayerSearchIndex:
+    """Get the shared search index, building it from the player register on first use and after a refresh."""
+    global _index
+    if _index is None or _index.entries is not player_register.entries:
+        with _index_lock:
+            player_register.load()
+            if _index is None or _index.entries is not player_register.entries:
+                start = time.perf_counter()
+                _index = PlayerSearchIndex(player_register.entries)
+                logger.info(f"Player search index built in {time.perf_counter() - start:.2f}s")
+    return _index
+
+
+def clear_search_index():
+    """Drop the shared search index; it is rebuilt on the next search."""
+    global _index
+    with _index_lock:
+        _index = None
+
+
+def search_players(search_term: str, limit: int = 10) -> list:
+    """Search the player register by full, partial or misspelled name."""
+    with span("lookup.search", phase="lookup"):
+        return get_search_index().search(search_term, limit)
@@ -0,0 +1,212 @@
+"""
+League-wide Statcast store for PyBaseball MCP Server.
+Pitch-level Statcast data is pulled once per game date for the whole league
+and kept on disk as one Arrow IPC (Feather) partition per day. Rolling-window
+queries fetch only the partitions that are missing or expired, then slice
+each player's pitches from local data. Partitions older than the retention
+window are removed, and the oldest days go first when the store outgrows
+its byte budget.
+"""
+import logging
+import os
+import threading
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import pandas as pd
+from pybaseball import statcast
+
+from .expiry import STATCAST_RETENTION_DAYS, get_expiry_policy, utc_today
+from .metrics import upstream_call
+from .tracing import span
+from .utils import MCP_DATA_DIR, suppress_stdout
+
+logger = logging.getLogger(__name__)
+
+STATCAST_DIR = MCP_DATA_DIR / "statcast"
+# Longest span of days pulled in one upstream request; each span is written
+# before the next is fetched, so a cold window saves progress as it goes
+STATCAST_FETCH_DAYS = int(os.environ.get("PYBASEBALL_STATCAST_FETCH_DAYS", 7))
+# Size cap of the partition directory
+STATCAST_DISK_BUDGET_BYTES = int(os.environ.get("PYBASEBALL_STATCAST_DISK_MB", 512)) * 1024 * 1024
+
+
+def partition_path(game_date: date) -> Path:
+    """Get the partition file path for a game date."""
+    return Path(STATCAST_DIR) / f"{game_date.isoformat()}.feather"
+
+
+def _partition_is_fresh(game_date: date) -> bool:
+    path = partition_path(game_date)
+    if not path.exists():
+        return False
+    written_at = datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc)
+    ttl = get_expiry_policy().ttl("statcast", game_date=game_date, now=written_at)
+    return ttl is None or (written_at + timedelta(seconds=ttl)) > datetime.now(timezone.utc)
+
+
+def _write_partition(game_date: date, frame: pd.DataFrame):
+    from pyarrow import feather
+
+    path = partition_path(game_date)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    # lz4 keeps a season of partitions to a fraction of the raw size; columns
+    # are still read selectively
+    feather.write_feather(frame.reset_index(drop=True), tmp_path, compression="lz4")
+    os.replace(tmp_path, path)
+
+
+def _fetch_range(start: date, end: date):
+    """Pull league-wide Statcast for a date range and write one partition per day."""
+    logger.info(f"Fetching league Statcast partitions {start} to {end}")
+    with suppress_stdout(), upstream_call("statcast"):
+        data = statcast(start_dt=start.isoformat(), end_dt=end.isoformat(), verbose=False)
+    if data is None:
+        data = pd.DataFrame()
+    game_dates = pd.to_datetime(data["game_date"]).dt.date if "game_date" in data else pd.Series(dtype=object)
+    by_date = {day: frame for day, frame in data.groupby(game_dates.values)} if len(data) else {}
+    day = start
+    while day <= end:
+        # Days without games are stored empty so they are not pulled again
+        _write_partition(day, by_date.get(day, data.iloc[0:0]))
+        day += timedelta(days=1)
+
+
+def _missing_runs(days, max_days: int = None):
+    """Group consecutive days that need fetching into (start, end) ranges of at most ``max_days`` days."""
+    max_days = max_days or STATCAST_FETCH_DAYS
+    runs = []
+    for day in days:
+        if _partition_is_fresh(day):
+            continue
+        if runs and runs[-1][1] + timedelta(days=1) == day and (day - runs[-1][0]).days < max_days:
+            runs[-1][1] = day
+        else:
+            runs.append([day, day])
+    return runs
+
+
+class StatcastStore:
+    """Daily league-wide Statcast partitions on local disk."""
+
+    def __init__(self):
+        self._fetch_lock = threading.Lock()
+        self.partitions_fetched = 0
+
+    def ensure(self, start: date, end: date):
+        """
+        Make sure every partition in [start, end] (up to today, UTC) is present and fresh.
+
+        Missing days are pulled in spans of at most STATCAST_FETCH_DAYS and each
+        span is written before the next is requested, so a call that fails or
+        times out part way keeps the days it already fetched.
+        """
+        end = min(end, utc_today())
+        days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        if not _missing_runs(days):
+            return
+        # One fetcher at a time; later callers find the partitions already written
+        with self._fetch_lock:
+            try:
+                for run_start, run_end in _missing_runs(days):
+                    _fetch_range(run_start, run_end)
+                    self.partitions_fetched += (run_end - run_start).days + 1
+            finally:
+                self.trim(keep=(start, end))
+
+    def clear(self):
+        """Remove every partition from disk."""
+        with self._fetch_lock:
+            for path in Path(STATCAST_DIR).glob("*.feather"):
+                path.unlink(missing_ok=True)
+        logger.info("Statcast partitions cleared")
+
+    def trim(self, keep=None, today: date = None) -> int:
+        """
+        Remove partitions older than STATCAST_RETENTION_DAYS, then the oldest
+        game dates until the store fits in STATCAST_DISK_BUDGET_BYTES.
+
+        Args:
+            keep: (start, end) window whose partitions are never removed
+            today: Current date, for testing (defaults to today, UTC)
+
+        Returns:
+            Number of partitions removed
+        """
+        oldest_kept = (today or utc_today()) - timedelta(days=STATCAST_RETENTION_DAYS)
+        partitions = []
+        total = 0
+        for path in Path(STATCAST_DIR).glob("*.feather"):
+            try:
+                game_date = date.fromisoformat(path.stem)
+            except ValueError:
+                continue
+            size = path.stat().st_size
+            total += size
+            if keep is None or not keep[0] <= game_date <= keep[1]:
+                partitions.append((game_date, path, size))
+        removed = 0
+        for game_date, path, size in sorted(partitions):
+            if game_date >= oldest_kept and total <= STATCAST_DISK_BUDGET_BYTES:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        if removed:
+            logger.info(f"Removed {removed} Statcast partitions outside the retention window or byte budget")
+        return removed
+
+    def load(self, start: date, end: date, columns=None, player_id: int = None, role: str = "batter") -> pd.DataFrame:
+        """
+        Load Statcast pitches for a date window from local partitions.
+
+        Args:
+            start: First game date
+            end: Last game date
+            columns: Columns to read (None for all)
+            player_id: MLBAM id to keep only one player's pitches
+            role: "batter" or "pitcher", the column player_id is matched against
+
+        Returns:
+            DataFrame of pitches in the window
+        """
+        with span("fetch.statcast_window", phase="fetch", start=start.isoformat(), end=end.isoformat()):
+            return self._read_window(start, end, columns, player_id, role)
+
+    def _read_window(self, start: date, end: date, columns, player_id: int, role: str) -> pd.DataFrame:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        from pyarrow import feather
+
+        self.ensure(start, end)
+        read_columns = None
+        if columns is not None:
+            read_columns = list(dict.fromkeys(list(columns) + ([role] if player_id is not None else [])))
+        tables = []
+        day = start
+        while day <= min(end, utc_today()):
+            path = partition_path(day)
+            day += timedelta(days=1)
+            if not path.exists():
+                continue
+            table = feather.read_table(path, memory_map=True)
+            if table.num_rows == 0:
+                continue
+            if read_columns is not None:
+                table = table.select([col for col in read_columns if col in table.column_names])
+            if player_id is not None:
+                table = table.filter(pc.equal(table[role], player_id))
+            tables.append(table)
+        if not tables:
+            return pd.DataFrame(columns=read_columns or [])
+        return pa.concat_tables(tables, promote_options="default").to_pandas()
+
+    def player_window(self, player_id: int, days: int, role: str = "batter", columns=None, end: date = None) -> pd.DataFrame:
+        """Load one player's pitches for the last ``days`` days as batter or pitcher."""
+        end = end or utc_today()
+        return self.load(end - timedelta(days=days), end, columns=columns, player_id=player_id, role=role)
+
+
+# Shared store used by every tool
+statcast_store = StatcastStore()
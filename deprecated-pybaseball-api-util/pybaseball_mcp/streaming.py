@@ -0,0 +1,82 @@
+"""
+Row streaming for PyBaseball MCP Server.
+Tools that produce many rows (leaderboards, standings divisions) can return
+a RowStream instead of a finished JSON string. The HTTP transport pulls the
+rows in small batches on the tool's executor and writes each one as soon as
+it is serialized, so the first byte goes out with the first row.
+"""
+from typing import Any, AsyncIterator, Dict, Iterator, NamedTuple
+
+from .encoding import dumpb
+from .executor import run_blocking
+
+# Rows pulled from a blocking row iterator per executor hop
+STREAM_BATCH_ROWS = 64
+
+
+class RowStream(NamedTuple):
+    """
+    A JSON object whose ``rows_key`` member is produced lazily.
+
+    The member is an array of rows, or an object when ``mapping`` is set and
+    the rows are (key, value) pairs.
+    """
+    header: Dict[str, Any]
+    rows_key: str
+    rows: Iterator[Any]
+    mapping: bool = False
+
+    def to_dict(self) -> dict:
+        """Materialize the whole object (for transports that need the full result)."""
+        rows = dict(self.rows) if self.mapping else list(self.rows)
+        return {**self.header, self.rows_key: rows}
+
+
+def _next_batch(rows: Iterator[Any], size: int) -> list:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            break
+    return batch
+
+
+async def iterate_rows(rows: Iterator[Any], executor: str = "default", batch_size: int = None) -> AsyncIterator[Any]:
+    """
+    Iterate a blocking row iterator from async code.
+
+    Rows are pulled ``batch_size`` (default STREAM_BATCH_ROWS) at a time on the given executor so a slow
+    producer never blocks the event loop.
+    """
+    batch_size = batch_size or STREAM_BATCH_ROWS
+    rows = iter(rows)
+    while True:
+        batch = await run_blocking(_next_batch, rows, batch_size, executor=executor)
+        for row in batch:
+            yield row
+        if len(batch) < batch_size:
+            return
+
+
+async def stream_json_object(stream: RowStream, executor: str = "default") -> AsyncIterator[bytes]:
+    """
+    Serialize a RowStream incrementally.
+
+    Yields the header fields and the opening of the rows array first, then
+    one chunk per row, then the closing brackets.
+    """
+    # Rows are always written compact: one chunk per row
+    header = dumpb(stream.header, "compact")
+    prefix = header[:-1] + (b"," if stream.header else b"")
+    opening, closing = (b"{", b"}}") if stream.mapping else (b"[", b"]}")
+    yield prefix + dumpb(stream.rows_key) + b":" + opening
+    first = True
+    async for row in iterate_rows(stream.rows, executor=executor):
+        if stream.mapping:
+            key, value = row
+            chunk = dumpb(str(key)) + b":" + dumpb(value, "compact")
+        else:
+            chunk = dumpb(row, "compact")
+        yield (b'' if first else b',') + chunk
+        first = False
+    yield closing
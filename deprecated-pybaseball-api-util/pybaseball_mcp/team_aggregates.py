@@ -0,0 +1,64 @@
+"""
+Per-team aggregates for PyBaseball MCP Server.
+Each batting/pitching season frame is grouped by team once, keyed by the
+canonical team code from normalize_team_name, so a team stats request is a
+single keyed lookup instead of a scan over every player row.
+"""
+import pandas as pd
+
+from .derived import derived
+from .utils import normalize_team_name
+
+# Named aggregations per frame kind: output name -> (column, function)
+TEAM_AGGREGATES = {
+    "batting": {
+        "players": ("Name", "size"),
+        "avg_avg": ("AVG", "mean"),
+        "total_hr": ("HR", "sum"),
+        "total_rbi": ("RBI", "sum"),
+        "total_runs": ("R", "sum"),
+        "team_ops": ("OPS", "mean"),
+    },
+    "pitching": {
+        "pitchers": ("Name", "size"),
+        "avg_era": ("ERA", "mean"),
+        "total_wins": ("W", "sum"),
+        "total_saves": ("SV", "sum"),
+        "total_strikeouts": ("SO", "sum"),
+    },
+}
+
+# Team column values of players who played for several clubs in a season
+MULTI_TEAM_CODES = ("- - -", "---", "TOT", "2TM", "3TM", "4TM")
+
+
+def _canonical_codes(teams: pd.Series) -> pd.Series:
+    """Map a frame's Team column to canonical codes (None for multi-team rows)."""
+    codes = {
+        value: None if not isinstance(value, str) or value.strip() in MULTI_TEAM_CODES else normalize_team_name(value)
+        for value in teams.unique()
+    }
+    return teams.map(codes)
+
+
+def _build_team_table(frame: pd.DataFrame, kind: str) -> pd.DataFrame:
+    aggregates = {name: spec for name, spec in TEAM_AGGREGATES[kind].items() if spec[0] in frame.columns}
+    if "Team" not in frame.columns or not aggregates:
+        return pd.DataFrame(columns=list(aggregates))
+    codes = _canonical_codes(frame["Team"])
+    return frame.groupby(codes, sort=True).agg(**aggregates)
+
+
+def team_table(frame: pd.DataFrame, kind: str) -> pd.DataFrame:
+    """
+    Get a season frame's aggregates per team, built once per frame.
+
+    Args:
+        frame: Shared FanGraphs batting or pitching frame
+        kind: "batting" or "pitching"
+
+    Returns:
+        DataFrame indexed by canonical team code with one column per
+        aggregate (aggregates of columns missing from the frame are left out)
+    """
+    return derived(frame, f"team_table:{kind}", lambda: _build_team_table(frame, kind))
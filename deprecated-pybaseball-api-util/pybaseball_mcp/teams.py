@@ -3,15 +3,66 @@ Team and league statistics module for PyBaseball MCP Server.
 Handles league-wide stats, standings, and leaderboards.
 """
 import pybaseball as pyb
-from pybaseball import standings, batting_stats, pitching_stats
 import pandas as pd
 from datetime import datetime
-import json
 import logging
 
+from .frames import get_batting_frame, get_pitching_frame, get_standings_frames
+from .ranks import LOWER_IS_BETTER, rank_index
+from .records import FieldSpec, build_records
+from .streaming import RowStream
+from .team_aggregates import team_table
+from .tracing import span
+from .utils import normalize_team_name
+from .encoding import dumps
+
 logger = logging.getLogger(__name__)
 
-def get_standings(year: int = None, league: str = "all") -> dict:
+# Fields of a team row in the standings
+STANDINGS_FIELDS = [
+    FieldSpec("Tm", "team"),
+    FieldSpec("W", "wins", "int", default=0),
+    FieldSpec("L", "losses", "int", default=0),
+    FieldSpec("W-L%", "win_pct", "float", 3),
+    FieldSpec("GB", "games_back", default="0"),
+]
+
+
+def _standings_team_rows(df: pd.DataFrame) -> list:
+    return build_records(df, STANDINGS_FIELDS)
+
+
+def stream_standings(year: int = None) -> RowStream:
+    """
+    Get MLB standings as a stream of (division name, teams) pairs.
+    
+    Args:
+        year: Season year (defaults to current)
+        
+    Returns:
+        RowStream of the "standings" object; divisions are built as they are read
+    """
+    if year is None:
+        year = datetime.now().year
+        
+    # Get standings
+    standings_data = get_standings_frames(year)
+    
+    # Handle different return types from the pybaseball standings function
+    if isinstance(standings_data, dict):
+        # Dictionary format keyed by division
+        divisions = ((division.replace('_', ' ').title(), df) for division, df in standings_data.items())
+    elif isinstance(standings_data, list):
+        # List format: each item is a dataframe for a division, named by position
+        divisions = ((f"Division {i+1}", df) for i, df in enumerate(standings_data))
+    else:
+        raise TypeError(f"Unexpected standings data type: {type(standings_data)}")
+        
+    rows = ((division_name, _standings_team_rows(df)) for division_name, df in divisions)
+    return RowStream({"year": year}, "standings", rows, mapping=True)
+
+
+def get_standings(year: int = None, league: str = "all"):
     """
     Get current MLB standings.
     
@@ -20,73 +71,45 @@ def get_standings(year: int = None, league: str = "all") -> dict:
         league: "AL", "NL", or "all"
         
     Returns:
-        Dictionary with standings data (not a JSON string)
+        Dictionary with standings data (not a JSON string), or an error message
     """
+    if year is None:
+        year = datetime.now().year
     try:
-        if year is None:
-            year = datetime.now().year
-            
-        # Get standings
-        standings_data = standings(year)
-        result = {"year": year, "standings": {}}
-        
-        # Handle different return types from the pybaseball standings function
-        if isinstance(standings_data, dict):
-            # Process each division in dictionary format
-            for division, df in standings_data.items():
-                division_name = division.replace('_', ' ').title()
-                
-                teams = []
-                for _, team in df.iterrows():
-                    teams.append({
-                        "team": team['Tm'],
-                        "wins": int(team['W']),
-                        "losses": int(team['L']),
-                        "win_pct": round(float(team['W-L%']), 3),
-                        "games_back": team.get('GB', '0')
-                    })
-                    
-                result["standings"][division_name] = teams
-        elif isinstance(standings_data, list):
-            # Handle list format (this is likely what's causing the bug)
-            # In this case, each item in the list is a dataframe for a division
-            for i, df in enumerate(standings_data):
-                # Try to determine division name from the dataframe
-                # If division name can't be determined, use a generic name based on index
-                division_name = f"Division {i+1}"
-                
-                teams = []
-                for _, team in df.iterrows():
-                    teams.append({
-                        "team": team['Tm'],
-                        "wins": int(team['W']),
-                        "losses": int(team['L']),
-                        "win_pct": round(float(team['W-L%']), 3),
-                        "games_back": team.get('GB', '0')
-                    })
-                
-                result["standings"][division_name] = teams
-        else:
-            # Handle unexpected return type
-            logger.error(f"Unexpected standings data type: {type(standings_data)}")
-            return {
-                "error": f"Unexpected standings data type: {type(standings_data)}",
-                "year": year
-            }
-            
-        return result
-        
+        return stream_standings(year).to_dict()
     except Exception as e:
         logger.error(f"Error fetching standings: {str(e)}")
-        return {
-            "error": f"Error retrieving standings: {str(e)}",
-            "year": year if year else datetime.now().year
-        }
+        return f"Error retrieving standings for {year}: {str(e)}"
 
 
-def get_league_leaders(stat: str, year: int = None, top_n: int = 10, player_type: str = "batting") -> str:
+# Map common stat names to actual column names
+LEADER_STAT_MAPPING = {
+    # Batting stats
+    "avg": "AVG", "average": "AVG", "batting_average": "AVG",
+    "hr": "HR", "home_runs": "HR", "homers": "HR",
+    "rbi": "RBI", "ribbies": "RBI",
+    "runs": "R", "r": "R",
+    "hits": "H", "h": "H",
+    "sb": "SB", "stolen_bases": "SB", "steals": "SB",
+    "obp": "OBP", "on_base": "OBP",
+    "slg": "SLG", "slugging": "SLG",
+    "ops": "OPS",
+    "war": "WAR",
+    # Pitching stats
+    "era": "ERA", "earned_run_average": "ERA",
+    "wins": "W", "w": "W",
+    "strikeouts": "SO", "so": "SO", "ks": "SO",
+    "whip": "WHIP",
+    "saves": "SV", "sv": "SV",
+    "k9": "K/9", "k_per_9": "K/9"
+}
+
+PITCHING_LEADER_STATS = ["ERA", "W", "L", "SV", "SO", "WHIP", "K/9", "BB/9", "IP"]
+
+
+def stream_league_leaders(stat: str, year: int = None, top_n: int = 10, player_type: str = "batting"):
     """
-    Get league leaders for a specific statistic.
+    Get league leaders for a specific statistic as a stream of leader rows.
     
     Args:
         stat: Statistic to rank by (e.g., "HR", "AVG", "ERA")
@@ -95,84 +118,99 @@ def get_league_leaders(stat: str, year: int = None, top_n: int = 10, player_type
         player_type: "batting" or "pitching"
         
     Returns:
-        JSON string with league leaders
+        RowStream of the "leaders" array, or a message string if the stat is unknown
     """
-    try:
-        if year is None:
-            year = datetime.now().year
-            
-        # Map common stat names to actual column names
-        stat_mapping = {
-            # Batting stats
-            "avg": "AVG", "average": "AVG", "batting_average": "AVG",
-            "hr": "HR", "home_runs": "HR", "homers": "HR",
-            "rbi": "RBI", "ribbies": "RBI",
-            "runs": "R", "r": "R",
-            "hits": "H", "h": "H",
-            "sb": "SB", "stolen_bases": "SB", "steals": "SB",
-            "obp": "OBP", "on_base": "OBP",
-            "slg": "SLG", "slugging": "SLG",
-            "ops": "OPS",
-            "war": "WAR",
-            # Pitching stats
-            "era": "ERA", "earned_run_average": "ERA",
-            "wins": "W", "w": "W",
-            "strikeouts": "SO", "so": "SO", "ks": "SO",
-            "whip": "WHIP",
-            "saves": "SV", "sv": "SV",
-            "k9": "K/9", "k_per_9": "K/9"
-        }
+    if year is None:
+        year = datetime.now().year
         
-        # Normalize stat name
-        stat_column = stat_mapping.get(stat.lower(), stat.upper())
+    # Normalize stat name
+    stat_column = LEADER_STAT_MAPPING.get(stat.lower(), stat.upper())
+    
+    # Determine if batting or pitching stat
+    is_pitching = stat_column in PITCHING_LEADER_STATS or player_type.lower() == "pitching"
+    
+    # Get appropriate stats
+    if is_pitching:
+        df = get_pitching_frame(year)
+        sort_ascending = stat_column in LOWER_IS_BETTER
+    else:
+        df = get_batting_frame(year)
+        sort_ascending = False  # Higher is better for batting stats
         
-        # Determine if batting or pitching stat
-        pitching_stats_list = ["ERA", "W", "L", "SV", "SO", "WHIP", "K/9", "BB/9", "IP"]
-        is_pitching = stat_column in pitching_stats_list or player_type.lower() == "pitching"
+    # Check if stat exists
+    if stat_column not in df.columns:
+        available_stats = [col for col in df.columns if not col.startswith('ID')]
+        return f"Stat '{stat}' not found. Available stats: {', '.join(available_stats[:20])}"
         
-        # Get appropriate stats
-        if is_pitching:
-            df = pitching_stats(year, qual=1)
-            sort_ascending = stat_column in ["ERA", "WHIP", "BB/9"]  # Lower is better
-        else:
-            df = batting_stats(year, qual=1)
-            sort_ascending = False  # Higher is better for batting stats
-            
-        # Check if stat exists
-        if stat_column not in df.columns:
-            available_stats = [col for col in df.columns if not col.startswith('ID')]
-            return f"Stat '{stat}' not found. Available stats: {', '.join(available_stats[:20])}"
+    # Top players from the frame's precomputed rank order
+    df_sorted = rank_index(df).top(df, stat_column, top_n, ascending=sort_ascending)
+    
+    fields = [
+        FieldSpec("Name", "name"),
+        FieldSpec("Team", "team", default="Unknown"),
+        FieldSpec(stat_column, cast="float", default=0),
+    ]
+
+    def leaders():
+        for rank, record in enumerate(build_records(df_sorted, fields), 1):
+            yield {"rank": rank, **record}
             
-        # Sort and get top players
-        df_sorted = df.sort_values(stat_column, ascending=sort_ascending).head(top_n)
+    header = {
+        "stat": stat_column,
+        "year": year,
+        "type": "pitching" if is_pitching else "batting"
+    }
+    return RowStream(header, "leaders", leaders())
+
+
+def get_league_leaders(stat: str, year: int = None, top_n: int = 10, player_type: str = "batting") -> str:
+    """
+    Get league leaders for a specific statistic.
+    
+    Args:
+        stat: Statistic to rank by (e.g., "HR", "AVG", "ERA")
+        year: Season year
+        top_n: Number of top players to return
+        player_type: "batting" or "pitching"
         
-        leaders = []
-        for idx, (_, player) in enumerate(df_sorted.iterrows(), 1):
-            leaders.append({
-                "rank": idx,
-                "name": player['Name'],
-                "team": player.get('Team', 'Unknown'),
-                stat_column: float(player[stat_column]) if pd.notna(player[stat_column]) else 0
-            })
-            
-        return json.dumps({
-            "stat": stat_column,
-            "year": year,
-            "type": "pitching" if is_pitching else "batting",
-            "leaders": leaders
-        }, indent=2)
+    Returns:
+        JSON string with league leaders
+    """
+    try:
+        result = stream_league_leaders(stat, year, top_n, player_type)
+        if isinstance(result, str):
+            return result
+        with span("serialize.stat_leaders", phase="serialize"):
+            return dumps(result.to_dict())
         
     except Exception as e:
         logger.error(f"Error fetching league leaders: {str(e)}")
         return f"Error retrieving league leaders: {str(e)}"
 
 
+def _team_record(code: str, batting: pd.DataFrame, pitching: pd.DataFrame) -> dict:
+    """Format one team's precomputed aggregates (None when the team has no rows of a kind)."""
+    def aggregates(table, rounding):
+        if code not in table.index:
+            return None
+        row = table.loc[code]
+        return {
+            name: (round(float(row[name]), rounding[name]) if name in rounding else int(row[name]))
+            for name in table.columns
+        }
+
+    return {
+        "batting": aggregates(batting, {"avg_avg": 3, "team_ops": 3}),
+        "pitching": aggregates(pitching, {"avg_era": 2}),
+    }
+
+
 def get_team_stats(team_name: str, year: int = None) -> str:
     """
     Get team aggregate statistics.
     
     Args:
-        team_name: Team name or abbreviation
+        team_name: Team name or abbreviation, or "all" for every team
         year: Season year
         
     Returns:
@@ -182,40 +220,26 @@ def get_team_stats(team_name: str, year: int = None) -> str:
         if year is None:
             year = datetime.now().year
             
-        # Get batting and pitching stats
-        batting_df = batting_stats(year, qual=1)
-        pitching_df = pitching_stats(year, qual=1)
-        
-        # Filter by team
-        team_batting = batting_df[batting_df['Team'].str.contains(team_name, case=False, na=False)]
-        team_pitching = pitching_df[pitching_df['Team'].str.contains(team_name, case=False, na=False)]
-        
-        if team_batting.empty and team_pitching.empty:
+        # Per-team aggregates are built once per season frame
+        batting = team_table(get_batting_frame(year), "batting")
+        pitching = team_table(get_pitching_frame(year), "pitching")
+
+        if team_name.strip().lower() == "all":
+            codes = batting.index.union(pitching.index)
+            with span("aggregate.team_records", phase="aggregate", teams=len(codes)):
+                teams = [{"team": code, **_team_record(code, batting, pitching)} for code in codes]
+            with span("serialize.team_statistics", phase="serialize"):
+                return dumps({"year": year, "count": len(codes), "teams": teams})
+
+        code = normalize_team_name(team_name)
+        if code not in batting.index and code not in pitching.index:
             return f"No stats found for team '{team_name}'"
-            
-        # Aggregate team stats
-        result = {
-            "team": team_name,
-            "year": year,
-            "batting": {
-                "players": len(team_batting),
-                "avg_avg": round(team_batting['AVG'].mean(), 3),
-                "total_hr": int(team_batting['HR'].sum()),
-                "total_rbi": int(team_batting['RBI'].sum()),
-                "total_runs": int(team_batting['R'].sum()),
-                "team_ops": round(team_batting['OPS'].mean(), 3)
-            },
-            "pitching": {
-                "pitchers": len(team_pitching),
-                "avg_era": round(team_pitching['ERA'].mean(), 2),
-                "total_wins": int(team_pitching['W'].sum()),
-                "total_saves": int(team_pitching['SV'].sum()),
-                "total_strikeouts": int(team_pitching['SO'].sum())
-            }
-        }
-        
-        return json.dumps(result, indent=2)
+
+        with span("aggregate.team_records", phase="aggregate", teams=1):
+            result = {"team": team_name, "code": code, "year": year, **_team_record(code, batting, pitching)}
+        with span("serialize.team_statistics", phase="serialize"):
+            return dumps(result)
         
     except Exception as e:
         logger.error(f"Error fetching team stats: {str(e)}")
-        return f"Error retrieving team stats: {str(e)}"
\ No newline at end of file
+        return f"Error retrieving team stats: {str(e)}"
@@ -0,0 +1,261 @@
+"""
+Tool declarations for PyBaseball MCP Server.
+Every tool's schema, handler, executor, timeout, response-cache rule and
+stream function are declared here once and shared by the native server and
+the deprecated FastAPI server through TOOL_REGISTRY.
+"""
+from datetime import datetime
+from typing import Callable, List
+
+from .expiry import STATCAST_RETENTION_DAYS, get_expiry_policy, utc_today
+from .lazy import lazy_function, package_version
+from .registry import ToolRegistry, ToolSpec
+from .response_cache import CacheRule
+
+# Tool implementations import pybaseball and pandas, so they are loaded on
+# first use; initialize and tools/list never wait for them
+_get_player_stats_impl = lazy_function("pybaseball_mcp.players", "_get_player_stats_impl")
+_get_players_stats_batch_impl = lazy_function("pybaseball_mcp.players", "_get_players_stats_batch_impl")
+_get_player_recent_stats_impl = lazy_function("pybaseball_mcp.players", "_get_player_recent_stats_impl")
+_search_player_impl = lazy_function("pybaseball_mcp.players", "_search_player_impl")
+get_standings = lazy_function("pybaseball_mcp.teams", "get_standings")
+get_league_leaders = lazy_function("pybaseball_mcp.teams", "get_league_leaders")
+get_team_stats = lazy_function("pybaseball_mcp.teams", "get_team_stats")
+stream_standings = lazy_function("pybaseball_mcp.teams", "stream_standings")
+stream_league_leaders = lazy_function("pybaseball_mcp.teams", "stream_league_leaders")
+clear_cache = lazy_function("pybaseball_mcp.utils", "clear_cache")
+
+# Called after clear_stats_cache clears the data caches (e.g. to drop encoded responses)
+_cache_clear_hooks: List[Callable[[], None]] = []
+
+
+def on_cache_clear(hook: Callable[[], None]):
+    """Register a function to call whenever clear_stats_cache runs."""
+    if hook not in _cache_clear_hooks:
+        _cache_clear_hooks.append(hook)
+
+
+def _clear_stats_cache() -> str:
+    clear_cache()
+    for hook in _cache_clear_hooks:
+        hook()
+    return "Statistics cache cleared successfully"
+
+
+def _health_check() -> str:
+    return f"PyBaseball MCP Server is running. PyBaseball version: {package_version('pybaseball')}"
+
+
+# --- Cache expiry ---
+
+def _current_year() -> int:
+    return datetime.now().year
+
+
+def _season_expiry(kind: str, year_argument: str = "year"):
+    """Expiry of a tool result computed from one season (or a list of seasons) of data."""
+    def expiry(arguments):
+        years = arguments.get(year_argument)
+        years = years if isinstance(years, list) else [years]
+        ttls = [get_expiry_policy().ttl(kind, year=year) for year in years]
+        finite = [ttl for ttl in ttls if ttl is not None]
+        return min(finite) if finite else None
+    return expiry
+
+
+def _statcast_expiry(arguments):
+    return get_expiry_policy().ttl("statcast", game_date=utc_today())
+
+
+def _search_expiry(arguments):
+    return get_expiry_policy().ttl("batting", year=_current_year())
+
+
+# --- Schemas ---
+
+_YEAR = {
+    "type": "integer",
+    "description": "Season year (defaults to current year)",
+    "minimum": 1871
+}
+
+_NO_ARGUMENTS = {"type": "object", "properties": {}, "required": []}
+
+TOOL_SPECS = [
+    ToolSpec(
+        name="player_stats",
+        description="Get season statistics for a specific MLB player",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "player_name": {
+                    "type": "string",
+                    "description": "Full name of the player (e.g., 'Shohei Ohtani')"
+                },
+                "year": _YEAR
+            },
+            "required": ["player_name"]
+        },
+        handler=_get_player_stats_impl,
+        parameters=("player_name", "year"),
+        timeout=30,
+        cache=CacheRule({"year": _current_year}, (), _season_expiry("batting"))
+    ),
+    ToolSpec(
+        name="players_stats_batch",
+        description="Get season statistics for many MLB players at once (e.g. a full lineup)",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "player_names": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Full names of the players",
+                    "minItems": 1,
+                    "maxItems": 50
+                },
+                "years": {
+                    "description": "Season year for all players, or one year per player (defaults to current year)",
+                    "oneOf": [
+                        {"type": "integer", "minimum": 1871},
+                        {"type": "array", "items": {"type": "integer", "minimum": 1871}}
+                    ]
+                }
+            },
+            "required": ["player_names"]
+        },
+        handler=_get_players_stats_batch_impl,
+        parameters=("player_names", "years"),
+        timeout=60,
+        cache=CacheRule({"years": _current_year}, (), _season_expiry("batting", "years"))
+    ),
+    ToolSpec(
+        name="player_recent_performance",
+        description="Get recent game performance for an MLB player",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "player_name": {
+                    "type": "string",
+                    "description": "Full name of the player"
+                },
+                "days": {
+                    "type": "integer",
+                    "description": "Number of days to look back (default 30)",
+                    "minimum": 1,
+                    "maximum": STATCAST_RETENTION_DAYS,
+                    "default": 30
+                }
+            },
+            "required": ["player_name"]
+        },
+        handler=_get_player_recent_stats_impl,
+        parameters=("player_name", "days"),
+        executor="statcast",
+        timeout=20,
+        cache=CacheRule({"days": 30}, (), _statcast_expiry)
+    ),
+    ToolSpec(
+        name="search_players",
+        description="Search for MLB players by name",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "search_term": {
+                    "type": "string",
+                    "description": "Partial name to search for"
+                }
+            },
+            "required": ["search_term"]
+        },
+        handler=_search_player_impl,
+        parameters=("search_term",),
+        timeout=15,
+        cache=CacheRule({}, (), _search_expiry)
+    ),
+    ToolSpec(
+        name="mlb_standings",
+        description="Get current MLB standings by division",
+        input_schema={
+            "type": "object",
+            "properties": {"year": _YEAR},
+            "required": []
+        },
+        handler=get_standings,
+        parameters=("year",),
+        timeout=30,
+        cache=CacheRule({"year": _current_year}, (), _season_expiry("standings")),
+        stream=stream_standings
+    ),
+    ToolSpec(
+        name="stat_leaders",
+        description="Get MLB leaders for a specific statistic",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "stat": {
+                    "type": "string",
+                    "description": "Statistic to rank by (e.g., 'HR', 'AVG', 'ERA', 'SO')"
+                },
+                "year": _YEAR,
+                "top_n": {
+                    "type": "integer",
+                    "description": "Number of top players to return (default 10)",
+                    "minimum": 1,
+                    "maximum": 50,
+                    "default": 10
+                },
+                "player_type": {
+                    "type": "string",
+                    "description": "Type of player statistics",
+                    "enum": ["batting", "pitching"],
+                    "default": "batting"
+                }
+            },
+            "required": ["stat"]
+        },
+        handler=get_league_leaders,
+        parameters=("stat", "year", "top_n", "player_type"),
+        timeout=30,
+        cache=CacheRule(
+            {"year": _current_year, "top_n": 10, "player_type": "batting"},
+            ("player_type",),
+            _season_expiry("batting")
+        ),
+        stream=stream_league_leaders
+    ),
+    ToolSpec(
+        name="team_statistics",
+        description="Get aggregate statistics for an MLB team, or for every team with team_name 'all'",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "team_name": {
+                    "type": "string",
+                    "description": "Team name or abbreviation (e.g., 'Yankees', 'NYY'), or 'all' for every team"
+                },
+                "year": _YEAR
+            },
+            "required": ["team_name"]
+        },
+        handler=get_team_stats,
+        parameters=("team_name", "year"),
+        timeout=30,
+        cache=CacheRule({"year": _current_year}, (), _season_expiry("batting"))
+    ),
+    ToolSpec(
+        name="clear_stats_cache",
+        description="Clear the statistics cache to force fresh data retrieval",
+        input_schema=_NO_ARGUMENTS,
+        handler=_clear_stats_cache
+    ),
+    ToolSpec(
+        name="health_check",
+        description="Check if the PyBaseball MCP server is running properly",
+        input_schema=_NO_ARGUMENTS,
+        handler=_health_check
+    ),
+]
+
+# Shared by every server; validators are compiled here, at import
+TOOL_REGISTRY = ToolRegistry(TOOL_SPECS)
@@ -0,0 +1,281 @@
+"""
+Request tracing for PyBaseball MCP Server.
+Spans mark the phases of a tool call (lookup, fetch, aggregate, serialize,
+transport). They are linked through a context variable, which run_blocking
+carries into worker threads, and written to a local JSONL file with one
+OpenTelemetry (OTLP JSON) span object per line. The HTTP transport also
+sums each request's spans by phase into a Server-Timing header.
+"""
+import atexit
+import contextvars
+import logging
+import os
+import queue
+import secrets
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .encoding import dumpb
+
+logger = logging.getLogger(__name__)
+
+# JSONL file spans are exported to (off unless set, e.g. to
+# ~/.pybaseball/mcp/traces.jsonl), and its size before it is rotated
+TRACE_FILE = os.environ.get("PYBASEBALL_MCP_TRACE_FILE", "")
+TRACE_FILE_MAX_BYTES = int(os.environ.get("PYBASEBALL_MCP_TRACE_FILE_MB", 64)) * 1024 * 1024
+# Finished spans buffered before a write when their trace is still open
+TRACE_BUFFER_SPANS = 256
+# Batches of spans waiting for the writer thread before new ones are dropped
+TRACE_QUEUE_BATCHES = 1024
+
+SERVICE_NAME = "pybaseball-mcp"
+
+# OTLP span kinds and status codes
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+# Order phases are listed in Server-Timing
+PHASES = ("lookup", "fetch", "aggregate", "serialize", "tool", "transport")
+
+_current_span = contextvars.ContextVar("pybaseball_mcp_span", default=None)
+
+
+class Trace:
+    """Spans of one request, shared by every span in it."""
+
+    __slots__ = ("trace_id", "spans")
+
+    def __init__(self):
+        self.trace_id = secrets.token_hex(16)
+        self.spans = []
+
+    def phase_durations(self) -> Dict[str, float]:
+        """
+        Milliseconds spent in each phase by the finished spans.
+
+        A span nested in a span of the same phase is not counted again.
+        """
+        totals = {}
+        for span in self.spans:
+            if span.phase and span.counted:
+                totals[span.phase] = totals.get(span.phase, 0.0) + span.duration_ms
+        return totals
+
+
+class span:
+    """
+    Context manager recording one span of the current trace.
+
+    Starts a new trace when there is no current span.
+
+    Args:
+        name: Span name (e.g. "fetch.frame")
+        phase: Phase the time is counted under in Server-Timing
+        kind: OTLP span kind
+        **attributes: Span attributes
+    """
+
+    __slots__ = ("name", "phase", "kind", "attributes", "trace", "span_id", "parent", "counted",
+                 "start_ns", "end_ns", "status", "message", "_start", "duration_ms", "_token")
+
+    def __init__(self, name: str, phase: str = None, kind: int = SPAN_KIND_INTERNAL, **attributes):
+        self.name = name
+        self.phase = phase
+        self.kind = kind
+        self.attributes = attributes
+        self.status = STATUS_OK
+        self.message = None
+        self.end_ns = None
+        self.duration_ms = None
+
+    def set(self, key: str, value: Any):
+        """Set an attribute of the span."""
+        self.attributes[key] = value
+
+    @property
+    def context_phase(self) -> Optional[str]:
+        """Phase of this span or of its closest ancestor with one."""
+        node = self
+        while node is not None:
+            if node.phase:
+                return node.phase
+            node = node.parent
+        return None
+
+    def __enter__(self):
+        self.parent = _current_span.get()
+        self.trace = self.parent.trace if self.parent is not None else Trace()
+        self.span_id = secrets.token_hex(8)
+        self.counted = self.parent is None or self.parent.context_phase != self.phase
+        self.start_ns = time.time_ns()
+        self._start = time.perf_counter()
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.duration_ms = (time.perf_counter() - self._start) * 1000
+        self.end_ns = self.start_ns + int(self.duration_ms * 1_000_000)
+        if exc_type is not None:
+            self.status = STATUS_ERROR
+            self.message = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self._token)
+        self.trace.spans.append(self)
+        exporter.export(self)
+        return False
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """The span as an OTLP JSON span object."""
+        status = {"code": self.status}
+        if self.message:
+            status["message"] = self.message[:200]
+        attributes = dict(self.attributes)
+        if self.phase:
+            attributes["phase"] = self.phase
+        if self.parent is None:
+            attributes["service.name"] = SERVICE_NAME
+        return {
+            "traceId": self.trace.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent.span_id if self.parent is not None else "",
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": self.start_ns,
+            "endTimeUnixNano": self.end_ns,
+            "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()],
+            "status": status,
+        }
+
+
+def _otlp_value(value) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": value}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def current_span() -> Optional[span]:
+    """Get the innermost open span, or None outside a trace."""
+    return _current_span.get()
+
+
+def _descends_from(node: span, root: span) -> bool:
+    while node is not None:
+        if node is root:
+            return True
+        node = node.parent
+    return False
+
+
+def replay_spans(root: span, into: span) -> List[span]:
+    """
+    Copy a finished span and its descendants into another trace, under ``into``.
+
+    Coalesced calls run once, in the first caller's trace; the shared spans
+    are replayed into each other caller's trace so its Server-Timing and
+    exported spans show the same phases.
+
+    Returns:
+        The copies, in the order the originals finished
+    """
+    originals = [item for item in root.trace.spans if _descends_from(item, root)]
+    copies = {}
+    for original in originals:
+        copy = span(original.name, original.phase, original.kind, **original.attributes)
+        copy.trace = into.trace
+        copy.span_id = secrets.token_hex(8)
+        copy.start_ns, copy.end_ns, copy.duration_ms = original.start_ns, original.end_ns, original.duration_ms
+        copy.status, copy.message = original.status, original.message
+        copies[id(original)] = copy
+    for original in originals:
+        copy = copies[id(original)]
+        copy.parent = copies.get(id(original.parent), into)
+    for original in originals:
+        copy = copies[id(original)]
+        copy.counted = copy.parent.context_phase != copy.phase
+        into.trace.spans.append(copy)
+        exporter.export(copy)
+    replayed = [copies[id(original)] for original in originals]
+    if replayed:
+        replayed[-1].set("coalesced", True)
+    return replayed
+
+
+def server_timing(trace: Trace, total_ms: float = None) -> str:
+    """Format a trace's phase durations as a Server-Timing header value."""
+    durations = trace.phase_durations()
+    entries = [f"{phase};dur={durations[phase]:.1f}" for phase in PHASES if phase in durations]
+    entries.extend(f"{phase};dur={value:.1f}" for phase, value in durations.items() if phase not in PHASES)
+    if total_ms is not None:
+        entries.append(f"total;dur={total_ms:.1f}")
+    return ", ".join(entries)
+
+
+class SpanExporter:
+    """
+    Appends finished spans to a JSONL file from a background thread.
+
+    Spans are buffered and handed to the writer when their trace's root span
+    ends (or the buffer fills), so request handlers never wait on file I/O.
+    The file is rotated to ``<name>.1`` past its size cap, which bounds disk
+    use to twice the cap; if the writer falls behind, new batches are dropped.
+    """
+
+    def __init__(self, path: str = TRACE_FILE, max_bytes: int = TRACE_FILE_MAX_BYTES):
+        self.path = Path(path) if path else None
+        self.max_bytes = max_bytes
+        self.dropped = 0
+        self._buffer: List[bytes] = []
+        self._lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=TRACE_QUEUE_BATCHES)
+        self._writer = None
+
+    def export(self, finished: span):
+        if self.path is None:
+            return
+        line = dumpb(finished.to_otlp(), "compact") + b"\n"
+        with self._lock:
+            self._buffer.append(line)
+            if finished.parent is not None and len(self._buffer) < TRACE_BUFFER_SPANS:
+                return
+            lines, self._buffer = self._buffer, []
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="span-exporter", daemon=True)
+                self._writer.start()
+        try:
+            self._queue.put_nowait((self.path, lines))
+        except queue.Full:
+            self.dropped += len(lines)
+
+    def flush(self):
+        """Wait until every span handed to the writer is in the file."""
+        if self._writer is not None:
+            self._queue.join()
+
+    def _write_loop(self):
+        while True:
+            path, lines = self._queue.get()
+            try:
+                self._write(path, lines)
+            except OSError as e:
+                logger.warning(f"Could not write spans to {path}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, path: Path, lines: List[bytes]):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists() and path.stat().st_size > self.max_bytes:
+            os.replace(path, path.with_name(path.name + ".1"))
+        with open(path, "ab") as f:
+            f.write(b"".join(lines))
+
+
+# Shared exporter used by every span
+exporter = SpanExporter()
+atexit.register(exporter.flush)
@@ -2,23 +2,24 @@
 Utility functions for PyBaseball MCP Server.
 Includes caching, formatting, and helper functions.
 """
-import json
 from datetime import datetime, timedelta
 from functools import lru_cache
 import logging
-import pybaseball as pyb
 import os
 from pathlib import Path
 import sys
 import contextlib
 import io
 
+from .encoding import dumps
+
 logger = logging.getLogger(__name__)
 
-# Simple in-memory cache with TTL
-_cache = {}
-_cache_timestamps = {}
-CACHE_TTL_SECONDS = 300  # 5 minutes
+# Local data files built by the server (player register, archives, cache tiers)
+MCP_DATA_DIR = Path(os.environ.get("PYBASEBALL_MCP_DATA_DIR", Path.home() / ".pybaseball" / "mcp"))
+
+# Cap on pybaseball's own on-disk cache, which otherwise grows without limit
+PYBASEBALL_CACHE_MAX_BYTES = int(os.environ.get("PYBASEBALL_CACHE_MAX_MB", 1024)) * 1024 * 1024
 
 @contextlib.contextmanager
 def suppress_stdout():
@@ -35,28 +36,137 @@ def suppress_stdout():
         # In non-MCP mode, just yield without suppression
         yield
 
+_cache_configured = False
+
+
 def setup_cache():
-    """Configure PyBaseball cache for better performance."""
-    # Enable caching
-    pyb.cache.enable()
+    """
+    Configure PyBaseball cache for better performance.
+
+    Runs once, when the first module that scrapes upstream is imported,
+    rather than at server start.
+    """
+    global _cache_configured
+    if _cache_configured:
+        return
+    _cache_configured = True
+    import pybaseball as pyb
+
+    # PyBaseball's disk cache covers the calls our own stores do not (e.g. the
+    # per-player Statcast fallback). Its records expire a fixed number of days
+    # after writing, so the season frame store forgets them before refetching
+    # a season the expiry policy still considers live.
+    if os.environ.get("PYBASEBALL_DISK_CACHE", "1") == "1":
+        pyb.cache.enable()
+        logger.info(f"PyBaseball cache enabled at: {pyb.cache.config.cache_directory}")
+    else:
+        pyb.cache.disable()
+        logger.info("PyBaseball disk cache disabled")
+
+    trim_pybaseball_cache()
+
+def _pybaseball_records(func_name: str = ""):
+    """
+    Yield (record file, CacheRecord) for PyBaseball's disk cache records.
+
+    Records that cannot be read are yielded with None: PyBaseball leaves a
+    truncated record behind when a call's arguments are not JSON serializable
+    (Statcast date ranges), and its own flush() and purge() fail on those.
+    """
+    import pybaseball as pyb
+    from pybaseball.cache.cache_record import CacheRecord
+
+    for record_file in Path(pyb.cache.config.cache_directory).glob(f"{func_name}*.cache_record.json"):
+        try:
+            yield record_file, CacheRecord(str(record_file))
+        except Exception:
+            yield record_file, None
+
+
+def _delete_record(record_file: Path, record):
+    if record is None:
+        record_file.unlink(missing_ok=True)
+    else:
+        record.delete()
+
+
+def forget_pybaseball_records(func_name: str, matches) -> int:
+    """
+    Delete PyBaseball's cached results of one function.
+
+    Args:
+        func_name: Name PyBaseball records the call under (e.g. "standings")
+        matches: Function of the recorded call ({"args": [...], "kwargs": {...}})
+            returning True for records to delete
+
+    Returns:
+        Number of records deleted
+    """
+    removed = 0
+    try:
+        for record_file, record in _pybaseball_records(func_name):
+            if record is not None and record.data.get("func") == func_name and matches(record.data):
+                record.delete()
+                removed += 1
+    except Exception as e:
+        logger.warning(f"Could not forget PyBaseball cache records of {func_name}: {e}")
+    return removed
+
+
+def trim_pybaseball_cache(max_bytes: int = None) -> int:
+    """
+    Keep PyBaseball's on-disk cache under a size cap.
     
-    # Set cache directory to a specific location
-    cache_dir = Path.home() / ".pybaseball" / "cache"
-    cache_dir.mkdir(parents=True, exist_ok=True)
+    Expired and unreadable records are removed first, then the least recently
+    written records until the cache fits.
     
-    # Configure cache settings if available
+    Returns:
+        Number of records removed
+    """
+    max_bytes = PYBASEBALL_CACHE_MAX_BYTES if max_bytes is None else max_bytes
     try:
-        # Set cache expiry to 1 day for better performance
-        pyb.cache.config.cache_expiry = 86400  # 24 hours in seconds
-        logger.info(f"PyBaseball cache configured at: {cache_dir}")
-    except AttributeError:
-        # Older versions might not have these settings
-        logger.info("PyBaseball cache enabled with default settings")
+        records = []
+        total = 0
+        removed = 0
+        for record_file, record in _pybaseball_records():
+            if record is None or record.expired:
+                _delete_record(record_file, record)
+                removed += 1
+                continue
+            data_file = Path(record.data.get("dataframe", ""))
+            size = data_file.stat().st_size if data_file.is_file() else 0
+            records.append((data_file.stat().st_mtime if size else 0, size, record))
+            total += size
+        for _, size, record in sorted(records, key=lambda item: item[0]):
+            if total <= max_bytes:
+                break
+            record.delete()
+            total -= size
+            removed += 1
+        if removed:
+            logger.info(f"Trimmed {removed} PyBaseball cache records to stay under {max_bytes} bytes")
+        return removed
+    except Exception as e:
+        logger.warning(f"Could not trim PyBaseball cache: {e}")
+        return 0
 
 def clear_cache():
-    """Clear the PyBaseball cache."""
+    """
+    Clear the PyBaseball cache, the in-process season frame store, the
+    Statcast partitions and the player register and search indexes.
+    """
+    from .frames import season_frames
+    from .register import player_register
+    from .search import clear_search_index
+    from .statcast_store import statcast_store
+
     try:
-        pyb.cache.purge()
+        season_frames.clear()
+        statcast_store.clear()
+        player_register.clear()
+        clear_search_index()
+        for record_file, record in _pybaseball_records():
+            _delete_record(record_file, record)
         logger.info("PyBaseball cache cleared")
     except Exception as e:
         logger.error(f"Error clearing cache: {e}")
@@ -64,45 +174,35 @@ def clear_cache():
 
 def get_cache_info():
     """Get information about the cache status."""
+    import pybaseball as pyb
+    from .frames import season_frames
+
     try:
-        enabled = pyb.cache.is_enabled()
+        enabled = pyb.cache.config.enabled
         return {
             "enabled": enabled,
             "cache_directory": str(pyb.cache.config.cache_directory) if hasattr(pyb.cache.config, 'cache_directory') else "Default",
+            "season_frames": season_frames.stats(),
         }
     except Exception as e:
         logger.error(f"Error getting cache info: {e}")
         return {"enabled": False, "error": str(e)}
 
-def get_cached_result(key: str):
-    """Get cached result if still valid."""
-    if key in _cache and key in _cache_timestamps:
-        if datetime.now() - _cache_timestamps[key] < timedelta(seconds=CACHE_TTL_SECONDS):
-            logger.debug(f"Cache hit for key: {key}")
-            return _cache[key]
-    return None
-
-def set_cached_result(key: str, value: any):
-    """Store result in cache."""
-    _cache[key] = value
-    _cache_timestamps[key] = datetime.now()
-    logger.debug(f"Cached result for key: {key}")
-
 def format_error(error_msg: str) -> str:
     """Format error messages consistently."""
-    return json.dumps({
+    return dumps({
         "error": True,
         "message": error_msg,
         "timestamp": datetime.now().isoformat()
-    }, indent=2)
+    })
 
 def format_success(data: dict) -> str:
     """Format successful responses consistently."""
-    return json.dumps({
+    return dumps({
         "success": True,
         "data": data,
         "timestamp": datetime.now().isoformat()
-    }, indent=2)
+    })
 
 @lru_cache(maxsize=100)
 def normalize_team_name(team: str) -> str:
@@ -138,7 +238,10 @@ def normalize_team_name(team: str) -> str:
         "tampa bay rays": "TB", "rays": "TB",
         "texas rangers": "TEX", "rangers": "TEX",
         "toronto blue jays": "TOR", "blue jays": "TOR", "jays": "TOR",
-        "washington nationals": "WSH", "nationals": "WSH", "nats": "WSH"
+        "washington nationals": "WSH", "nationals": "WSH", "nats": "WSH",
+        # FanGraphs / Baseball-Reference codes that differ from the standard ones
+        "sdp": "SD", "sfg": "SF", "tbr": "TB", "kcr": "KC", "wsn": "WSH", "was": "WSH",
+        "cws": "CHW", "ana": "LAA", "fla": "MIA", "ath": "OAK"
     }
     
     # Try to find team in map
@@ -186,6 +289,3 @@ def parse_date_range(date_str: str) -> tuple:
             start_date = end_date - timedelta(days=30)
             
     return start_date, end_date
-
-# Initialize cache on import
-setup_cache()
\ No newline at end of file
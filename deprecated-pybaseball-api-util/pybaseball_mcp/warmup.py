@@ -0,0 +1,219 @@
+"""
+Background warmup for PyBaseball MCP Server.
+Preloads the current season's FanGraphs frames, the standings and the player
+register when a server starts, then refreshes them ahead of expiry so user
+requests are served from warm data instead of waiting on a cold scrape.
+
+Each dataset is a job on its own schedule: runs are spaced by the refresh
+interval with random jitter, and failures are retried with exponential
+backoff. Jobs run on the "warmup" executor, away from the request pools.
+"""
+import asyncio
+import logging
+import os
+import random
+import time
+from datetime import datetime
+from typing import Any, Callable, List, NamedTuple, Optional
+
+from .executor import run_blocking
+
+logger = logging.getLogger(__name__)
+
+WARMUP_ENABLED = os.environ.get("PYBASEBALL_MCP_WARMUP", "1") != "0"
+# Seconds between refresh checks of each dataset
+WARMUP_INTERVAL_SECONDS = float(os.environ.get("PYBASEBALL_MCP_WARMUP_INTERVAL", 600))
+# Fraction of the interval each run is randomly moved by
+WARMUP_JITTER = float(os.environ.get("PYBASEBALL_MCP_WARMUP_JITTER", 0.1))
+# First retry delay after a failure, doubled per consecutive failure up to the maximum
+WARMUP_BACKOFF_SECONDS = float(os.environ.get("PYBASEBALL_MCP_WARMUP_BACKOFF", 30))
+WARMUP_MAX_BACKOFF_SECONDS = float(os.environ.get("PYBASEBALL_MCP_WARMUP_MAX_BACKOFF", 1800))
+# Seconds after server start before the first run, so the handshake is answered before heavy imports begin
+WARMUP_START_DELAY_SECONDS = float(os.environ.get("PYBASEBALL_MCP_WARMUP_DELAY", 2))
+# Extra time a frame must stay fresh past the next run, covering the upstream fetch itself
+WARMUP_REFRESH_MARGIN_SECONDS = 120
+
+
+class WarmupJob(NamedTuple):
+    """
+    A dataset kept warm by the scheduler.
+
+    Args:
+        name: Job name used in logs and status
+        run: Blocking callable that loads or refreshes the dataset
+        interval: Seconds between runs (defaults to the scheduler interval)
+    """
+    name: str
+    run: Callable[[], Any]
+    interval: Optional[float] = None
+
+
+class JobStatus:
+    """Run history of one job."""
+
+    def __init__(self):
+        self.runs = 0
+        self.failures = 0
+        self.last_success = None
+        self.last_error = None
+        self.next_run = None
+
+    def to_dict(self) -> dict:
+        return {
+            "runs": self.runs,
+            "consecutive_failures": self.failures,
+            "last_success": self.last_success,
+            "last_error": self.last_error,
+            "next_run_in": None if self.next_run is None else max(0.0, round(self.next_run - time.time(), 1)),
+        }
+
+
+class WarmupScheduler:
+    """
+    Runs warmup jobs in the background of a server's event loop.
+
+    Args:
+        jobs: Jobs to run; each starts after ``start_delay`` and then repeats
+        interval: Default seconds between runs of a job
+        jitter: Fraction of the delay each run is randomly moved by
+        backoff: First retry delay after a failure
+        max_backoff: Largest retry delay
+        executor: Executor class the jobs run on
+        start_delay: Seconds to wait before the first run
+    """
+
+    def __init__(self, jobs: List[WarmupJob], interval: float = WARMUP_INTERVAL_SECONDS,
+                 jitter: float = WARMUP_JITTER, backoff: float = WARMUP_BACKOFF_SECONDS,
+                 max_backoff: float = WARMUP_MAX_BACKOFF_SECONDS, executor: str = "warmup",
+                 start_delay: float = WARMUP_START_DELAY_SECONDS):
+        self.jobs = list(jobs)
+        self.start_delay = start_delay
+        self.interval = interval
+        self.jitter = jitter
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.executor = executor
+        self.status = {job.name: JobStatus() for job in self.jobs}
+        self._tasks = []
+        self._random = random.Random()
+
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+
+    def start(self):
+        """Start every job on the running event loop."""
+        if self.running:
+            return
+        self._tasks = [asyncio.create_task(self._run_job(job), name=f"warmup-{job.name}") for job in self.jobs]
+        logger.info(f"Warmup started: {', '.join(job.name for job in self.jobs)}")
+
+    async def stop(self):
+        """Cancel every job and wait for them to finish."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def jittered(self, delay: float) -> float:
+        """Move a delay randomly by up to ``jitter`` of its length."""
+        return max(0.0, delay * (1 + self._random.uniform(-self.jitter, self.jitter)))
+
+    def retry_delay(self, failures: int) -> float:
+        """Delay before the next attempt after ``failures`` consecutive failures."""
+        return self.jittered(min(self.max_backoff, self.backoff * 2 ** (failures - 1)))
+
+    async def run_once(self, job: WarmupJob) -> float:
+        """
+        Run a job once.
+
+        Returns:
+            Seconds until the job should run again
+        """
+        status = self.status[job.name]
+        status.runs += 1
+        start = time.perf_counter()
+        try:
+            result = await run_blocking(job.run, executor=self.executor)
+        except Exception as e:
+            status.failures += 1
+            status.last_error = str(e)[:200]
+            delay = self.retry_delay(status.failures)
+            logger.warning(f"Warmup '{job.name}' failed ({status.failures} in a row), retrying in {delay:.0f}s: {e}")
+        else:
+            status.failures = 0
+            status.last_error = None
+            status.last_success = datetime.now().isoformat(timespec="seconds")
+            delay = self.jittered(job.interval or self.interval)
+            if result:
+                logger.info(f"Warmup '{job.name}' loaded in {time.perf_counter() - start:.1f}s")
+        status.next_run = time.time() + delay
+        return delay
+
+    async def _run_job(self, job: WarmupJob):
+        await asyncio.sleep(self.start_delay)
+        while True:
+            delay = await self.run_once(job)
+            await asyncio.sleep(delay)
+
+    def stats(self) -> dict:
+        return {"running": self.running, "jobs": {name: status.to_dict() for name, status in self.status.items()}}
+
+
+def default_jobs(interval: float = WARMUP_INTERVAL_SECONDS, jitter: float = WARMUP_JITTER) -> List[WarmupJob]:
+    """
+    Jobs for the datasets every tool depends on.
+
+    Frames are reloaded when they would otherwise expire before the job's
+    next run, so the shared copy is replaced before any reader finds it gone.
+    """
+    ahead = interval * (1 + jitter) + WARMUP_REFRESH_MARGIN_SECONDS
+
+    # The data modules are imported by the jobs themselves, on the warmup executor
+    def frame_job(kind: str, qual: Optional[int]):
+        def run():
+            from .frames import season_frames
+            return season_frames.refresh(kind, datetime.now().year, qual, ahead=ahead)
+        return run
+
+    def register_job():
+        from .register import player_register
+        from .search import get_search_index
+
+        loaded = player_register.refresh()
+        get_search_index()
+        return loaded
+
+    return [
+        WarmupJob("register", register_job, interval),
+        WarmupJob("batting", frame_job("batting", 1), interval),
+        WarmupJob("pitching", frame_job("pitching", 1), interval),
+        WarmupJob("standings", frame_job("standings", None), interval),
+    ]
+
+
+_scheduler = None
+
+
+def get_warmup_scheduler() -> WarmupScheduler:
+    """Get the shared scheduler with the default jobs."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = WarmupScheduler(default_jobs())
+    return _scheduler
+
+
+def start_warmup() -> Optional[WarmupScheduler]:
+    """Start the shared scheduler on the running event loop (disable with PYBASEBALL_MCP_WARMUP=0)."""
+    if not WARMUP_ENABLED:
+        logger.info("Background warmup disabled")
+        return None
+    scheduler = get_warmup_scheduler()
+    scheduler.start()
+    return scheduler
+
+
+async def stop_warmup():
+    """Stop the shared scheduler if it is running."""
+    if _scheduler is not None:
+        await _scheduler.stop()
@@ -4,7 +4,8 @@ import os
 import sys
 import logging
 import asyncio
-from typing import Any, Sequence
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional, Sequence
 
 # Import MCP Server components - using native patterns
 from mcp.server import Server
@@ -18,31 +19,37 @@ class ErrorCode(Enum):
     TOOL_NOT_FOUND = "tool_not_found"
     INTERNAL_ERROR = "internal_error"
 
-# FastAPI for HTTP transport
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+# Every tool is declared once in pybaseball_mcp.tools; implementations are
+# loaded on first use, so initialize and tools/list never wait for them
+from pybaseball_mcp.lazy import package_version
+from pybaseball_mcp.tools import TOOL_REGISTRY, on_cache_clear
 
-# Import our modules
-from pybaseball_mcp.players import (
-    get_player_stats,
-    get_player_recent_stats,
-    search_player
+from pybaseball_mcp.coalesce import SingleFlight, call_key
+from pybaseball_mcp.response_cache import ResponseCache
+from pybaseball_mcp.executor import run_blocking, shutdown_executors
+from pybaseball_mcp.metrics import TOOL_CALLS, render_metrics, start_metrics_dump, stop_metrics_dump, track_tool
+from pybaseball_mcp.tracing import span
+from pybaseball_mcp.warmup import get_warmup_scheduler, start_warmup, stop_warmup
+from pybaseball_mcp.streaming import RowStream, stream_json_object
+from pybaseball_mcp.encoding import (
+    HTTP_ENCODING_MODE,
+    STDIO_ENCODING_MODE,
+    dumpb,
+    dumps,
+    encoding_mode,
+    set_encoding_mode
 )
-from pybaseball_mcp.teams import (
-    get_standings,
-    get_league_leaders,
-    get_team_stats
-)
-from pybaseball_mcp.utils import clear_cache, get_cache_info
-
-# For HTTP server deployment
-import uvicorn
 
 # --- Configuration ---
 MCP_STDIO_MODE = os.environ.get("MCP_STDIO_MODE", "0") == "1"
 PORT = int(os.environ.get("PORT", 8000))
 HOST = "0.0.0.0"
 
+# Encoded HTTP responses, shared by the REST and JSON-RPC routes; cached
+# tools and their rules come from the registry
+response_cache = ResponseCache(TOOL_REGISTRY.cache_rules())
+on_cache_clear(response_cache.clear)
+
 # --- Logging Setup ---
 log_stream = sys.stderr if MCP_STDIO_MODE else sys.stdout
 logging.basicConfig(
@@ -57,188 +64,64 @@ server = Server("pybaseball-stats")
 
 @server.list_tools()
 async def handle_list_tools() -> list[Tool]:
-    """List available tools."""
-    return [
-        Tool(
-            name="player_stats",
-            description="Get season statistics for a specific MLB player",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "player_name": {
-                        "type": "string",
-                        "description": "Full name of the player (e.g., 'Shohei Ohtani')"
-                    },
-                    "year": {
-                        "type": "integer",
-                        "description": "Season year (defaults to current year)",
-                        "minimum": 1871
-                    }
-                },
-                "required": ["player_name"]
-            }
-        ),
-        Tool(
-            name="player_recent_performance",
-            description="Get recent game performance for an MLB player",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "player_name": {
-                        "type": "string",
-                        "description": "Full name of the player"
-                    },
-                    "days": {
-                        "type": "integer",
-                        "description": "Number of days to look back (default 30)",
-                        "minimum": 1,
-                        "maximum": 365,
-                        "default": 30
-                    }
-                },
-                "required": ["player_name"]
-            }
-        ),
-        Tool(
-            name="search_players",
-            description="Search for MLB players by name",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "search_term": {
-                        "type": "string",
-                        "description": "Partial name to search for"
-                    }
-                },
-                "required": ["search_term"]
-            }
-        ),
-        Tool(
-            name="mlb_standings",
-            description="Get current MLB standings by division",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "year": {
-                        "type": "integer",
-                        "description": "Season year (defaults to current year)",
-                        "minimum": 1871
-                    }
-                },
-                "required": []
-            }
-        ),
-        Tool(
-            name="stat_leaders",
-            description="Get MLB leaders for a specific statistic",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "stat": {
-                        "type": "string",
-                        "description": "Statistic to rank by (e.g., 'HR', 'AVG', 'ERA', 'SO')"
-                    },
-                    "year": {
-                        "type": "integer",
-                        "description": "Season year (defaults to current year)",
-                        "minimum": 1871
-                    },
-                    "top_n": {
-                        "type": "integer",
-                        "description": "Number of top players to return (default 10)",
-                        "minimum": 1,
-                        "maximum": 50,
-                        "default": 10
-                    },
-                    "player_type": {
-                        "type": "string",
-                        "description": "Type of player statistics",
-                        "enum": ["batting", "pitching"],
-                        "default": "batting"
-                    }
-                },
-                "required": ["stat"]
-            }
-        ),
-        Tool(
-            name="team_statistics",
-            description="Get aggregate statistics for an MLB team",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "team_name": {
-                        "type": "string",
-                        "description": "Team name or abbreviation (e.g., 'Yankees', 'NYY')"
-                    },
-                    "year": {
-                        "type": "integer",
-                        "description": "Season year (defaults to current year)",
-                        "minimum": 1871
-                    }
-                },
-                "required": ["team_name"]
-            }
-        ),
-        Tool(
-            name="clear_stats_cache",
-            description="Clear the statistics cache to force fresh data retrieval",
-            inputSchema={"type": "object", "properties": {}, "required": []}
-        ),
-        Tool(
-            name="health_check",
-            description="Check if the PyBaseball MCP server is running properly",
-            inputSchema={"type": "object", "properties": {}, "required": []}
-        )
-    ]
+    """List available tools (built once by the registry)."""
+    return TOOL_REGISTRY.tools()
+
+# Identical concurrent tool calls share one execution
+_inflight_calls = SingleFlight()
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict[str, Any]) -> Sequence[TextContent | ErrorData]:
-    """Handle tool calls."""
+    """Handle tool calls, coalescing identical concurrent requests."""
     logger.info(f"Tool call: {name} with args: {arguments}")
+    arguments = arguments or {}
+    return await _inflight_calls.do(
+        call_key(name, arguments, encoding_mode()),
+        lambda: _dispatch_tool(name, arguments)
+    )
+
+async def _run_tool(spec, func, *args):
+    """Run a blocking tool implementation on its executor without blocking the event loop."""
+    with track_tool(spec.name) as call, span(f"tool.{spec.name}", phase="tool", tool=spec.name) as tool_span:
+        try:
+            result = await run_blocking(func, *args, executor=spec.executor, timeout=spec.timeout)
+        except asyncio.TimeoutError:
+            call.outcome = "timeout"
+            tool_span.set("timeout", True)
+            logger.error(f"Tool {spec.name} timed out after {spec.timeout} seconds")
+            return f"Error: Request timed out after {spec.timeout} seconds. Please try again later."
+        if isinstance(result, str) and result.startswith("Error"):
+            call.outcome = "error"
+        return result
+
+async def _dispatch_tool(name: str, arguments: dict[str, Any]) -> Sequence[TextContent | ErrorData]:
+    """Run a single tool call."""
+    spec = TOOL_REGISTRY.get(name)
     try:
-        if name == "player_stats":
-            result = get_player_stats(
-                arguments.get("player_name"),
-                arguments.get("year")
-            )
-        elif name == "player_recent_performance":
-            result = get_player_recent_stats(
-                arguments.get("player_name"),
-                arguments.get("days", 30)
-            )
-        elif name == "search_players":
-            result = search_player(arguments.get("search_term"))
-        elif name == "mlb_standings":
-            result = get_standings(arguments.get("year"))
-        elif name == "stat_leaders":
-            result = get_league_leaders(
-                arguments.get("stat"),
-                arguments.get("year"),
-                arguments.get("top_n", 10),
-                arguments.get("player_type", "batting")
-            )
-        elif name == "team_statistics":
-            result = get_team_stats(
-                arguments.get("team_name"),
-                arguments.get("year")
-            )
-        elif name == "clear_stats_cache":
-            clear_cache()
-            result = "Statistics cache cleared successfully"
-        elif name == "health_check":
-            import pybaseball
-            result = f"PyBaseball MCP Server is running. PyBaseball version: {pybaseball.__version__}"
-        else:
+        if spec is None:
             logger.warning(f"Unknown tool called: {name}")
             return [ErrorData(
-                type="error", 
-                error={"code": ErrorCode.TOOL_NOT_FOUND.value, 
+                type="error",
+                error={"code": ErrorCode.TOOL_NOT_FOUND.value,
                        "message": f"Unknown tool: {name}"}
             )]
-        
+
+        invalid = TOOL_REGISTRY.validate(name, arguments)
+        if invalid:
+            logger.warning(f"Invalid arguments for tool {name}: {invalid}")
+            TOOL_CALLS.inc(tool=name, outcome="invalid")
+            result = f"Error: Invalid arguments for {name}: {invalid}"
+        else:
+            result = await _run_tool(spec, spec.handler, *TOOL_REGISTRY.call_args(spec, arguments))
+
         logger.info(f"Tool {name} result: {str(result)[:200]}...")
-        return [TextContent(type="text", text=str(result))]
-    
+        if isinstance(result, str):
+            text = result
+        else:
+            with span("serialize.result", phase="serialize"):
+                text = dumps(result)
+        return [TextContent(type="text", text=text)]
+
     except Exception as e:
         logger.error(f"Error calling tool {name}: {e}", exc_info=True)
         return [ErrorData(
@@ -247,60 +130,130 @@ async def handle_call_tool(name: str, arguments: dict[str, Any]) -> Sequence[Tex
                   "message": f"Error executing tool {name}: {str(e)}"}
         )]
 
+async def _single_chunk(data: bytes) -> AsyncIterator[bytes]:
+    yield data
+
+async def handle_stream_tool(name: str, arguments: dict[str, Any]) -> Optional[AsyncIterator[bytes]]:
+    """
+    Start a streaming tool call for the HTTP transport.
+
+    Returns:
+        Async iterator of the JSON-encoded result, produced row by row, or
+        None if the tool does not stream
+    """
+    spec = TOOL_REGISTRY.get(name)
+    if spec is None or spec.stream is None:
+        return None
+    logger.info(f"Streaming tool call: {name} with args: {arguments}")
+    invalid = TOOL_REGISTRY.validate(name, arguments)
+    if invalid:
+        return _single_chunk(dumpb(f"Error: Invalid arguments for {name}: {invalid}"))
+    result = await _run_tool(spec, spec.stream, *TOOL_REGISTRY.call_args(spec, arguments))
+    if isinstance(result, RowStream):
+        return stream_json_object(result, executor=spec.executor)
+    return _single_chunk(dumpb(result))
+
 # --- Transport Layer: STDIO ---
 async def run_stdio_server():
     """Runs the MCP server over STDIO using native patterns."""
     logger.info("Starting PyBaseball MCP Server in STDIO mode...")
+    set_encoding_mode(STDIO_ENCODING_MODE)
+    start_warmup()
+    # No HTTP endpoint to scrape: metrics go to PYBASEBALL_MCP_METRICS_FILE
+    start_metrics_dump()
     
-    async with stdio_server() as (read_stream, write_stream):
-        # Create initialization options with updated protocol version
-        init_options = server.create_initialization_options()
-        init_options.protocolVersion = "2025-03-26"  # March 2025 spec
-        
-        await server.run(
-            read_stream,
-            write_stream,
-            init_options
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            # Create initialization options with updated protocol version
+            init_options = server.create_initialization_options()
+            init_options.protocolVersion = "2025-03-26"  # March 2025 spec
+            
+            await server.run(
+                read_stream,
+                write_stream,
+                init_options
+            )
+    finally:
+        await stop_warmup()
+        await stop_metrics_dump()
 
 # --- Transport Layer: Streamable HTTP ---
-# Create FastAPI app for HTTP transport
-http_app = FastAPI(
-    title="PyBaseball MCP Server",
-    description="MLB statistics via Model Context Protocol over Streamable HTTP",
-    version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc"
-)
+@asynccontextmanager
+async def http_lifespan(app):
+    """Preload and keep refreshing hot datasets while the HTTP server runs."""
+    start_warmup()
+    try:
+        yield
+    finally:
+        await stop_warmup()
 
-# Import streamable HTTP implementation
-from streamable_http import register_streamable_http_routes
+def create_http_app():
+    """Build the FastAPI app for the Streamable HTTP transport (FastAPI is imported only here)."""
+    from fastapi import FastAPI
+    from fastapi.responses import JSONResponse, PlainTextResponse
 
-# Register streamable HTTP routes that comply with March 2025 specification
-register_streamable_http_routes(http_app, handle_call_tool, handle_list_tools)
+    from compression import configure_compression
+    from streamable_http import configure_encoding, configure_server_timing, register_streamable_http_routes
 
-@http_app.get("/", response_class=JSONResponse)
-async def root():
-    """Root endpoint."""
-    return JSONResponse(
-        content={"message": "PyBaseball MCP Server", "transport": "Streamable HTTP"},
-        headers={"Content-Type": "application/json"}
+    app = FastAPI(
+        title="PyBaseball MCP Server",
+        description="MLB statistics via Model Context Protocol over Streamable HTTP",
+        version="1.0.0",
+        docs_url="/docs",
+        redoc_url="/redoc",
+        lifespan=http_lifespan
     )
 
-@http_app.get("/health", response_class=JSONResponse)
-async def health_check():
-    """Health check endpoint."""
-    import pybaseball
-    return JSONResponse(
-        content={
-            "status": "healthy", 
-            "server": "pybaseball-mcp", 
-            "version": pybaseball.__version__,
-            "protocol": "Streamable HTTP",
-            "protocol_version": "2025-03-26"
-        },
-        headers={"Content-Type": "application/json"}
+    # Register streamable HTTP routes that comply with March 2025 specification
+    register_streamable_http_routes(
+        app, handle_call_tool, handle_list_tools, handle_stream_tool, response_cache, TOOL_REGISTRY
     )
+    configure_encoding(app, HTTP_ENCODING_MODE)
+
+    # Compress large responses (gzip, or zstd/brotli when installed)
+    configure_compression(app)
+
+    # Outermost, so every response (compressed or not) gets its phase timings
+    configure_server_timing(app)
+
+    @app.get("/", response_class=JSONResponse)
+    async def root():
+        """Root endpoint."""
+        return JSONResponse(
+            content={"message": "PyBaseball MCP Server", "transport": "Streamable HTTP"},
+            headers={"Content-Type": "application/json"}
+        )
+
+    @app.get("/health", response_class=JSONResponse)
+    async def health_check():
+        """Health check endpoint."""
+        return JSONResponse(
+            content={
+                "status": "healthy", 
+                "server": "pybaseball-mcp", 
+                "version": package_version("pybaseball"),
+                "protocol": "Streamable HTTP",
+                "protocol_version": "2025-03-26",
+                "warmup": get_warmup_scheduler().stats()
+            },
+            headers={"Content-Type": "application/json"}
+        )
+
+    @app.get("/metrics", response_class=PlainTextResponse)
+    async def metrics():
+        """Prometheus metrics endpoint."""
+        return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+    return app
+
+
+def __getattr__(name):
+    # `http_app` is built on first access, so STDIO mode never imports FastAPI
+    if name == "http_app":
+        global http_app
+        http_app = create_http_app()
+        return http_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # --- Main Execution ---
 if __name__ == "__main__":
@@ -311,6 +264,7 @@ if __name__ == "__main__":
         except KeyboardInterrupt:
             logger.info("STDIO server shutdown requested.")
         finally:
+            shutdown_executors()
             logger.info("STDIO server exiting.")
     else:
         # Run in Streamable HTTP mode using native MCP ASGI app
@@ -319,12 +273,14 @@ if __name__ == "__main__":
         logger.info("Cloudflare deployment ready with chunked transfer encoding support.")
         
         # Use Uvicorn with proper settings for Streamable HTTP
+        import uvicorn
         uvicorn.run(
-            http_app,
+            create_http_app(),
             host=HOST,
             port=PORT,
             log_level="info",
             timeout_keep_alive=120,  # Longer keep-alive for streaming connections
             h11_max_incomplete_event_size=0  # No limit on event size for streaming
         )
+        shutdown_executors()
         logger.info("Streamable HTTP server exiting.")
@@ -6,14 +6,24 @@ https://developers.cloudflare.com/agents/guides/remote-mcp-server/
 """
 from fastapi import FastAPI, Request, Response
 from fastapi.responses import StreamingResponse, JSONResponse
-from typing import AsyncGenerator, Dict, Any, List
+from typing import AsyncGenerator, AsyncIterator, Dict, Any, List, Optional
 import json
 import logging
 import asyncio
+import os
+import time
 from starlette.middleware.cors import CORSMiddleware
 
+from pybaseball_mcp.encoding import dumpb, encoding_mode, reset_encoding_mode, set_encoding_mode
+from pybaseball_mcp.tracing import SPAN_KIND_SERVER, server_timing, span
+
 logger = logging.getLogger(__name__)
 
+# Calls from one JSON-RPC batch that may run at the same time
+JSONRPC_BATCH_CONCURRENCY = int(os.environ.get("PYBASEBALL_MCP_BATCH_CONCURRENCY", 8))
+# Largest number of calls accepted in one JSON-RPC batch
+JSONRPC_BATCH_MAX_SIZE = int(os.environ.get("PYBASEBALL_MCP_BATCH_MAX_SIZE", 100))
+
 def configure_cors(app: FastAPI):
     """Configure CORS for remote deployment compatibility."""
     app.add_middleware(
@@ -22,10 +32,68 @@ def configure_cors(app: FastAPI):
         allow_credentials=True,
         allow_methods=["*"],  # Allow all methods
         allow_headers=["*"],  # Allow all headers
-        expose_headers=["Transfer-Encoding"],  # Expose Transfer-Encoding header for streaming
+        expose_headers=["Transfer-Encoding", "ETag", "Cache-Control", "Server-Timing"],  # Streaming, caching and timing headers
     )
     logger.info("CORS configured for Streamable HTTP compatibility")
 
+class EncodingModeMiddleware:
+    """ASGI middleware selecting the JSON encoding mode for every HTTP request."""
+
+    def __init__(self, app, mode: str):
+        self.app = app
+        self.mode = mode
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = set_encoding_mode(self.mode)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            reset_encoding_mode(token)
+
+def configure_encoding(app: FastAPI, mode: str):
+    """Encode tool results for HTTP requests in the given mode ("compact" or "pretty")."""
+    app.add_middleware(EncodingModeMiddleware, mode=mode)
+    logger.info(f"HTTP responses encoded in {mode} JSON")
+
+class ServerTimingMiddleware:
+    """
+    ASGI middleware tracing every HTTP request.
+
+    The request is the root span of its trace (the "transport" phase); when
+    the response starts, the phases recorded so far are added to it as a
+    Server-Timing header.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        name = f"{scope['method']} {scope['path']}"
+        with span(name, phase="transport", kind=SPAN_KIND_SERVER,
+                  **{"http.method": scope["method"], "http.target": scope["path"]}) as request_span:
+            start = time.perf_counter()
+
+            async def send_with_timing(message):
+                if message["type"] == "http.response.start":
+                    request_span.set("http.status_code", message["status"])
+                    timing = server_timing(request_span.trace, (time.perf_counter() - start) * 1000)
+                    headers = list(message.get("headers", [])) + [(b"server-timing", timing.encode("latin-1"))]
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
+
+def configure_server_timing(app: FastAPI):
+    """Trace HTTP requests and report their phase durations in a Server-Timing header."""
+    app.add_middleware(ServerTimingMiddleware)
+    logger.info("Server-Timing headers enabled")
+
 async def streaming_json_response(result: Any) -> AsyncGenerator[bytes, None]:
     """Generate a streaming response following Streamable HTTP protocol."""
     # Start with a JSON object opening brace
@@ -37,17 +105,258 @@ async def streaming_json_response(result: Any) -> AsyncGenerator[bytes, None]:
     # Then stream the result field
     yield b'"result":'
     
-    # If the result is a string, wrap it in quotes
-    if isinstance(result, str):
-        yield f'"{result}"'.encode('utf-8')
-    else:
-        yield json.dumps(result).encode('utf-8')
+    yield dumpb(result)
     
     # End the JSON object
     yield b'}'
 
-def register_streamable_http_routes(app: FastAPI, handle_call_tool, handle_list_tools):
-    """Register Streamable HTTP compatible routes with the FastAPI app."""
+async def streaming_data_response(data_chunks: AsyncIterator[bytes]) -> AsyncGenerator[bytes, None]:
+    """Wrap an incrementally encoded tool result in the chunked response envelope."""
+    yield b'{"jsonrpc":"2.0","result":{"data":'
+    try:
+        async for chunk in data_chunks:
+            yield chunk
+    except Exception as e:
+        # Headers are already sent; the truncated body tells the client the stream failed
+        logger.error(f"Error while streaming tool result: {e}")
+        raise
+    yield b'}}'
+
+def wants_streamed_result(request: Request) -> bool:
+    """Check whether the client opted in to row streaming (``?stream=1``), where "data" is the JSON object itself."""
+    return request.query_params.get("stream", "").lower() in ("1", "true", "yes")
+
+async def stream_tool_call(handle_stream_tool, tool_name: str, arguments: Dict[str, Any],
+                           cache=None) -> Optional[StreamingResponse]:
+    """
+    Run a tool call through the row-streaming path.
+
+    ``cache`` is an optional (response_cache, key) pair; the streamed result
+    is stored there once it completes.
+
+    Returns:
+        StreamingResponse whose "data" member is the tool's JSON result,
+        written row by row, or None if the tool does not stream
+    """
+    try:
+        data_chunks = await handle_stream_tool(tool_name, arguments)
+    except Exception as e:
+        logger.error(f"Error starting streamed call to {tool_name}: {e}")
+        error_response = {"error": {"code": "internal_error", "message": f"Error executing tool {tool_name}: {str(e)}"}}
+        return StreamingResponse(
+            streaming_json_response(error_response),
+            media_type="application/json",
+            headers={"Transfer-Encoding": "chunked"}
+        )
+    if data_chunks is None:
+        return None
+    if cache is not None:
+        response_cache, cache_key = cache
+        data_chunks = response_cache.tee(cache_key, data_chunks)
+    return StreamingResponse(
+        streaming_data_response(data_chunks),
+        media_type="application/json",
+        headers={"Transfer-Encoding": "chunked"}
+    )
+
+# Envelope of a tool result on the REST routes; the encoded result goes in between
+TOOL_RESULT_PREFIX = b'{"jsonrpc":"2.0","result":{"data":'
+TOOL_RESULT_SUFFIX = b'}}'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison, as RFC 9110 specifies)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return etag in (candidate[2:] if candidate.startswith("W/") else candidate for candidate in candidates)
+
+def cached_tool_response(request: Request, cached, prefix: bytes, suffix: bytes, tag: str = "") -> Response:
+    """
+    Send a cached tool result with its ETag and Cache-Control headers.
+
+    Returns 304 Not Modified when the client already holds this version.
+    """
+    etag = cached.etag(tag)
+    headers = {"ETag": etag, "Cache-Control": cached.cache_control()}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(prefix + cached.data + suffix, media_type="application/json", headers=headers)
+
+def response_cache_key(response_cache, tool_name: str, arguments: Dict[str, Any], buffered: bool):
+    """Get the response cache key for a call, or None when caching does not apply."""
+    if response_cache is None:
+        return None
+    return response_cache.key(tool_name, arguments, f"{encoding_mode()}:{'buffered' if buffered else 'rows'}")
+
+async def call_tool_route(request: Request, tool_name: str, handle_call_tool, handle_stream_tool=None,
+                          response_cache=None) -> Response:
+    """Handle a REST tool call: cached, row-streamed or buffered."""
+    # Parse request body
+    arguments = await request.json()
+    if arguments is None:
+        arguments = {}
+    
+    # Serve a cached response (or 304) for an identical earlier call
+    buffered = handle_stream_tool is None or not wants_streamed_result(request)
+    cache_key = response_cache_key(response_cache, tool_name, arguments, buffered)
+    cached = response_cache.get(cache_key) if cache_key is not None else None
+    if cached is not None:
+        return cached_tool_response(request, cached, TOOL_RESULT_PREFIX, TOOL_RESULT_SUFFIX)
+    
+    # Stream rows as they are produced when the tool supports it
+    if not buffered:
+        cache = (response_cache, cache_key) if cache_key is not None else None
+        response = await stream_tool_call(handle_stream_tool, tool_name, arguments, cache)
+        if response is not None:
+            return response
+    
+    # Call the tool
+    result = await handle_call_tool(tool_name, arguments)
+    
+    if cache_key is not None and result and hasattr(result[0], 'text'):
+        cached = response_cache.put(cache_key, dumpb(result[0].text))
+        if cached is not None:
+            return cached_tool_response(request, cached, TOOL_RESULT_PREFIX, TOOL_RESULT_SUFFIX)
+    
+    # Stream the response
+    async def stream_generator():
+        if result and len(result) > 0:
+            if hasattr(result[0], 'error'):  # ErrorData
+                error_response = {
+                    "error": {
+                        "code": result[0].error.get("code", "error"),
+                        "message": result[0].error.get("message", "Unknown error")
+                    }
+                }
+                async for chunk in streaming_json_response(error_response):
+                    yield chunk
+            elif hasattr(result[0], 'text'):  # TextContent
+                async for chunk in streaming_json_response({"data": result[0].text}):
+                    yield chunk
+            else:
+                async for chunk in streaming_json_response({"data": "Unknown result type"}):
+                    yield chunk
+        else:
+            async for chunk in streaming_json_response({"data": "No result returned"}):
+                yield chunk
+    
+    return StreamingResponse(
+        stream_generator(),
+        media_type="application/json",
+        headers={"Transfer-Encoding": "chunked"}
+    )
+
+def jsonrpc_error(code: int, message: str, request_id: Any = None) -> Dict[str, Any]:
+    """Build a JSON-RPC 2.0 error response object."""
+    return {"jsonrpc": "2.0", "error": {"code": code, "message": message}, "id": request_id}
+
+def is_jsonrpc_notification(message: Any) -> bool:
+    """Check whether a JSON-RPC message is a notification (a valid request without an id)."""
+    return isinstance(message, dict) and message.get("jsonrpc") == "2.0" and "id" not in message
+
+async def tool_summaries_json(handle_list_tools, tool_registry=None) -> bytes:
+    """Encoded name and description of every tool; serialized once when a tool registry is given."""
+    if tool_registry is not None:
+        return tool_registry.summaries_json()
+    tools = await handle_list_tools()
+    return dumpb([{"name": tool.name, "description": tool.description} for tool in tools])
+
+async def handle_jsonrpc_message(message: Any, handle_call_tool, handle_list_tools,
+                                 tool_registry=None) -> Dict[str, Any]:
+    """
+    Run one JSON-RPC 2.0 request from a batch.
+
+    Args:
+        message: Decoded request object
+        handle_call_tool: Tool call handler
+        handle_list_tools: Tool listing handler
+        tool_registry: Optional ToolRegistry providing the built tool list
+
+    Returns:
+        Response object (errors are returned, not raised)
+    """
+    if not isinstance(message, dict) or message.get("jsonrpc") != "2.0":
+        return jsonrpc_error(-32600, "Invalid Request: Not a valid JSON-RPC 2.0 request")
+    request_id = message.get("id")
+    method = message.get("method")
+    params = message.get("params") or {}
+    try:
+        if method == "tool":
+            if not isinstance(params, dict) or "name" not in params:
+                return jsonrpc_error(-32602, "Invalid params: Missing tool name", request_id)
+            result = await handle_call_tool(params["name"], params.get("parameters") or {})
+            if result and hasattr(result[0], 'error'):  # ErrorData
+                return jsonrpc_error(
+                    result[0].error.get("code", -32000),
+                    result[0].error.get("message", "Unknown error"),
+                    request_id
+                )
+            if result and hasattr(result[0], 'text'):  # TextContent
+                return {"jsonrpc": "2.0", "id": request_id, "result": result[0].text}
+            return {"jsonrpc": "2.0", "id": request_id, "result": None if not result else "Unknown result type"}
+        if method == "list_tools":
+            if tool_registry is not None:
+                summaries = tool_registry.summaries()
+            else:
+                summaries = [{"name": tool.name, "description": tool.description} for tool in await handle_list_tools()]
+            return {"jsonrpc": "2.0", "id": request_id, "result": summaries}
+        return jsonrpc_error(-32601, f"Method not found: {method}", request_id)
+    except Exception as e:
+        logger.error(f"Error in JSON-RPC batch element {request_id}: {e}")
+        return jsonrpc_error(-32603, f"Internal error: {str(e)}", request_id)
+
+async def jsonrpc_batch_stream(messages: List[Any], handle_call_tool, handle_list_tools,
+                               concurrency: int = None, tool_registry=None) -> AsyncGenerator[bytes, None]:
+    """
+    Run a JSON-RPC batch concurrently and stream the response array.
+
+    Calls run with at most ``concurrency`` in flight, and each response
+    element is written as soon as its call completes, so the array is in
+    completion order (clients match responses by id). Notifications (requests
+    without an id) are run but get no response element.
+    """
+    semaphore = asyncio.Semaphore(concurrency or JSONRPC_BATCH_CONCURRENCY)
+
+    async def run(message):
+        async with semaphore:
+            return message, await handle_jsonrpc_message(message, handle_call_tool, handle_list_tools, tool_registry)
+
+    tasks = [asyncio.ensure_future(run(message)) for message in messages]
+    try:
+        yield b'['
+        first = True
+        for next_done in asyncio.as_completed(tasks):
+            message, response = await next_done
+            if is_jsonrpc_notification(message):
+                continue
+            yield (b'' if first else b',') + dumpb(response)
+            first = False
+        yield b']'
+    finally:
+        # Client went away mid-stream: stop the calls nobody will read
+        for task in tasks:
+            task.cancel()
+
+def register_streamable_http_routes(app: FastAPI, handle_call_tool, handle_list_tools, handle_stream_tool=None,
+                                    response_cache=None, tool_registry=None):
+    """
+    Register Streamable HTTP compatible routes with the FastAPI app.
+
+    ``handle_stream_tool(name, arguments)`` optionally returns an async
+    iterator of the JSON-encoded result for tools that stream rows (None for
+    other tools). Clients that pass ``?stream=1`` get those results as a JSON
+    "data" object written row by row; by default "data" stays the
+    string-encoded result every tool returns.
+
+    ``response_cache`` optionally caches encoded tool results; cached
+    responses carry ETag and Cache-Control headers and conditional requests
+    get 304 Not Modified.
+
+    ``tool_registry`` optionally provides the tool list, serialized once and
+    reused by /tools, /streamable-http/tools and the JSON-RPC list_tools method.
+    """
     
     # Configure CORS for remote deployment
     configure_cors(app)
@@ -61,14 +370,10 @@ def register_streamable_http_routes(app: FastAPI, handle_call_tool, handle_list_
     @app.get("/streamable-http/tools", response_class=StreamingResponse)
     async def list_tools_stream_legacy():
         """Legacy list tools endpoint with streaming response."""
-        tools = await handle_list_tools()
+        tools_json = await tool_summaries_json(handle_list_tools, tool_registry)
         
         async def stream_generator():
-            tools_dict = {
-                "tools": [{"name": tool.name, "description": tool.description} for tool in tools]
-            }
-            async for chunk in streaming_json_response(tools_dict):
-                yield chunk
+            yield b'{"jsonrpc":"2.0","result":{"tools":' + tools_json + b'}}'
         
         return StreamingResponse(
             stream_generator(),
@@ -79,55 +384,17 @@ def register_streamable_http_routes(app: FastAPI, handle_call_tool, handle_list_
     @app.post("/streamable-http/tools/{tool_name}", response_class=StreamingResponse)
     async def call_tool_stream_legacy(tool_name: str, request: Request):
         """Legacy call tool endpoint with streaming response."""
-        # Parse request body
-        arguments = await request.json()
-        if arguments is None:
-            arguments = {}
-        
-        # Call the tool
-        result = await handle_call_tool(tool_name, arguments)
-        
-        # Stream the response
-        async def stream_generator():
-            if result and len(result) > 0:
-                if hasattr(result[0], 'error'):  # ErrorData
-                    error_response = {
-                        "error": {
-                            "code": result[0].error.get("code", "error"),
-                            "message": result[0].error.get("message", "Unknown error")
-                        }
-                    }
-                    async for chunk in streaming_json_response(error_response):
-                        yield chunk
-                elif hasattr(result[0], 'text'):  # TextContent
-                    async for chunk in streaming_json_response({"data": result[0].text}):
-                        yield chunk
-                else:
-                    async for chunk in streaming_json_response({"data": "Unknown result type"}):
-                        yield chunk
-            else:
-                async for chunk in streaming_json_response({"data": "No result returned"}):
-                    yield chunk
-        
-        return StreamingResponse(
-            stream_generator(),
-            media_type="application/json",
-            headers={"Transfer-Encoding": "chunked"}
-        )
+        return await call_tool_route(request, tool_name, handle_call_tool, handle_stream_tool, response_cache)
         
     # --- Main Routes with Streamable HTTP ---
     # Override the /tools endpoint to use Streamable HTTP
     @app.get("/tools", response_class=StreamingResponse)
     async def list_tools_stream():
         """List tools endpoint with streaming response."""
-        tools = await handle_list_tools()
+        tools_json = await tool_summaries_json(handle_list_tools, tool_registry)
         
         async def stream_generator():
-            tools_dict = {
-                "tools": [{"name": tool.name, "description": tool.description} for tool in tools]
-            }
-            async for chunk in streaming_json_response(tools_dict):
-                yield chunk
+            yield b'{"jsonrpc":"2.0","result":{"tools":' + tools_json + b'}}'
         
         return StreamingResponse(
             stream_generator(),
@@ -139,42 +406,8 @@ def register_streamable_http_routes(app: FastAPI, handle_call_tool, handle_list_
     @app.post("/tools/{tool_name}", response_class=StreamingResponse)
     async def call_tool_stream(tool_name: str, request: Request):
         """Call a tool endpoint with streaming response."""
-        # Parse request body
-        arguments = await request.json()
-        if arguments is None:
-            arguments = {}
-        
-        # Call the tool
-        result = await handle_call_tool(tool_name, arguments)
-        
-        # Stream the response
-        async def stream_generator():
-            if result and len(result) > 0:
-                if hasattr(result[0], 'error'):  # ErrorData
-                    error_response = {
-                        "error": {
-                            "code": result[0].error.get("code", "error"),
-                            "message": result[0].error.get("message", "Unknown error")
-                        }
-                    }
-                    async for chunk in streaming_json_response(error_response):
-                        yield chunk
-                elif hasattr(result[0], 'text'):  # TextContent
-                    async for chunk in streaming_json_response({"data": result[0].text}):
-                        yield chunk
-                else:
-                    async for chunk in streaming_json_response({"data": "Unknown result type"}):
-                        yield chunk
-            else:
-                async for chunk in streaming_json_response({"data": "No result returned"}):
-                    yield chunk
+        return await call_tool_route(request, tool_name, handle_call_tool, handle_stream_tool, response_cache)
         
-        return StreamingResponse(
-            stream_generator(),
-            media_type="application/json",
-            headers={"Transfer-Encoding": "chunked"}
-        )
-    
     # --- JSON-RPC Endpoint ---
     @app.post("/jsonrpc", response_class=StreamingResponse)
     async def jsonrpc_endpoint(request: Request):
@@ -183,6 +416,29 @@ def register_streamable_http_routes(app: FastAPI, handle_call_tool, handle_list_
             # Parse the request
             req_data = await request.json()
             
+            # Batch: run the calls concurrently and stream responses as they complete
+            if isinstance(req_data, list):
+                if not req_data:
+                    return JSONResponse(
+                        status_code=400,
+                        content=jsonrpc_error(-32600, "Invalid Request: Empty batch")
+                    )
+                if len(req_data) > JSONRPC_BATCH_MAX_SIZE:
+                    return JSONResponse(
+                        status_code=400,
+                        content=jsonrpc_error(-32600, f"Invalid Request: Batch exceeds {JSONRPC_BATCH_MAX_SIZE} calls")
+                    )
+                if all(is_jsonrpc_notification(message) for message in req_data):
+                    # Nothing to return for an all-notification batch
+                    async for _ in jsonrpc_batch_stream(req_data, handle_call_tool, handle_list_tools, tool_registry=tool_registry):
+                        pass
+                    return Response(status_code=204)
+                return StreamingResponse(
+                    jsonrpc_batch_stream(req_data, handle_call_tool, handle_list_tools, tool_registry=tool_registry),
+                    media_type="application/json",
+                    headers={"Transfer-Encoding": "chunked"}
+                )
+            
             # Verify it's a valid JSON-RPC request
             if "jsonrpc" not in req_data or req_data["jsonrpc"] != "2.0":
                 return JSONResponse(
@@ -221,9 +477,21 @@ def register_streamable_http_routes(app: FastAPI, handle_call_tool, handle_list_
                 tool_name = params["name"]
                 tool_params = params.get("parameters", {})
                 
+                # Serve a cached result (or 304) for an identical earlier call
+                rpc_prefix = f'{{"jsonrpc":"2.0","id":"{request_id}","result":'.encode('utf-8')
+                cache_key = response_cache_key(response_cache, tool_name, tool_params, buffered=True)
+                cached = response_cache.get(cache_key) if cache_key is not None else None
+                if cached is not None:
+                    return cached_tool_response(request, cached, rpc_prefix, b'}', tag=f"rpc:{request_id}")
+                
                 # Call the tool
                 result = await handle_call_tool(tool_name, tool_params)
                 
+                if cache_key is not None and result and hasattr(result[0], 'text'):
+                    cached = response_cache.put(cache_key, dumpb(result[0].text))
+                    if cached is not None:
+                        return cached_tool_response(request, cached, rpc_prefix, b'}', tag=f"rpc:{request_id}")
+                
                 # Stream the response
                 async def stream_generator():
                     yield f'{{"jsonrpc":"2.0","id":"{request_id}",'.encode('utf-8')
@@ -236,9 +504,9 @@ def register_streamable_http_routes(app: FastAPI, handle_call_tool, handle_list_
                                     "message": result[0].error.get("message", "Unknown error")
                                 }
                             }
-                            yield json.dumps(error_data)[1:].encode('utf-8')  # Remove the leading {
+                            yield dumpb(error_data)[1:]  # Remove the leading {
                         elif hasattr(result[0], 'text'):  # TextContent
-                            yield f'"result":{json.dumps(result[0].text)}}}' .encode('utf-8')
+                            yield b'"result":' + dumpb(result[0].text) + b'}'
                         else:
                             yield f'"result":"Unknown result type"}}' .encode('utf-8')
                     else:
@@ -252,13 +520,11 @@ def register_streamable_http_routes(app: FastAPI, handle_call_tool, handle_list_
             
             elif method == "list_tools":
                 # List available tools
-                tools = await handle_list_tools()
+                tools_json = await tool_summaries_json(handle_list_tools, tool_registry)
                 
                 async def stream_generator():
                     yield f'{{"jsonrpc":"2.0","id":"{request_id}","result":'.encode('utf-8')
-                    
-                    tools_list = [{"name": tool.name, "description": tool.description} for tool in tools]
-                    yield json.dumps(tools_list).encode('utf-8')
+                    yield tools_json
                     
                     yield b'}'
                 
@@ -306,7 +572,7 @@ def register_streamable_http_routes(app: FastAPI, handle_call_tool, handle_list_
                         "code": -32603,
                         "message": f"Internal error: {str(e)}"
                     },
-                    "id": req_data.get("id", None) if 'req_data' in locals() else None
+                    "id": req_data.get("id", None) if isinstance(locals().get('req_data'), dict) else None
                 }
             )
             
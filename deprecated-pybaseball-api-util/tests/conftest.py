@@ -0,0 +1,29 @@
+"""
+Shared fixtures for the offline tests.
+"""
+import pytest
+
+from pybaseball_mcp import archive, statcast_store
+
+
+@pytest.fixture(autouse=True)
+def isolated_archive(tmp_path, monkeypatch):
+    """Keep archive files written during tests out of the user's data directory."""
+    monkeypatch.setattr(archive, "ARCHIVE_DIR", tmp_path / "archive")
+    return tmp_path / "archive"
+
+
+@pytest.fixture(autouse=True)
+def isolated_statcast(tmp_path, monkeypatch):
+    """Keep Statcast partitions written during tests out of the user's data directory."""
+    monkeypatch.setattr(statcast_store, "STATCAST_DIR", tmp_path / "statcast")
+    return tmp_path / "statcast"
+
+
+@pytest.fixture(autouse=True)
+def isolated_traces(tmp_path, monkeypatch):
+    """Keep spans exported during tests out of the user's data directory."""
+    from pybaseball_mcp import tracing
+
+    monkeypatch.setattr(tracing.exporter, "path", tmp_path / "traces.jsonl")
+    return tmp_path / "traces.jsonl"
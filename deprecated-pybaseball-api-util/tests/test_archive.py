@@ -0,0 +1,65 @@
+"""
+Offline tests for the completed-season archive.
+"""
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from pybaseball_mcp import archive, frames
+from pybaseball_mcp.frames import SeasonFrameStore
+
+
+@pytest.fixture
+def fetch_calls(monkeypatch):
+    calls = []
+
+    def fake_fetch(kind, year, qual):
+        calls.append((kind, year, qual))
+        if kind == "standings":
+            return [pd.DataFrame({"Tm": ["NYY", "BOS"], "W": [100, 90]}), pd.DataFrame({"Tm": ["HOU"], "W": [95]})]
+        return pd.DataFrame({"Name": ["A", "B"], "IDfg": [1, 2], "HR": [40, 12]})
+
+    monkeypatch.setattr(frames, "_fetch_frame", fake_fetch)
+    return calls
+
+
+def test_round_trip(isolated_archive):
+    frame = pd.DataFrame({"Name": ["A", "B"], "AVG": [0.301, 0.25]})
+    path = archive.write_archive("batting", 2015, frame, 1)
+    assert path.parent == isolated_archive
+    pd.testing.assert_frame_equal(archive.read_archive("batting", 2015, 1), frame)
+    assert archive.read_archive("batting", 2016, 1) is None
+
+
+def test_standings_round_trip_keeps_divisions():
+    divisions = [pd.DataFrame({"Tm": ["NYY", "BOS"], "W": [100, 90]}), pd.DataFrame({"Tm": ["HOU"], "W": [95]})]
+    archive.write_archive("standings", 2019, divisions)
+    loaded = archive.read_archive("standings", 2019)
+    assert len(loaded) == 2
+    for original, restored in zip(divisions, loaded):
+        pd.testing.assert_frame_equal(restored, original)
+
+
+def test_completed_seasons_are_fetched_once(fetch_calls):
+    SeasonFrameStore().get("batting", 2015)
+    # A fresh store (e.g. after a restart) reads the archive instead of upstream
+    frame = SeasonFrameStore().get("batting", 2015)
+    assert fetch_calls == [("batting", 2015, 1)]
+    assert list(frame["HR"]) == [40, 12]
+
+
+def test_current_season_is_not_archived(fetch_calls):
+    year = datetime.now().year
+    SeasonFrameStore().get("pitching", year)
+    SeasonFrameStore().get("pitching", year)
+    assert len(fetch_calls) == 2
+    assert not archive.archive_path("pitching", year, 1).exists()
+
+
+def test_preload_skips_archived_and_current_seasons(fetch_calls):
+    year = datetime.now().year
+    archive.preload([2018], kinds=["standings"])
+    summary = archive.preload([2018, year], kinds=["standings"])
+    assert summary == {"archived": [], "skipped": ["standings 2018", f"standings {year}"], "failed": []}
+    assert fetch_calls == [("standings", 2018, None)]
@@ -0,0 +1,51 @@
+"""
+The offline tool benchmark runs against fixtures, writes its results as JSON
+and fails when they regress from the baseline.
+"""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+SERVER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+BENCH_SCRIPT = os.path.join(SERVER_DIR, "benchmarks", "bench_tools.py")
+
+
+def test_bench_runs_offline_and_fails_on_regression(tmp_path):
+    pytest.importorskip("fastapi")
+    output = tmp_path / "results.json"
+    baseline = tmp_path / "baseline.json"
+    # A baseline no real run can match
+    baseline.write_text(json.dumps({
+        "meta": {"fixtures": "synthetic"},
+        "results": {"tool:mlb_standings": {"cold_ms": 0.001, "warm_p50_ms": 0.001, "upstream_calls": {}}},
+    }))
+    result = subprocess.run(
+        [sys.executable, BENCH_SCRIPT, "--only", "mlb_standings", "--cold-runs", "1", "--warm-runs", "3",
+         "--output", str(output), "--baseline", str(baseline)],
+        cwd=SERVER_DIR, capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 1, result.stdout + result.stderr
+    assert "tool:mlb_standings cold_ms" in result.stdout
+    assert "tool:mlb_standings upstream_calls: 1 vs baseline 0" in result.stdout
+
+    report = json.loads(output.read_text())
+    assert report["meta"]["fixtures"] == "synthetic"
+    metrics = report["results"]["tool:mlb_standings"]
+    assert metrics["upstream_calls"] == {"standings": 1}
+    assert metrics["warm_upstream_calls"] == 0
+    assert metrics["warm_p50_ms"] > 0 and metrics["throughput_per_s"] > 0 and metrics["cold_peak_kib"] > 0
+
+
+def test_committed_baseline_covers_every_case():
+    # The default comparison is skipped when the fixtures differ, so the
+    # committed baseline must come from the synthetic ones
+    with open(os.path.join(SERVER_DIR, "benchmarks", "baseline_tools.json")) as f:
+        baseline = json.load(f)
+    assert baseline["meta"]["fixtures"] == "synthetic"
+    names = set(baseline["results"])
+    assert {"tool:player_stats", "tool:mlb_standings", "http:tools", "http:streamable-http", "http:jsonrpc"} <= names
+    for metrics in baseline["results"].values():
+        assert metrics["cold_ms"] > 0 and metrics["warm_p50_ms"] > 0
@@ -0,0 +1,136 @@
+"""
+Offline tests for the tiered cache.
+"""
+import threading
+
+import pandas as pd
+
+from pybaseball_mcp import cache as cache_module
+from pybaseball_mcp.cache import TieredCache, estimate_nbytes
+
+
+def frame(rows):
+    return pd.DataFrame({"Name": [f"Player {i}" for i in range(rows)], "HR": range(rows)})
+
+
+def test_estimate_nbytes_is_dataframe_aware():
+    df = frame(100)
+    assert estimate_nbytes(df) == int(df.memory_usage(deep=True).sum())
+    assert estimate_nbytes([df, df]) > 2 * estimate_nbytes(df)
+
+
+def test_memory_only_cache_evicts_least_recently_used():
+    size = estimate_nbytes(frame(10))
+    cache = TieredCache("test", memory_budget_bytes=size * 2)
+    cache.set("a", frame(10))
+    cache.set("b", frame(10))
+    cache.get("a")
+    cache.set("c", frame(10))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    stats = cache.stats()
+    assert stats["memory_entries"] == 2
+    assert stats["memory_bytes"] <= size * 2
+    assert stats["evictions"] == 1
+
+
+def test_eviction_demotes_to_disk_and_hit_promotes(tmp_path):
+    size = estimate_nbytes(frame(10))
+    cache = TieredCache("test", memory_budget_bytes=size, disk_dir=tmp_path, disk_budget_bytes=10**7)
+    cache.set("a", frame(10))
+    cache.set("b", frame(10))
+    assert cache.stats()["disk_entries"] == 1
+    pd.testing.assert_frame_equal(cache.get("a"), frame(10))
+    stats = cache.stats()
+    assert stats["disk_hits"] == 1
+    # "a" moved back to memory and pushed "b" down to disk
+    assert stats["memory_entries"] == 1
+    assert stats["disk_entries"] == 1
+
+
+def test_disk_tier_survives_restart_and_respects_cap(tmp_path):
+    size = estimate_nbytes(frame(10))
+    cache = TieredCache("test", memory_budget_bytes=size, disk_dir=tmp_path, disk_budget_bytes=10**7)
+    for key in "abc":
+        cache.set(key, frame(10))
+    reopened = TieredCache("test", memory_budget_bytes=size, disk_dir=tmp_path, disk_budget_bytes=10**7)
+    assert reopened.get("a") is not None
+
+    tiny = TieredCache("test", memory_budget_bytes=size, disk_dir=tmp_path, disk_budget_bytes=1)
+    assert tiny.stats()["disk_entries"] == 0
+    assert list(tmp_path.glob("*.pkl")) == []
+
+
+def test_expired_entries_are_not_served(tmp_path):
+    cache = TieredCache("test", memory_budget_bytes=10**6, default_ttl=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+    cache.set("b", 2, ttl=None)
+    assert cache.get("b") == 2
+
+
+def test_concurrent_access_keeps_accounting_consistent(tmp_path):
+    size = estimate_nbytes(frame(5))
+    cache = TieredCache("test", memory_budget_bytes=size * 3, disk_dir=tmp_path, disk_budget_bytes=size * 20)
+
+    def worker(offset):
+        for i in range(50):
+            key = (offset + i) % 12
+            if cache.get(key) is None:
+                cache.set(key, frame(5))
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = cache.stats()
+    assert stats["memory_bytes"] <= size * 3
+    assert stats["memory_entries"] <= 3
+
+
+def test_disk_reads_do_not_block_other_keys(tmp_path, monkeypatch):
+    size = estimate_nbytes(frame(10))
+    cache = TieredCache("test", memory_budget_bytes=size, disk_dir=tmp_path, disk_budget_bytes=10**7)
+    cache.set("a", frame(10))
+    cache.set("b", frame(10))
+    started, release = threading.Event(), threading.Event()
+    load = cache_module.pickle.load
+
+    def slow_load(f):
+        started.set()
+        release.wait(5)
+        return load(f)
+
+    monkeypatch.setattr(cache_module.pickle, "load", slow_load)
+    promote = threading.Thread(target=cache.get, args=("a",))
+    promote.start()
+    assert started.wait(5)
+    # "b" is served from memory while "a" is still being unpickled
+    other = threading.Thread(target=cache.get, args=("b",))
+    other.start()
+    other.join(1)
+    blocked = other.is_alive()
+    release.set()
+    promote.join()
+    other.join()
+    assert not blocked
+    assert cache.stats()["disk_hits"] == 1
+    pd.testing.assert_frame_equal(cache.get("a"), frame(10))
+
+
+def test_set_while_demoting_keeps_the_new_value(tmp_path, monkeypatch):
+    size = estimate_nbytes(frame(10))
+    cache = TieredCache("test", memory_budget_bytes=size, disk_dir=tmp_path, disk_budget_bytes=10**7)
+    cache.set("a", frame(10))
+    dump = cache_module.pickle.dump
+
+    def dump_then_overwrite(obj, f, protocol=None):
+        # "a" is written to disk as "b" evicts it; a caller replaces it meanwhile
+        monkeypatch.setattr(cache_module.pickle, "dump", dump)
+        cache.set("a", frame(3))
+        dump(obj, f, protocol=protocol)
+
+    monkeypatch.setattr(cache_module.pickle, "dump", dump_then_overwrite)
+    cache.set("b", frame(10))
+    pd.testing.assert_frame_equal(cache.get("a"), frame(3))
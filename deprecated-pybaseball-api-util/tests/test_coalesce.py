@@ -0,0 +1,84 @@
+"""
+Offline tests for single-flight coalescing of tool calls.
+"""
+import asyncio
+
+import pytest
+
+from pybaseball_mcp.coalesce import SingleFlight, call_key
+
+
+def test_call_key_is_canonical():
+    assert call_key("player_stats", {"year": 2024, "player_name": "Mike Trout"}) == \
+        call_key("player_stats", {"player_name": "Mike Trout", "year": 2024})
+    assert call_key("mlb_standings", {"year": None}) == call_key("mlb_standings", {})
+    assert call_key("mlb_standings", {"year": 2023}) != call_key("mlb_standings", {"year": 2024})
+
+
+def test_concurrent_duplicates_share_one_execution():
+    flight = SingleFlight()
+    runs = []
+
+    async def work():
+        runs.append(1)
+        await asyncio.sleep(0.01)
+        return ["shared"]
+
+    async def main():
+        return await asyncio.gather(*(flight.do("k", work) for _ in range(10)))
+
+    results = asyncio.run(main())
+    assert len(runs) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.stats() == {"in_flight": 0, "started": 1, "coalesced": 9}
+
+
+def test_exceptions_are_shared_and_key_is_released():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0)
+        raise RuntimeError("upstream down")
+
+    async def main():
+        results = await asyncio.gather(flight.do("k", fail), flight.do("k", fail), return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+        # A later call starts fresh work instead of reusing the failed one
+        with pytest.raises(RuntimeError):
+            await flight.do("k", fail)
+
+    asyncio.run(main())
+    assert flight.stats()["started"] == 2
+
+
+def test_followers_report_the_shared_phases_in_server_timing():
+    from pybaseball_mcp.tracing import server_timing, span
+
+    flight = SingleFlight()
+
+    async def work():
+        with span("tool.player_stats", phase="tool"):
+            with span("fetch.frame", phase="fetch"):
+                await asyncio.sleep(0.01)
+            with span("aggregate.records", phase="aggregate"):
+                pass
+        return "shared"
+
+    async def request():
+        with span("POST /tools/player_stats", phase="transport") as request_span:
+            await flight.do("k", work)
+        return request_span
+
+    async def main():
+        return await asyncio.gather(request(), request())
+
+    leader, follower = asyncio.run(main())
+    assert leader.trace is not follower.trace
+    for request_span in (leader, follower):
+        timing = server_timing(request_span.trace)
+        assert "fetch;dur=" in timing and "aggregate;dur=" in timing and "tool;dur=" in timing
+    follower_spans = {item.name: item for item in follower.trace.spans}
+    assert follower_spans["coalesce.shared"].parent is follower
+    assert follower_spans["coalesce.shared"].attributes["coalesced"] is True
+    assert follower_spans["fetch.frame"].parent is follower_spans["tool.player_stats"]
+    assert follower.trace.phase_durations()["fetch"] == pytest.approx(leader.trace.phase_durations()["fetch"])
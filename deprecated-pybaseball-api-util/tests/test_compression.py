@@ -0,0 +1,114 @@
+"""
+Offline tests for the response compression middleware.
+"""
+import asyncio
+import gzip
+import zlib
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from compression import CompressionMiddleware, available_encodings, choose_encoding, compressor_for
+
+BIG = b'{"rows":[' + b",".join(b'{"rank":%d,"name":"Player %d"}' % (i, i) for i in range(200)) + b"]}"
+
+
+def _client(minimum_size=256):
+    app = FastAPI()
+
+    @app.get("/big")
+    async def big():
+        return Response(BIG, media_type="application/json", headers={"ETag": '"abc"'})
+
+    @app.get("/small")
+    async def small():
+        return JSONResponse({"ok": True})
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(0, len(BIG), 100):
+                yield BIG[i:i + 100]
+        return StreamingResponse(chunks(), media_type="application/json")
+
+    @app.get("/small-stream")
+    async def small_stream():
+        async def chunks():
+            yield b'{"a":'
+            yield b'1}'
+        return StreamingResponse(chunks(), media_type="application/json")
+
+    app.add_middleware(CompressionMiddleware, minimum_size=minimum_size, encodings=["gzip"])
+    return TestClient(app)
+
+
+def _raw(response):
+    return b"".join(response.iter_raw())
+
+
+def test_large_responses_are_gzipped_with_weak_etag():
+    with _client().stream("GET", "/big", headers={"Accept-Encoding": "gzip"}) as response:
+        raw = _raw(response)
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["etag"] == 'W/"abc"'
+        assert "accept-encoding" in response.headers["vary"].lower()
+        assert int(response.headers["content-length"]) == len(raw) < len(BIG)
+    assert gzip.decompress(raw) == BIG
+
+
+def test_small_responses_and_unaccepting_clients_are_not_compressed():
+    client = _client()
+    assert "content-encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+    assert "content-encoding" not in client.get("/small-stream", headers={"Accept-Encoding": "gzip"}).headers
+    response = client.get("/big", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.content == BIG
+
+
+def test_streams_are_compressed_per_chunk():
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", b"application/json"), (b"transfer-encoding", b"chunked")]})
+        for i in range(0, len(BIG), 1000):
+            await send({"type": "http.response.body", "body": BIG[i:i + 1000], "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "headers": [(b"accept-encoding", b"gzip")]}
+    asyncio.run(CompressionMiddleware(app, minimum_size=256, encodings=["gzip"])(scope, None, send))
+    headers = dict(sent[0]["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    bodies = [message["body"] for message in sent[1:]]
+    assert len(bodies) == len(range(0, len(BIG), 1000)) + 1
+    # Every chunk is sync-flushed, so each prefix decompresses on its own
+    decompressor = zlib.decompressobj(31)
+    assert decompressor.decompress(bodies[0]) == BIG[:1000]
+    assert gzip.decompress(b"".join(bodies)) == BIG
+
+
+def test_choose_encoding_honours_q_values_and_server_preference():
+    assert choose_encoding("gzip, br;q=0.5", ["zstd", "br", "gzip"]) == "br"
+    assert choose_encoding("gzip;q=0, deflate", ["gzip"]) is None
+    assert choose_encoding("*", ["zstd", "gzip"]) == "zstd"
+    assert choose_encoding("", ["gzip"]) is None
+
+
+@pytest.mark.parametrize("encoding", sorted(available_encodings()))
+def test_streaming_compressors_round_trip(encoding):
+    compressor = compressor_for(encoding)
+    data = b"".join(compressor.compress(BIG[i:i + 500]) for i in range(0, len(BIG), 500)) + compressor.finish()
+    if encoding == "gzip":
+        assert gzip.decompress(data) == BIG
+    elif encoding == "zstd":
+        import zstandard
+        assert zstandard.ZstdDecompressor().decompressobj().decompress(data) == BIG
+    else:
+        import brotli
+        assert brotli.decompress(data) == BIG
@@ -0,0 +1,57 @@
+"""
+Offline tests for the central response encoder.
+"""
+import asyncio
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pybaseball_mcp import encoding
+from pybaseball_mcp.encoding import dumpb, dumps, encoding_mode, use_encoding_mode
+from pybaseball_mcp.executor import run_blocking
+
+
+def test_numpy_and_pandas_values_are_encoded_natively():
+    value = {
+        "hr": np.int64(58),
+        "avg": np.float64(0.322),
+        "missing": np.float64("nan"),
+        "na": pd.NA,
+        "nat": pd.NaT,
+        "when": pd.Timestamp("2024-06-01"),
+        "flags": np.array([True, False]),
+    }
+    assert json.loads(dumps(value)) == {
+        "hr": 58, "avg": 0.322, "missing": None, "na": None, "nat": None,
+        "when": "2024-06-01T00:00:00", "flags": [True, False],
+    }
+
+
+def test_modes_differ_only_in_whitespace():
+    value = {"leaders": [{"rank": 1, "name": "Aaron Judge"}]}
+    compact = dumps(value, "compact")
+    pretty = dumps(value, "pretty")
+    assert "\n" not in compact and " " not in compact.replace("Aaron Judge", "")
+    assert "\n  " in pretty
+    assert json.loads(compact) == json.loads(pretty) == value
+
+
+def test_mode_follows_context_into_worker_threads():
+    async def encode_in_worker():
+        with use_encoding_mode("pretty"):
+            return await run_blocking(dumps, {"a": 1})
+
+    assert asyncio.run(encode_in_worker()) == '{\n  "a": 1\n}'
+    assert encoding_mode() == encoding.DEFAULT_ENCODING_MODE
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        encoding.set_encoding_mode("tiny")
+
+
+def test_standard_library_fallback_nulls_non_finite_floats():
+    assert encoding._clean_floats({"a": [float("nan"), 1.5, float("inf")]}) == {"a": [None, 1.5, None]}
+    assert dumpb("Ohtani") == b'"Ohtani"'
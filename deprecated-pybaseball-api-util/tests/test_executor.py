@@ -0,0 +1,59 @@
+"""
+Offline tests for the shared tool executors.
+"""
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+
+from pybaseball_mcp.executor import get_executor, run_blocking
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+def test_executor_is_shared_and_bounded(monkeypatch):
+    monkeypatch.setenv("PYBASEBALL_MCP_TESTPOOL_WORKERS", "2")
+    executor = get_executor("testpool")
+    assert get_executor("testpool") is executor
+    assert executor._max_workers == 2
+
+
+def test_calls_run_concurrently_off_the_loop():
+    loop_thread = threading.get_ident()
+
+    def slow():
+        time.sleep(0.2)
+        return threading.get_ident()
+
+    async def main():
+        start = time.perf_counter()
+        threads = await asyncio.gather(*(run_blocking(slow) for _ in range(4)))
+        return threads, time.perf_counter() - start
+
+    threads, elapsed = asyncio.run(main())
+    assert loop_thread not in threads
+    assert elapsed < 0.6
+
+
+def test_timeout_returns_control_immediately():
+    release = threading.Event()
+
+    async def main():
+        start = time.perf_counter()
+        with pytest.raises(asyncio.TimeoutError):
+            await run_blocking(release.wait, 5, timeout=0.05)
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(main())
+    release.set()
+    assert elapsed < 1
+
+
+def test_context_is_carried_into_worker():
+    async def main():
+        request_id.set("abc")
+        return await run_blocking(request_id.get)
+
+    assert asyncio.run(main()) == "abc"
@@ -0,0 +1,45 @@
+"""
+Offline tests for the cache expiry policies.
+"""
+from datetime import date, datetime, timezone
+
+from pybaseball_mcp.expiry import FixedExpiryPolicy, SeasonAwareExpiryPolicy
+
+POLICY = SeasonAwareExpiryPolicy(refresh_hour=11, game_window=(17, 7), game_window_ttl=900)
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+def test_completed_seasons_never_expire():
+    now = utc(2025, 7, 1, 12)
+    for kind in ("batting", "pitching", "standings"):
+        assert POLICY.ttl(kind, year=1927, now=now) is None
+        assert POLICY.is_immutable(kind, year=2024, now=now)
+
+
+def test_current_season_follows_game_days():
+    # Mid-morning: fresh until the 11:00 UTC nightly refresh
+    assert POLICY.ttl("batting", year=2025, now=utc(2025, 7, 1, 8, 30)) == 2.5 * 3600
+    # Early afternoon: fresh until games start at 17:00 UTC
+    assert POLICY.ttl("standings", year=2025, now=utc(2025, 7, 1, 13)) == 4 * 3600
+    # While games are being played (including past midnight UTC)
+    assert POLICY.ttl("standings", year=2025, now=utc(2025, 7, 1, 22)) == 900
+    assert POLICY.ttl("standings", year=2025, now=utc(2025, 7, 2, 3)) == 900
+
+
+def test_offseason_uses_long_ttl():
+    assert POLICY.ttl("batting", year=2025, now=utc(2025, 12, 15, 12)) == 86400
+
+
+def test_statcast_partitions_settle():
+    now = utc(2025, 7, 10, 12)
+    assert POLICY.is_immutable("statcast", game_date=date(2025, 7, 1), now=now)
+    assert not POLICY.is_immutable("statcast", game_date=date(2025, 7, 9), now=now)
+
+
+def test_fixed_policy_never_marks_data_immutable():
+    policy = FixedExpiryPolicy(300)
+    assert policy.ttl("batting", year=1927) == 300
+    assert not policy.is_immutable("standings", year=1927)
@@ -0,0 +1,69 @@
+"""
+Offline tests for the shared season frame store.
+"""
+import pandas as pd
+import pytest
+
+from pybaseball_mcp import frames
+from pybaseball_mcp.cache import estimate_nbytes
+from pybaseball_mcp.expiry import FixedExpiryPolicy
+from pybaseball_mcp.frames import SeasonFrameStore
+
+
+@pytest.fixture
+def fetch_calls(monkeypatch):
+    calls = []
+
+    def fake_fetch(kind, year, qual):
+        calls.append((kind, year, qual))
+        return pd.DataFrame({"Name": ["A", "B"], "HR": [year % 7, 3]})
+
+    monkeypatch.setattr(frames, "_load_frame", fake_fetch)
+    return calls
+
+
+def test_hit_and_miss_counters(fetch_calls):
+    store = SeasonFrameStore(FixedExpiryPolicy(60), memory_budget_bytes=10**8)
+    first = store.get("batting", 2023)
+    second = store.get("batting", 2023)
+    assert first is second
+    assert fetch_calls == [("batting", 2023, 1)]
+    assert store.stats()["hits"] == 1
+    assert store.stats()["misses"] == 1
+
+
+def test_entries_expire(fetch_calls):
+    store = SeasonFrameStore(FixedExpiryPolicy(0), memory_budget_bytes=10**8)
+    store.get("pitching", 2022)
+    store.get("pitching", 2022)
+    assert len(fetch_calls) == 2
+
+
+def test_memory_budget_evicts_least_recently_used(fetch_calls):
+    one_frame = estimate_nbytes(pd.DataFrame({"Name": ["A", "B"], "HR": [1, 3]}))
+    store = SeasonFrameStore(FixedExpiryPolicy(60), memory_budget_bytes=one_frame * 2)
+    store.get("batting", 2020)
+    store.get("batting", 2021)
+    store.get("batting", 2020)
+    store.get("batting", 2022)
+    stats = store.stats()
+    assert stats["memory_entries"] == 2
+    assert stats["evictions"] == 1
+    # 2021 was least recently used, so it has to be fetched again
+    store.get("batting", 2021)
+    assert fetch_calls.count(("batting", 2021, 1)) == 2
+
+
+def test_unknown_kind_is_rejected():
+    with pytest.raises(ValueError):
+        SeasonFrameStore().get("fielding", 2023)
+
+
+def test_load_locks_do_not_grow_with_distinct_seasons(fetch_calls):
+    store = SeasonFrameStore(FixedExpiryPolicy(60), memory_budget_bytes=10**8)
+    locks = store._load_locks
+    for year in range(1900, 2025):
+        store.get("batting", year)
+    assert store._load_locks is locks
+    assert len(locks) == frames.FRAME_LOAD_LOCK_STRIPES
+    assert store._load_lock(("batting", 2024, 1)) is store._load_lock(("batting", 2024, 1))
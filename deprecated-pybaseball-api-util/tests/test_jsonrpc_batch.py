@@ -0,0 +1,106 @@
+"""
+Offline tests for JSON-RPC batch requests on /jsonrpc.
+"""
+import asyncio
+import json
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import streamable_http
+from streamable_http import jsonrpc_batch_stream, register_streamable_http_routes
+
+
+class FakeTools:
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+
+    async def call_tool(self, name, arguments):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(arguments.get("delay", 0))
+        finally:
+            self.running -= 1
+        if name == "boom":
+            return [SimpleNamespace(error={"code": "internal_error", "message": "boom"})]
+        return [SimpleNamespace(text=f"{name}:{arguments.get('value')}")]
+
+    async def list_tools(self):
+        return [SimpleNamespace(name="echo", description="Echo a value")]
+
+
+def _client(tools):
+    app = FastAPI()
+    register_streamable_http_routes(app, tools.call_tool, tools.list_tools)
+    return TestClient(app)
+
+
+def _call(request_id, name="echo", **parameters):
+    return {"jsonrpc": "2.0", "id": request_id, "method": "tool",
+            "params": {"name": name, "parameters": parameters}}
+
+
+def test_batch_returns_one_response_per_request():
+    tools = FakeTools()
+    response = _client(tools).post("/jsonrpc", json=[
+        _call(1, value="a"),
+        {"jsonrpc": "2.0", "id": 2, "method": "list_tools"},
+        _call(3, name="boom"),
+        {"jsonrpc": "2.0", "id": 4, "method": "nope"},
+        {"not": "jsonrpc"},
+    ])
+    assert response.status_code == 200
+    by_id = {item["id"]: item for item in response.json()}
+    assert by_id[1]["result"] == "echo:a"
+    assert by_id[2]["result"] == [{"name": "echo", "description": "Echo a value"}]
+    assert by_id[3]["error"]["message"] == "boom"
+    assert by_id[4]["error"]["code"] == -32601
+    assert by_id[None]["error"]["code"] == -32600
+
+
+def test_notifications_get_no_response():
+    tools = FakeTools()
+    client = _client(tools)
+    response = client.post("/jsonrpc", json=[_call(1, value="a"), {"jsonrpc": "2.0", "method": "list_tools"}])
+    assert [item["id"] for item in response.json()] == [1]
+    response = client.post("/jsonrpc", json=[{"jsonrpc": "2.0", "method": "list_tools"}])
+    assert response.status_code == 204
+
+
+def test_empty_batch_is_invalid():
+    response = _client(FakeTools()).post("/jsonrpc", json=[])
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == -32600
+
+
+def test_single_requests_still_work():
+    response = _client(FakeTools()).post("/jsonrpc", json=_call(7, value="x"))
+    assert json.loads(response.text)["result"] == "echo:x"
+
+
+def test_batch_streams_in_completion_order_with_bounded_concurrency():
+    tools = FakeTools()
+    messages = [_call(i, value=i, delay=0.05 * (4 - i)) for i in range(5)]
+
+    async def collect():
+        chunks = []
+        async for chunk in jsonrpc_batch_stream(messages, tools.call_tool, tools.list_tools, concurrency=2):
+            chunks.append(chunk)
+        return chunks
+
+    chunks = asyncio.run(collect())
+    assert chunks[0] == b'[' and chunks[-1] == b']'
+    assert len(chunks) == 7  # one chunk per element, flushed as each finishes
+    ids = [item["id"] for item in json.loads(b"".join(chunks))]
+    assert sorted(ids) == [0, 1, 2, 3, 4]
+    assert ids[0] == 1  # 0 and 1 start together; 1 is shorter
+    assert tools.max_running == 2
+
+
+def test_batch_size_is_capped(monkeypatch):
+    monkeypatch.setattr(streamable_http, "JSONRPC_BATCH_MAX_SIZE", 2)
+    response = _client(FakeTools()).post("/jsonrpc", json=[_call(i) for i in range(3)])
+    assert response.status_code == 400
@@ -0,0 +1,69 @@
+"""
+Offline tests for the Statcast aggregation kernels.
+"""
+import numpy as np
+import pandas as pd
+
+from pybaseball_mcp.kernels import batting_summary, pitching_summary, value_counts
+
+
+def _pitches():
+    return pd.DataFrame({
+        "batter": [1, 1, 1, 2, 2, 1],
+        "pitcher": [7, 8, 7, 7, 8, 8],
+        "events": ["single", None, "home_run", "strikeout", None, "field_out"],
+        "type": ["X", "S", "X", "S", "B", "X"],
+        "launch_speed": [101.2, np.nan, 108.4, np.nan, np.nan, 88.0],
+        "release_speed": [94.1, 95.0, 93.3, 88.8, 89.2, np.nan],
+    })
+
+
+def test_batting_summary_matches_mask_computation():
+    frame = _pitches()
+    summary = batting_summary(frame[frame["batter"] == 1])
+    assert summary == {
+        "at_bats": 3,
+        "hits": 2,
+        "avg": 0.667,
+        "home_runs": 1,
+        "max_exit_velocity": 108.4,
+        "avg_exit_velocity": 99.2,
+    }
+
+
+def test_pitching_summary_matches_mask_computation():
+    frame = _pitches()
+    summary = pitching_summary(frame[frame["pitcher"] == 8])
+    assert summary == {
+        "pitches_thrown": 3,
+        "avg_velocity": 92.1,
+        "max_velocity": 95.0,
+        "strike_percentage": 33.3,
+    }
+
+
+def test_grouped_summaries_equal_per_player_summaries():
+    frame = _pitches()
+    grouped = batting_summary(frame, by="batter")
+    assert set(grouped) == {1, 2}
+    for batter, summary in grouped.items():
+        assert summary == batting_summary(frame[frame["batter"] == batter])
+    grouped = pitching_summary(frame, by="pitcher")
+    for pitcher, summary in grouped.items():
+        assert summary == pitching_summary(frame[frame["pitcher"] == pitcher])
+
+
+def test_missing_speeds_and_empty_groups():
+    frame = _pitches()
+    summary = batting_summary(frame[frame["batter"] == 2])
+    assert summary["hits"] == 0
+    assert summary["max_exit_velocity"] is None
+    empty = pitching_summary(frame.iloc[0:0])
+    assert empty["pitches_thrown"] == 0
+    assert empty["strike_percentage"] == 0
+
+
+def test_value_counts_keeps_missing_in_first_column():
+    counts, labels = value_counts(np.array(["a", None, "b", "a"], dtype=object), np.zeros(4, dtype=np.intp), 1)
+    assert counts[0, 0] == 1
+    assert counts[0, labels.index("a") + 1] == 2
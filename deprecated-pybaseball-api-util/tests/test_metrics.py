@@ -0,0 +1,97 @@
+"""
+Offline tests for the Prometheus metrics.
+"""
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from pybaseball_mcp import metrics
+from pybaseball_mcp.cache import TieredCache
+from pybaseball_mcp.metrics import Counter, Histogram, MetricsRegistry, track_tool, upstream_call
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.register(Histogram("latency_seconds", "Latency.", ("tool",), buckets=(0.1, 1)))
+    for value in (0.05, 0.5, 0.5, 3):
+        histogram.observe(value, tool="a")
+    lines = registry.render().splitlines()
+    assert lines[:2] == ["# HELP latency_seconds Latency.", "# TYPE latency_seconds histogram"]
+    assert 'latency_seconds_bucket{tool="a",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{tool="a",le="1"} 3' in lines
+    assert 'latency_seconds_bucket{tool="a",le="+Inf"} 4' in lines
+    assert 'latency_seconds_sum{tool="a"} 4.05' in lines
+    assert 'latency_seconds_count{tool="a"} 4' in lines
+
+
+def test_label_values_are_escaped():
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("calls_total", "Calls.", ("tool",)))
+    counter.inc(tool='say "hi"\n')
+    assert 'calls_total{tool="say \\"hi\\"\\n"} 1' in registry.render()
+
+
+def test_track_tool_records_latency_in_flight_and_outcome():
+    before = metrics.TOOL_CALLS.value(tool="probe", outcome="ok")
+    with track_tool("probe"):
+        assert metrics.TOOL_IN_FLIGHT.value(tool="probe") == 1
+    assert metrics.TOOL_IN_FLIGHT.value(tool="probe") == 0
+    assert metrics.TOOL_CALLS.value(tool="probe", outcome="ok") == before + 1
+    assert metrics.TOOL_DURATION.count(tool="probe") >= 1
+
+    timeouts = metrics.TOOL_TIMEOUTS.value(tool="probe")
+    with pytest.raises(asyncio.TimeoutError):
+        with track_tool("probe"):
+            raise asyncio.TimeoutError()
+    assert metrics.TOOL_TIMEOUTS.value(tool="probe") == timeouts + 1
+
+    with pytest.raises(ValueError):
+        with track_tool("probe"):
+            raise ValueError("boom")
+    assert metrics.TOOL_CALLS.value(tool="probe", outcome="exception") >= 1
+    assert metrics.TOOL_IN_FLIGHT.value(tool="probe") == 0
+
+
+def test_upstream_call_records_duration_and_errors():
+    with upstream_call("probe_fetch"):
+        pass
+    with pytest.raises(RuntimeError):
+        with upstream_call("probe_fetch"):
+            raise RuntimeError("upstream down")
+    assert metrics.UPSTREAM_DURATION.count(function="probe_fetch") == 2
+    assert metrics.UPSTREAM_ERRORS.value(function="probe_fetch") == 1
+
+
+def test_cache_counters_are_read_from_live_caches():
+    cache = TieredCache("metrics_probe", 1024)
+    cache.get("missing")
+    cache.set("a", "value")
+    cache.get("a")
+    text = metrics.render_metrics()
+    assert 'pybaseball_mcp_cache_hits_total{cache="metrics_probe",tier="memory"} 1' in text
+    assert 'pybaseball_mcp_cache_misses_total{cache="metrics_probe"} 1' in text
+
+
+def test_metrics_file_and_endpoint(tmp_path):
+    import pybaseball_nativemcp_server as server
+
+    asyncio.run(server._dispatch_tool("health_check", {}))
+    path = metrics.write_metrics_file(tmp_path / "metrics.prom")
+    assert 'pybaseball_mcp_tool_calls_total{tool="health_check",outcome="ok"}' in path.read_text()
+
+    response = TestClient(server.create_http_app()).get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE pybaseball_mcp_tool_duration_seconds histogram" in response.text
+
+
+def test_metrics_dump_writes_on_stop(tmp_path):
+    path = tmp_path / "dump.prom"
+
+    async def run():
+        metrics.start_metrics_dump(str(path), interval=3600)
+        await metrics.stop_metrics_dump(str(path))
+
+    asyncio.run(run())
+    assert path.read_text().startswith("# HELP")
@@ -0,0 +1,69 @@
+"""
+Offline tests for the batch player_stats tool.
+"""
+import json
+
+import pandas as pd
+import pytest
+
+from pybaseball_mcp import players
+from pybaseball_mcp.register import PlayerEntry
+
+REGISTER = {
+    "mike trout": PlayerEntry("Mike Trout", 545361, 10155, "troutmi01", 2011, 2024),
+    "gerrit cole": PlayerEntry("Gerrit Cole", 543037, 13125, "colege01", 2013, 2024),
+    "aaron judge": PlayerEntry("Aaron Judge", 592450, 15640, "judgeaa01", 2016, 2024),
+}
+
+
+@pytest.fixture
+def season_frames(monkeypatch):
+    calls = []
+    batting = pd.DataFrame({
+        "IDfg": [10155, 15640], "Name": ["Mike Trout", "Aaron Judge"],
+        "G": [29, 158], "AVG": [0.22, 0.322], "OBP": [0.325, 0.458], "SLG": [0.541, 0.701],
+        "OPS": [0.866, 1.159], "HR": [10, 58], "RBI": [14, 144], "R": [17, 122], "SB": [6, 10], "WAR": [1.0, 11.2],
+    })
+    pitching = pd.DataFrame({
+        "IDfg": [13125], "Name": ["Gerrit Cole"], "G": [17], "GS": [17], "W": [8], "L": [5], "SV": [0],
+        "ERA": [3.41], "WHIP": [1.13], "IP": [95.0], "SO": [99], "K/9": [9.38], "WAR": [1.9],
+    })
+
+    def batting_frame(year, qual=1):
+        calls.append(("batting", year))
+        return batting
+
+    def pitching_frame(year, qual=1):
+        calls.append(("pitching", year))
+        return pitching
+
+    monkeypatch.setattr(players, "get_batting_frame", batting_frame)
+    monkeypatch.setattr(players, "get_pitching_frame", pitching_frame)
+    monkeypatch.setattr(players, "resolve_player", lambda name: REGISTER.get(name.lower()))
+    return calls
+
+
+def test_batch_matches_single_player_results(season_frames):
+    names = ["Aaron Judge", "Gerrit Cole", "Mike Trout"]
+    result = json.loads(players._get_players_stats_batch_impl(names, 2024))
+    assert result["count"] == 3
+    for name, record in zip(names, result["players"]):
+        assert record == json.loads(players._get_player_stats_impl(name, 2024))
+    assert [record["type"] for record in result["players"]] == ["batting", "pitching", "batting"]
+
+
+def test_each_season_frame_is_scanned_once(season_frames):
+    players._get_players_stats_batch_impl(["Aaron Judge", "Gerrit Cole", "Mike Trout"], 2024)
+    assert season_frames == [("batting", 2024), ("pitching", 2024)]
+
+
+def test_unresolved_players_are_reported_in_place(season_frames):
+    result = json.loads(players._get_players_stats_batch_impl(["Nobody Here", "Judge", "Aaron Judge"], [2024, 2024, 2024]))
+    first, second, third = result["players"]
+    assert "not found" in first["error"]
+    assert "first and last name" in second["error"]
+    assert third["hr"] == 58
+
+
+def test_mismatched_years_are_rejected(season_frames):
+    assert players._get_players_stats_batch_impl(["Aaron Judge"], [2023, 2024]).startswith("Error")
@@ -0,0 +1,75 @@
+"""
+Offline tests for the per-frame rank indexes.
+"""
+import gc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pybaseball_mcp import derived, ranks, teams
+from pybaseball_mcp.ranks import rank_index
+
+
+def _season():
+    rng = np.random.default_rng(7)
+    frame = pd.DataFrame({
+        "Name": [f"Player {i}" for i in range(200)],
+        "Team": rng.choice(["NYY", "BOS", "LAD"], 200),
+        "HR": rng.integers(0, 40, 200),
+        "ERA": rng.uniform(1.5, 7.0, 200).round(2),
+        "AVG": rng.uniform(0.15, 0.35, 200).round(3),
+    })
+    frame.loc[[3, 50], "AVG"] = np.nan
+    return frame
+
+
+@pytest.mark.parametrize("column", ["HR", "ERA", "AVG", "Team"])
+@pytest.mark.parametrize("ascending", [True, False])
+def test_top_matches_sort_values(column, ascending):
+    frame = _season()
+    expected = frame.sort_values(column, ascending=ascending, kind="stable").head(25)
+    pd.testing.assert_frame_equal(rank_index(frame).top(frame, column, 25, ascending=ascending), expected)
+
+
+def test_prebuild_matches_lazy_orders():
+    frame = _season()
+    index = rank_index(frame)
+    index.prebuild(frame)
+    for column in ["HR", "ERA", "AVG"]:
+        ascending = column in ranks.LOWER_IS_BETTER
+        np.testing.assert_array_equal(index.order(frame, column),
+                                      np.argsort(frame[column].to_numpy(dtype=float) * (1 if ascending else -1),
+                                                 kind="stable"))
+
+
+def test_orders_are_reused_per_frame(monkeypatch):
+    frame = _season()
+    calls = []
+    real_argsort = np.argsort
+    monkeypatch.setattr(ranks.np, "argsort", lambda *a, **k: calls.append(1) or real_argsort(*a, **k))
+    assert rank_index(frame) is rank_index(frame)
+    rank_index(frame).top(frame, "HR", 5)
+    rank_index(frame).top(frame, "HR", 10)
+    assert len(calls) == 1
+
+    # A reloaded frame is a new object and gets its own index
+    reloaded = frame.copy()
+    assert rank_index(reloaded) is not rank_index(frame)
+
+
+def test_index_is_dropped_with_its_frame():
+    frame = _season()
+    rank_index(frame)
+    key = (id(frame), "rank_index")
+    del frame
+    gc.collect()
+    assert key not in derived._derived
+
+
+def test_league_leaders_use_rank_order(monkeypatch):
+    frame = _season()
+    monkeypatch.setattr(teams, "get_pitching_frame", lambda year: frame)
+    result = teams.stream_league_leaders("era", 2023, top_n=3).to_dict()
+    assert [row["ERA"] for row in result["leaders"]] == sorted(frame["ERA"])[:3]
+    assert [row["rank"] for row in result["leaders"]] == [1, 2, 3]
@@ -0,0 +1,49 @@
+"""
+Offline tests for the columnar response builder.
+"""
+import numpy as np
+import pandas as pd
+
+from pybaseball_mcp import teams
+from pybaseball_mcp.records import FieldSpec, build_records
+
+
+def test_casts_rounding_and_defaults():
+    frame = pd.DataFrame({
+        "Name": ["A", "B", None],
+        "G": [10, np.nan, 3],
+        "AVG": [0.31249, np.nan, 0.2],
+        "HR": pd.array([5, None, 7], dtype="Int64"),
+    })
+    records = build_records(frame, [
+        FieldSpec("Name", "name", default="?"),
+        FieldSpec("G", "games", "int", default=0),
+        FieldSpec("AVG", "avg", "float", 3, default=0.0),
+        FieldSpec("HR", "hr", "int", default=-1),
+        FieldSpec("WAR", "war", "float", 1, default=0.0),
+    ])
+    assert records == [
+        {"name": "A", "games": 10, "avg": 0.312, "hr": 5, "war": 0.0},
+        {"name": "B", "games": 0, "avg": 0.0, "hr": -1, "war": 0.0},
+        {"name": "?", "games": 3, "avg": 0.2, "hr": 7, "war": 0.0},
+    ]
+    assert all(type(record["games"]) is int and type(record["avg"]) is float for record in records)
+
+
+def test_numeric_strings_are_cast():
+    frame = pd.DataFrame({"Tm": ["NYY", "BOS"], "W": ["94", "81"], "W-L%": [".580", ".500"], "GB": ["--", "13.0"]})
+    assert teams._standings_team_rows(frame) == [
+        {"team": "NYY", "wins": 94, "losses": 0, "win_pct": 0.58, "games_back": "--"},
+        {"team": "BOS", "wins": 81, "losses": 0, "win_pct": 0.5, "games_back": "13.0"},
+    ]
+
+
+def test_matches_iterrows_output():
+    rng = np.random.default_rng(3)
+    frame = pd.DataFrame({"Name": [f"P{i}" for i in range(50)], "OPS": rng.uniform(0.5, 1.1, 50)})
+    expected = [{"name": row["Name"], "ops": round(float(row["OPS"]), 3)} for _, row in frame.iterrows()]
+    assert build_records(frame, [FieldSpec("Name", "name"), FieldSpec("OPS", "ops", "float", 3)]) == expected
+
+
+def test_empty_frame():
+    assert build_records(pd.DataFrame({"Name": []}), [FieldSpec("Name")]) == []
@@ -0,0 +1,77 @@
+"""
+Offline tests for the player register index.
+"""
+import pandas as pd
+import pytest
+from pyarrow import feather
+
+from pybaseball_mcp.register import PlayerRegister, normalize_name
+
+REGISTER_ROWS = [
+    # name_first, name_last, key_mlbam, key_fangraphs, key_bbref, mlb_played_first, mlb_played_last
+    ("Ronald", "Acuña", 660670, 18401, "acunaro01", 2018, 2024),
+    ("J. D.", "Martinez", 502110, 6184, "martijd02", 2011, 2024),
+    ("Pedro", "Martinez", 118377, 200, "martipe02", 1992, 2009),
+    ("Pedro", "Martinez", 408045, 1001, "martipe01", 1993, 1997),
+    ("Elly", "De La Cruz", 682829, 27802, "delacel01", 2023, 2024),
+    ("Old", "Timer", -1, -1, "timerol01", None, None),
+]
+
+
+@pytest.fixture
+def register(tmp_path):
+    frame = pd.DataFrame(REGISTER_ROWS, columns=[
+        "name_first", "name_last", "key_mlbam", "key_fangraphs", "key_bbref",
+        "mlb_played_first", "mlb_played_last",
+    ])
+    path = tmp_path / "player_register.feather"
+    feather.write_feather(frame, path, compression="uncompressed")
+    register = PlayerRegister(path)
+    register.load()
+    return register
+
+
+def test_normalize_name():
+    assert normalize_name("  Ronald  Acuña Jr. ") == "ronald acuna"
+    assert normalize_name("J.D. Martinez") == "jd martinez"
+    assert normalize_name("Travis d'Arnaud") == "travis darnaud"
+
+
+def test_lookup_folds_accents_case_and_suffixes(register):
+    entry = register.lookup("RONALD ACUNA JR.")
+    assert entry.key_mlbam == 660670
+    assert entry.key_fangraphs == 18401
+    assert entry.key_bbref == "acunaro01"
+
+
+def test_lookup_matches_initials_without_spaces(register):
+    assert register.lookup("J.D. Martinez").key_fangraphs == 6184
+
+
+def test_lookup_prefers_most_recent_career(register):
+    matches = register.lookup_all("pedro martinez")
+    assert [entry.key_mlbam for entry in matches] == [118377, 408045]
+    assert register.lookup("Pedro Martinez").mlb_played_last == 2009
+
+
+def test_multi_word_last_names_and_missing_players(register):
+    assert register.lookup("Elly De La Cruz").key_mlbam == 682829
+    assert register.lookup("Nobody Here") is None
+    assert register.lookup("Old Timer").mlb_played_last is None
+
+
+def test_clear_deletes_the_file_and_rebuilds_on_next_load(register, monkeypatch):
+    from pybaseball_mcp import register as register_module
+
+    register.clear()
+    assert not register.path.exists() and not register.loaded
+
+    rows = REGISTER_ROWS[:1]
+
+    def rebuild(path):
+        frame = pd.DataFrame(rows, columns=register_module.REGISTER_COLUMNS)
+        feather.write_feather(frame, path, compression="uncompressed")
+
+    monkeypatch.setattr(register_module, "build_register_file", rebuild)
+    assert register.lookup("Elly De La Cruz") is None
+    assert register.lookup("Ronald Acuna").key_mlbam == 660670
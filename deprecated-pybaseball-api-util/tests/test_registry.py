@@ -0,0 +1,108 @@
+"""
+Offline tests for the declarative tool registry.
+"""
+import asyncio
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from pybaseball_mcp.registry import ToolRegistry, ToolSpec, compile_validator
+from pybaseball_mcp.tools import TOOL_REGISTRY
+from streamable_http import register_streamable_http_routes
+
+
+def _echo(*args):
+    return list(args)
+
+
+def _registry():
+    return ToolRegistry([
+        ToolSpec(
+            name="echo",
+            description="Echo the arguments",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "count": {"type": "integer", "minimum": 1, "maximum": 5, "default": 2},
+                    "kind": {"type": "string", "enum": ["a", "b"], "default": "a"},
+                },
+                "required": ["name"]
+            },
+            handler=_echo,
+            parameters=("name", "count", "kind")
+        ),
+    ])
+
+
+def test_validator_checks_types_ranges_and_required():
+    validate = compile_validator(_registry().get("echo").input_schema)
+    assert validate({"name": "Ohtani"}) is None
+    assert validate({"name": "Ohtani", "count": None}) is None
+    assert validate({}) == "missing required argument 'name'"
+    assert validate({"name": 7}) == "name must be of type string"
+    assert validate({"name": "x", "count": True}) == "count must be of type integer"
+    assert validate({"name": "x", "count": 9}) == "count must be at most 5"
+    assert validate({"name": "x", "kind": "c"}) == "kind must be one of: a, b"
+
+
+def test_validator_handles_arrays_and_one_of():
+    validate = compile_validator(TOOL_REGISTRY.get("players_stats_batch").input_schema)
+    assert validate({"player_names": ["A", "B"], "years": 2024}) is None
+    assert validate({"player_names": ["A", "B"], "years": [2024, 2023]}) is None
+    assert validate({"player_names": []}) == "player_names must have at least 1 items"
+    assert validate({"player_names": ["A", 3]}) == "player_names[1] must be of type string"
+    assert validate({"player_names": ["A"], "years": "2024"}) is not None
+    assert validate({"player_names": ["A"], "years": [1800]}) is not None
+
+
+def test_call_args_fill_schema_defaults_in_parameter_order():
+    registry = _registry()
+    spec = registry.get("echo")
+    assert registry.call_args(spec, {"name": "x"}) == ("x", 2, "a")
+    assert registry.call_args(spec, {"kind": "b", "name": "x", "count": 4, "extra": 1}) == ("x", 4, "b")
+
+
+def test_tool_list_payloads_are_built_once():
+    registry = _registry()
+    assert registry.tools() is registry.tools()
+    assert registry.tools()[0].name == "echo"
+    assert registry.summaries() == [{"name": "echo", "description": "Echo the arguments"}]
+    assert registry.summaries_json("compact") is registry.summaries_json("compact")
+
+
+def test_shared_registry_declares_every_tool():
+    names = [spec.name for spec in TOOL_REGISTRY]
+    assert names == [
+        "player_stats", "players_stats_batch", "player_recent_performance", "search_players",
+        "mlb_standings", "stat_leaders", "team_statistics", "clear_stats_cache", "health_check"
+    ]
+    assert set(TOOL_REGISTRY.cache_rules()) == set(names) - {"clear_stats_cache", "health_check"}
+    assert TOOL_REGISTRY.get("player_recent_performance").executor == "statcast"
+    assert {spec.name for spec in TOOL_REGISTRY if spec.stream} == {"mlb_standings", "stat_leaders"}
+
+
+def test_http_routes_list_tools_from_the_registry():
+    async def fail(*args):
+        raise AssertionError("the registry payload should be used")
+
+    registry = _registry()
+    app = FastAPI()
+    register_streamable_http_routes(app, fail, fail, tool_registry=registry)
+    client = TestClient(app)
+    expected = [{"name": "echo", "description": "Echo the arguments"}]
+    assert client.get("/tools").json()["result"]["tools"] == expected
+    assert client.get("/streamable-http/tools").json()["result"]["tools"] == expected
+    assert client.post("/jsonrpc", json={"jsonrpc": "2.0", "id": 1, "method": "list_tools"}).json()["result"] == expected
+    batch = client.post("/jsonrpc", json=[{"jsonrpc": "2.0", "id": 2, "method": "list_tools"}]).json()
+    assert batch[0]["result"] == expected
+
+
+def test_server_rejects_invalid_arguments_before_running_the_tool():
+    import pybaseball_nativemcp_server as server
+
+    result = asyncio.run(server._dispatch_tool("stat_leaders", {"stat": "HR", "top_n": 500}))
+    assert result[0].text == "Error: Invalid arguments for stat_leaders: top_n must be at most 50"
+    result = asyncio.run(server._dispatch_tool("health_check", {}))
+    assert result[0].text.startswith("PyBaseball MCP Server is running")
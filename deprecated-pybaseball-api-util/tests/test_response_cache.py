@@ -0,0 +1,163 @@
+"""
+Offline tests for the serialized-response cache and conditional requests.
+"""
+import json
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from pybaseball_mcp.encoding import dumpb
+from pybaseball_mcp.response_cache import CacheRule, ResponseCache, canonical_arguments, is_error_data
+from pybaseball_mcp.streaming import RowStream, stream_json_object
+from streamable_http import register_streamable_http_routes
+
+RULES = {
+    "player_stats": CacheRule({"year": lambda: 2024, "player_type": "batting"}, ("player_type",),
+                              lambda arguments: 600),
+    "old_leaders": CacheRule({}, (), lambda arguments: None),
+    "rows": CacheRule({}, (), lambda arguments: 60),
+}
+
+
+class FakeTools:
+    def __init__(self):
+        self.calls = []
+
+    async def call_tool(self, name, arguments):
+        self.calls.append((name, arguments))
+        if arguments.get("fail"):
+            return [SimpleNamespace(text="Error retrieving stats: upstream down")]
+        return [SimpleNamespace(text=json.dumps({"tool": name, "call": len(self.calls)}))]
+
+    async def list_tools(self):
+        return []
+
+    async def stream_tool(self, name, arguments):
+        if name != "rows":
+            return None
+        self.calls.append((name, arguments))
+        return stream_json_object(RowStream({"n": 2}, "rows", iter([1, 2])))
+
+
+def _client(tools):
+    app = FastAPI()
+    register_streamable_http_routes(app, tools.call_tool, tools.list_tools, tools.stream_tool, ResponseCache(RULES))
+    return TestClient(app)
+
+
+def test_canonical_arguments_fold_case_whitespace_and_defaults():
+    rule = RULES["player_stats"]
+    assert canonical_arguments({"player_name": "Mike Trout", "player_type": " Batting "}, rule) == \
+        canonical_arguments({"player_name": "Mike Trout", "year": 2024}, rule)
+    # Echoed arguments are kept as given, so a cached body never shows another caller's spelling
+    assert canonical_arguments({"player_name": "mike  trout"}, rule) != \
+        canonical_arguments({"player_name": "Mike Trout"}, rule)
+
+
+def test_differently_spelled_names_get_their_own_bytes():
+    tools = FakeTools()
+    client = _client(tools)
+    client.post("/tools/player_stats", json={"player_name": "Mike Trout"})
+    client.post("/tools/player_stats", json={"player_name": "mike trout"})
+    assert [arguments["player_name"] for _, arguments in tools.calls] == ["Mike Trout", "mike trout"]
+
+
+def test_repeat_calls_are_served_from_cache_with_etag():
+    tools = FakeTools()
+    client = _client(tools)
+    first = client.post("/tools/player_stats", json={"player_name": "Mike Trout"})
+    second = client.post("/streamable-http/tools/player_stats", json={"player_name": "Mike Trout", "year": 2024})
+    assert len(tools.calls) == 1
+    assert first.content == second.content
+    assert first.headers["etag"] == second.headers["etag"]
+    assert first.headers["cache-control"] == "public, max-age=600"
+
+
+def test_if_none_match_returns_304():
+    tools = FakeTools()
+    client = _client(tools)
+    etag = client.post("/tools/player_stats", json={"player_name": "Mike Trout"}).headers["etag"]
+    response = client.post("/tools/player_stats", json={"player_name": "Mike Trout"}, headers={"If-None-Match": f'W/"x", {etag}'})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_immutable_results_get_long_max_age():
+    response = _client(FakeTools()).post("/tools/old_leaders", json={})
+    assert "immutable" in response.headers["cache-control"]
+
+
+def test_errors_and_uncached_tools_are_not_cached():
+    tools = FakeTools()
+    client = _client(tools)
+    client.post("/tools/player_stats", json={"player_name": "Mike Trout", "fail": True})
+    client.post("/tools/player_stats", json={"player_name": "Mike Trout", "fail": True})
+    client.post("/tools/clear_stats_cache", json={})
+    response = client.post("/tools/clear_stats_cache", json={})
+    assert len(tools.calls) == 4
+    assert "etag" not in response.headers
+
+
+def test_streamed_results_are_cached_after_completion():
+    tools = FakeTools()
+    client = _client(tools)
+    first = client.post("/tools/rows?stream=1", json={})
+    second = client.post("/tools/rows?stream=1", json={})
+    assert len(tools.calls) == 1
+    assert first.json() == second.json() == {"jsonrpc": "2.0", "result": {"data": {"n": 2, "rows": [1, 2]}}}
+    assert "etag" in second.headers
+
+
+def test_jsonrpc_shares_the_cache_with_distinct_etags_per_id():
+    tools = FakeTools()
+    client = _client(tools)
+    rest = client.post("/tools/player_stats?buffered=1", json={"player_name": "Mike Trout"})
+
+    def rpc(request_id):
+        return client.post("/jsonrpc", json={"jsonrpc": "2.0", "id": request_id, "method": "tool",
+                                             "params": {"name": "player_stats", "parameters": {"player_name": "Mike Trout"}}})
+
+    one, two = rpc(1), rpc(2)
+    assert len(tools.calls) == 1
+    assert one.json()["result"] == rest.json()["result"]["data"]
+    assert one.headers["etag"] != two.headers["etag"]
+
+
+def test_error_objects_are_not_cached():
+    assert is_error_data(b'"Error: upstream down"')
+    assert is_error_data(b'{"error":"Error retrieving standings","year":2015}')
+    assert is_error_data(dumpb(json.dumps({"error": "Error retrieving standings", "year": 2015})))
+    assert not is_error_data(dumpb(json.dumps({"players": [{"player": "A B", "error": "Player not found"}]})))
+    assert not is_error_data(b'{"stat":"HR","leaders":[]}')
+
+
+def test_past_season_upstream_failure_is_not_cached(monkeypatch):
+    import pybaseball_nativemcp_server as server
+    from pybaseball_mcp import frames, players
+    from pybaseball_mcp.register import PlayerEntry
+
+    fetches = []
+
+    def failing_fetch(kind, year, qual):
+        fetches.append((kind, year))
+        raise RuntimeError("baseball-reference 503")
+
+    monkeypatch.setattr(frames, "_fetch_frame", failing_fetch)
+    monkeypatch.setattr(players, "resolve_player", lambda name: PlayerEntry(name, 545361, 10155, None, 2011, 2015))
+    frames.season_frames.clear()
+    server.response_cache.clear()
+    client = TestClient(server.create_http_app())
+
+    for _ in range(2):
+        response = client.post("/tools/mlb_standings?buffered=1", json={"year": 2015})
+        assert "etag" not in response.headers
+        assert "Error retrieving standings for 2015" in response.json()["result"]["data"]
+    for _ in range(2):
+        response = client.post("/tools/player_stats", json={"player_name": "Mike Trout", "year": 2015})
+        assert "etag" not in response.headers
+        assert response.json()["result"]["data"].startswith("Error retrieving stats for Mike Trout in 2015")
+    rpc = {"jsonrpc": "2.0", "id": 1, "method": "tool", "params": {"name": "mlb_standings", "parameters": {"year": 2015}}}
+    assert "etag" not in client.post("/jsonrpc", json=rpc).headers
+    assert fetches.count(("standings", 2015)) == 3
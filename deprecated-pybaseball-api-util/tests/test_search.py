@@ -0,0 +1,53 @@
+"""
+Offline tests for the player search index.
+"""
+from pybaseball_mcp.register import PlayerEntry
+from pybaseball_mcp.search import EXACT, FUZZY, PREFIX, SUBSTRING, PlayerSearchIndex
+
+
+def entry(name, mlbam, last_season):
+    return PlayerEntry(name, mlbam, mlbam, None, last_season - 5, last_season)
+
+
+INDEX = PlayerSearchIndex([
+    entry("Mike Trout", 545361, 2024),
+    entry("Mike Trout", 1, 1950),
+    entry("Mike Mussina", 119608, 2008),
+    entry("Shohei Ohtani", 660271, 2024),
+    entry("Mookie Betts", 605141, 2024),
+    entry("Steve Trout", 2, 1989),
+    entry("Ronald Acuña", 660670, 2024),
+])
+
+
+def names(results):
+    return [(match.player.name, match.match) for match in results]
+
+
+def test_exact_matches_rank_by_recency():
+    results = INDEX.search("mike trout", limit=2)
+    assert [match.player.key_mlbam for match in results] == [545361, 1]
+    assert {match.match for match in results} == {EXACT}
+
+
+def test_prefix_matches_first_and_last_names():
+    assert names(INDEX.search("mik", limit=3)) == [
+        ("Mike Trout", PREFIX), ("Mike Mussina", PREFIX), ("Mike Trout", PREFIX),
+    ]
+    assert [match.player.name for match in INDEX.search("trou")] == ["Mike Trout", "Steve Trout", "Mike Trout"]
+
+
+def test_substring_matches_inside_names():
+    assert names(INDEX.search("htan")) == [("Shohei Ohtani", SUBSTRING)]
+
+
+def test_typos_fall_back_to_fuzzy_matches():
+    results = INDEX.search("Shohie Otani")
+    assert results[0].player.name == "Shohei Ohtani"
+    assert results[0].match == FUZZY
+    assert INDEX.search("ronald acuna")[0].player.key_mlbam == 660670
+
+
+def test_limit_and_empty_queries():
+    assert len(INDEX.search("m", limit=2)) == 2
+    assert INDEX.search("  ") == []
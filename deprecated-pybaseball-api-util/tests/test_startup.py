@@ -0,0 +1,61 @@
+"""
+Startup budget of the STDIO server: tools/list must be answered quickly and
+without importing the data stack, which only tool calls may load.
+"""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from pybaseball_mcp.lazy import lazy_function
+
+SERVER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# Wall time from interpreter start of the import to the first tools/list answer
+STARTUP_BUDGET_SECONDS = float(os.environ.get("PYBASEBALL_MCP_STARTUP_BUDGET", 1.5))
+HEAVY_MODULES = ("pandas", "numpy", "pyarrow", "pybaseball", "fastapi", "matplotlib")
+
+PROBE = f"""
+import asyncio, json, sys, time
+start = time.perf_counter()
+import pybaseball_nativemcp_server as server
+tools = asyncio.run(server.handle_list_tools())
+print(json.dumps({{
+    "seconds": time.perf_counter() - start,
+    "tools": [tool.name for tool in tools],
+    "heavy_modules": [name for name in {HEAVY_MODULES!r} if name in sys.modules],
+}}))
+"""
+
+
+@pytest.fixture(scope="module")
+def startup():
+    pytest.importorskip("mcp")
+    env = dict(os.environ, MCP_STDIO_MODE="1", PYBASEBALL_MCP_WARMUP="0")
+    result = subprocess.run([sys.executable, "-c", PROBE], cwd=SERVER_DIR, env=env,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_list_tools_does_not_import_data_stack(startup):
+    assert "player_stats" in startup["tools"]
+    assert startup["heavy_modules"] == []
+
+
+def test_list_tools_within_startup_budget(startup):
+    assert startup["seconds"] < STARTUP_BUDGET_SECONDS
+
+
+def test_lazy_function_imports_on_first_call(tmp_path, monkeypatch):
+    (tmp_path / "lazy_probe_module.py").write_text("def double(value):\n    return value * 2\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "lazy_probe_module", raising=False)
+
+    stand_in = lazy_function("lazy_probe_module", "double")
+    assert "lazy_probe_module" not in sys.modules
+    assert stand_in.__name__ == "double"
+    assert stand_in(21) == 42
+    assert "lazy_probe_module" in sys.modules
@@ -0,0 +1,170 @@
+"""
+Offline tests for the league-wide Statcast partition store.
+"""
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from pybaseball_mcp import statcast_store
+from pybaseball_mcp.expiry import (FixedExpiryPolicy, SeasonAwareExpiryPolicy, get_expiry_policy, set_expiry_policy,
+                                   utc_today)
+from pybaseball_mcp.statcast_store import StatcastStore, partition_path
+
+DAY = date(2023, 6, 1)
+
+
+@pytest.fixture
+def fetch_calls(monkeypatch):
+    calls = []
+
+    def fake_statcast(start_dt, end_dt, verbose=True):
+        calls.append((start_dt, end_dt))
+        days = pd.date_range(start_dt, end_dt)
+        # Every other day has games
+        game_days = days[::2]
+        return pd.DataFrame({
+            "game_date": [d for d in game_days for _ in range(3)],
+            "batter": [1, 2, 1] * len(game_days),
+            "pitcher": [9, 9, 8] * len(game_days),
+            "events": ["single", None, "home_run"] * len(game_days),
+            "launch_speed": [100.0, 80.0, 110.0] * len(game_days),
+        })
+
+    monkeypatch.setattr(statcast_store, "statcast", fake_statcast)
+    return calls
+
+
+@pytest.fixture
+def season_policy():
+    previous = get_expiry_policy()
+    set_expiry_policy(SeasonAwareExpiryPolicy())
+    yield
+    set_expiry_policy(previous)
+
+
+def test_window_is_fetched_once_and_sliced_locally(fetch_calls, season_policy):
+    store = StatcastStore()
+    frame = store.load(DAY, DAY + timedelta(days=4), player_id=1, role="batter")
+    assert fetch_calls == [("2023-06-01", "2023-06-05")]
+    assert len(frame) == 6
+    assert set(frame["batter"]) == {1}
+    # Days without games are stored too
+    assert partition_path(DAY + timedelta(days=1)).exists()
+
+    pitcher = store.load(DAY, DAY + timedelta(days=4), player_id=8, role="pitcher", columns=["events"])
+    assert len(fetch_calls) == 1
+    assert list(pitcher["events"]) == ["home_run"] * 3
+
+
+def test_only_missing_days_are_fetched(fetch_calls, season_policy):
+    store = StatcastStore()
+    store.ensure(DAY + timedelta(days=2), DAY + timedelta(days=3))
+    store.ensure(DAY, DAY + timedelta(days=6))
+    assert fetch_calls == [
+        ("2023-06-03", "2023-06-04"),
+        ("2023-06-01", "2023-06-02"),
+        ("2023-06-05", "2023-06-07"),
+    ]
+
+
+def test_long_windows_are_fetched_and_saved_in_bounded_spans(fetch_calls, season_policy, monkeypatch):
+    monkeypatch.setattr(statcast_store, "STATCAST_FETCH_DAYS", 7)
+    store = StatcastStore()
+    store.ensure(DAY, DAY + timedelta(days=15))
+    assert fetch_calls == [
+        ("2023-06-01", "2023-06-07"),
+        ("2023-06-08", "2023-06-14"),
+        ("2023-06-15", "2023-06-16"),
+    ]
+    assert store.partitions_fetched == 16
+
+
+def test_spans_fetched_before_a_failure_are_kept(fetch_calls, season_policy, monkeypatch):
+    monkeypatch.setattr(statcast_store, "STATCAST_FETCH_DAYS", 7)
+    fetch = statcast_store.statcast
+
+    def fail_second_span(start_dt, end_dt, verbose=True):
+        if start_dt == "2023-06-08":
+            raise TimeoutError("Baseball Savant timed out")
+        return fetch(start_dt, end_dt, verbose)
+
+    monkeypatch.setattr(statcast_store, "statcast", fail_second_span)
+    store = StatcastStore()
+    with pytest.raises(TimeoutError):
+        store.ensure(DAY, DAY + timedelta(days=13))
+    assert all(partition_path(DAY + timedelta(days=i)).exists() for i in range(7))
+
+    monkeypatch.setattr(statcast_store, "statcast", fetch)
+    store.ensure(DAY, DAY + timedelta(days=13))
+    assert fetch_calls[-1] == ("2023-06-08", "2023-06-14")
+
+
+def test_expired_partitions_are_refetched(fetch_calls):
+    previous = get_expiry_policy()
+    set_expiry_policy(FixedExpiryPolicy(0))
+    try:
+        store = StatcastStore()
+        store.ensure(DAY, DAY)
+        store.ensure(DAY, DAY)
+    finally:
+        set_expiry_policy(previous)
+    assert len(fetch_calls) == 2
+
+
+def test_future_days_are_not_fetched(fetch_calls):
+    store = StatcastStore()
+    today = utc_today()
+    store.player_window(1, days=5, end=today + timedelta(days=3))
+    assert fetch_calls == [((today - timedelta(days=2)).isoformat(), today.isoformat())]
+    assert not partition_path(today + timedelta(days=1)).exists()
+
+
+def test_windows_end_on_the_utc_date(fetch_calls, monkeypatch):
+    # Local time can already be the next day while UTC (and the expiry policy) is not
+    monkeypatch.setattr(statcast_store, "utc_today", lambda: DAY)
+    StatcastStore().player_window(1, days=2)
+    assert fetch_calls == [("2023-05-30", "2023-06-01")]
+    assert not partition_path(DAY + timedelta(days=1)).exists()
+
+
+def test_partitions_outside_the_retention_window_are_removed(fetch_calls, season_policy, monkeypatch):
+    monkeypatch.setattr(statcast_store, "STATCAST_RETENTION_DAYS", 10)
+    store = StatcastStore()
+    store.ensure(DAY, DAY + timedelta(days=3))
+    # The window being served is kept even when it is older than the retention window
+    assert all(partition_path(DAY + timedelta(days=i)).exists() for i in range(4))
+
+    assert store.trim(today=DAY + timedelta(days=12)) == 2
+    assert not partition_path(DAY + timedelta(days=1)).exists()
+    assert partition_path(DAY + timedelta(days=2)).exists()
+
+
+def test_oldest_partitions_are_removed_over_the_byte_budget(fetch_calls, season_policy, monkeypatch):
+    store = StatcastStore()
+    store.ensure(DAY, DAY + timedelta(days=3))
+    sizes = [partition_path(DAY + timedelta(days=i)).stat().st_size for i in range(4)]
+    monkeypatch.setattr(statcast_store, "STATCAST_DISK_BUDGET_BYTES", sum(sizes[2:]))
+    store.ensure(DAY + timedelta(days=2), DAY + timedelta(days=3))
+    assert store.trim(keep=(DAY + timedelta(days=2), DAY + timedelta(days=3)), today=DAY) == 2
+    assert not partition_path(DAY).exists() and not partition_path(DAY + timedelta(days=1)).exists()
+    assert partition_path(DAY + timedelta(days=3)).exists()
+
+
+def test_recent_windows_are_capped_at_the_retention_window():
+    from pybaseball_mcp.expiry import STATCAST_RETENTION_DAYS
+    from pybaseball_mcp.tools import TOOL_REGISTRY
+
+    arguments = {"player_name": "Aaron Judge", "days": STATCAST_RETENTION_DAYS + 1}
+    assert TOOL_REGISTRY.validate("player_recent_performance", arguments) == \
+        f"days must be at most {STATCAST_RETENTION_DAYS}"
+    assert TOOL_REGISTRY.validate("player_recent_performance", {**arguments, "days": 30}) is None
+
+
+def test_clear_removes_every_partition(fetch_calls, season_policy):
+    store = StatcastStore()
+    store.ensure(DAY, DAY + timedelta(days=2))
+    store.clear()
+    assert not any(partition_path(DAY + timedelta(days=i)).exists() for i in range(3))
+    store.ensure(DAY, DAY + timedelta(days=2))
+    assert len(fetch_calls) == 2
@@ -0,0 +1,90 @@
+"""
+Offline tests for incremental row streaming.
+"""
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pandas as pd
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from pybaseball_mcp import streaming, teams
+from pybaseball_mcp.streaming import RowStream, stream_json_object
+from streamable_http import register_streamable_http_routes
+
+
+def _collect(stream):
+    async def run():
+        return [chunk async for chunk in stream_json_object(stream)]
+    return asyncio.run(run())
+
+
+def test_stream_encodes_the_same_object_as_to_dict():
+    rows = [{"rank": i, "name": f"Player \"{i}\""} for i in range(5)]
+    chunks = _collect(RowStream({"stat": "HR", "year": 2024}, "leaders", iter(rows)))
+    assert json.loads(b"".join(chunks)) == RowStream({"stat": "HR", "year": 2024}, "leaders", iter(rows)).to_dict()
+    assert len(chunks) == len(rows) + 2
+
+
+def test_mapping_streams_encode_an_object():
+    pairs = [("AL East", [{"team": "NYY"}]), ("AL West", [])]
+    chunks = _collect(RowStream({}, "standings", iter(pairs), mapping=True))
+    assert json.loads(b"".join(chunks)) == {"standings": dict(pairs)}
+
+
+def test_first_row_is_sent_before_the_producer_finishes(monkeypatch):
+    monkeypatch.setattr(streaming, "STREAM_BATCH_ROWS", 1)
+    produced = []
+
+    def rows():
+        for i in range(3):
+            produced.append(i)
+            yield {"i": i}
+
+    async def first_two_chunks():
+        stream = stream_json_object(RowStream({}, "rows", rows()))
+        chunks = [await stream.__anext__(), await stream.__anext__()]
+        await stream.aclose()
+        return chunks
+
+    chunks = asyncio.run(first_two_chunks())
+    assert chunks[1] == b'{"i":0}'
+    assert len(produced) < 3
+
+
+def test_leaders_stream_matches_buffered_result(monkeypatch):
+    frame = pd.DataFrame({"Name": ["A", "B", "C"], "Team": ["NYY", "LAD", "SEA"], "HR": [30, 45, 12], "IDfg": [1, 2, 3]})
+    monkeypatch.setattr(teams, "get_batting_frame", lambda year: frame)
+    stream = teams.stream_league_leaders("hr", 2024, top_n=2)
+    assert json.loads(b"".join(_collect(stream))) == json.loads(teams.get_league_leaders("hr", 2024, top_n=2))
+    assert teams.stream_league_leaders("xyz", 2024).startswith("Stat 'xyz' not found")
+
+
+def _app():
+    async def call_tool(name, arguments):
+        return [SimpleNamespace(text=json.dumps({"rows": [1, 2]}))]
+
+    async def list_tools():
+        return []
+
+    async def stream_tool(name, arguments):
+        if name != "rows":
+            return None
+        return stream_json_object(RowStream({"n": 2}, "rows", iter([1, 2])))
+
+    app = FastAPI()
+    register_streamable_http_routes(app, call_tool, list_tools, stream_tool)
+    return TestClient(app)
+
+
+def test_http_routes_stream_rows_for_streaming_tools():
+    client = _app()
+    for path in ("/tools/rows?stream=1", "/streamable-http/tools/rows?stream=1"):
+        assert client.post(path, json={}).json() == {"jsonrpc": "2.0", "result": {"data": {"n": 2, "rows": [1, 2]}}}
+    # Without the opt-in "data" keeps the string-encoded result
+    for path in ("/tools/rows", "/tools/rows?buffered=1"):
+        buffered = client.post(path, json={}).json()
+        assert json.loads(buffered["result"]["data"]) == {"rows": [1, 2]}
+    other = client.post("/tools/other", json={}).json()
+    assert isinstance(other["result"]["data"], str)
@@ -0,0 +1,84 @@
+"""
+Offline tests for the per-team aggregate lookups behind team_statistics.
+"""
+import json
+
+import pandas as pd
+import pytest
+
+from pybaseball_mcp import teams
+from pybaseball_mcp.team_aggregates import team_table
+from pybaseball_mcp.utils import normalize_team_name
+
+
+def _batting():
+    return pd.DataFrame({
+        "Name": ["A", "B", "C", "D", "E"],
+        "Team": ["SDP", "SDP", "SFG", "- - -", "NYY"],
+        "AVG": [0.300, 0.250, 0.280, 0.310, 0.270],
+        "HR": [30, 10, 20, 5, 40],
+        "RBI": [90, 40, 70, 20, 100],
+        "R": [80, 50, 60, 25, 95],
+        "OPS": [0.900, 0.700, 0.800, 0.750, 0.950],
+    })
+
+
+def _pitching():
+    return pd.DataFrame({
+        "Name": ["P", "Q", "R"],
+        "Team": ["SDP", "TBR", "NYY"],
+        "ERA": [3.10, 2.50, 4.00],
+        "W": [12, 9, 10],
+        "SV": [0, 30, 1],
+        "SO": [200, 80, 150],
+    })
+
+
+@pytest.fixture
+def season(monkeypatch):
+    batting, pitching = _batting(), _pitching()
+    monkeypatch.setattr(teams, "get_batting_frame", lambda year: batting)
+    monkeypatch.setattr(teams, "get_pitching_frame", lambda year: pitching)
+    return batting, pitching
+
+
+@pytest.mark.parametrize("name, code", [
+    ("SDP", "SD"), ("sd", "SD"), ("Padres", "SD"), ("SFG", "SF"), ("TBR", "TB"),
+    ("KCR", "KC"), ("WSN", "WSH"), ("NYY", "NYY"),
+])
+def test_fangraphs_codes_normalize(name, code):
+    assert normalize_team_name(name) == code
+
+
+def test_team_table_is_built_once_per_frame():
+    batting = _batting()
+    table = team_table(batting, "batting")
+    assert team_table(batting, "batting") is table
+    assert list(table.index) == ["NYY", "SD", "SF"]
+    assert table.loc["SD", "players"] == 2
+    assert table.loc["SD", "total_hr"] == 40
+
+
+def test_team_stats_matches_abbreviation_variants(season):
+    for name in ("SD", "SDP", "padres"):
+        result = json.loads(teams.get_team_stats(name, 2023))
+        assert result["code"] == "SD"
+        assert result["batting"] == {
+            "players": 2, "avg_avg": 0.275, "total_hr": 40, "total_rbi": 130, "total_runs": 130, "team_ops": 0.8
+        }
+        assert result["pitching"] == {
+            "pitchers": 1, "avg_era": 3.1, "total_wins": 12, "total_saves": 0, "total_strikeouts": 200
+        }
+
+
+def test_team_stats_does_not_match_substrings(season):
+    assert teams.get_team_stats("Seattle Mariners", 2023) == "No stats found for team 'Seattle Mariners'"
+
+
+def test_team_stats_for_all_teams(season):
+    result = json.loads(teams.get_team_stats("all", 2023))
+    assert result["count"] == 4
+    assert [team["team"] for team in result["teams"]] == ["NYY", "SD", "SF", "TB"]
+    tampa = result["teams"][3]
+    assert tampa["batting"] is None
+    assert tampa["pitching"]["total_saves"] == 30
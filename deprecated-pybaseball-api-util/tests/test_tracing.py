@@ -0,0 +1,149 @@
+"""
+Offline tests for span tracing and Server-Timing headers.
+"""
+import asyncio
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from pybaseball_mcp.executor import run_blocking
+from pybaseball_mcp.tracing import Trace, current_span, exporter, server_timing, span
+from streamable_http import configure_server_timing, register_streamable_http_routes
+
+
+def _read_spans(path):
+    exporter.flush()
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_spans_nest_and_export_otlp_json(isolated_traces):
+    with span("tool.player_stats", phase="tool", tool="player_stats") as root:
+        with span("lookup.player", phase="lookup"):
+            assert current_span().name == "lookup.player"
+        with span("fetch.frame", phase="fetch", year=2024) as fetch:
+            fetch.set("cache", "hit")
+    assert current_span() is None
+
+    spans = {item["name"]: item for item in _read_spans(isolated_traces)}
+    assert set(spans) == {"tool.player_stats", "lookup.player", "fetch.frame"}
+    assert {item["traceId"] for item in spans.values()} == {root.trace.trace_id}
+    assert spans["tool.player_stats"]["parentSpanId"] == ""
+    assert spans["fetch.frame"]["parentSpanId"] == root.span_id
+    attributes = {item["key"]: item["value"] for item in spans["fetch.frame"]["attributes"]}
+    assert attributes["year"] == {"intValue": 2024}
+    assert attributes["cache"] == {"stringValue": "hit"}
+    assert attributes["phase"] == {"stringValue": "fetch"}
+    assert spans["fetch.frame"]["endTimeUnixNano"] >= spans["fetch.frame"]["startTimeUnixNano"]
+    assert spans["tool.player_stats"]["status"] == {"code": 1}
+
+
+def test_failed_span_records_error_status(isolated_traces):
+    with pytest.raises(ValueError):
+        with span("upstream.batting_stats", phase="fetch"):
+            raise ValueError("FanGraphs is down")
+    (item,) = _read_spans(isolated_traces)
+    assert item["status"] == {"code": 2, "message": "ValueError: FanGraphs is down"}
+
+
+def test_spans_are_written_off_the_calling_thread(tmp_path, monkeypatch):
+    from pybaseball_mcp import tracing
+
+    writers = []
+    local = tracing.SpanExporter(tmp_path / "spans.jsonl")
+    write = local._write
+    monkeypatch.setattr(local, "_write", lambda path, lines: writers.append(threading.current_thread().name)
+                        or write(path, lines))
+    monkeypatch.setattr(tracing, "exporter", local)
+    with span("tool.health_check", phase="tool"):
+        pass
+    local.flush()
+    assert writers == ["span-exporter"]
+    assert len((tmp_path / "spans.jsonl").read_text().splitlines()) == 1
+    assert tracing.SpanExporter("").path is None
+
+
+def test_spans_in_worker_threads_join_the_callers_trace():
+    def work():
+        with span("aggregate.records", phase="aggregate"):
+            return current_span().trace
+
+    async def run():
+        with span("tool.stat_leaders", phase="tool") as root:
+            trace = await run_blocking(work)
+        return root, trace
+
+    root, trace = asyncio.run(run())
+    assert trace is root.trace
+    assert [item.name for item in root.trace.spans] == ["aggregate.records", "tool.stat_leaders"]
+
+
+def test_phase_durations_do_not_double_count_nested_phases():
+    with span("fetch.frame", phase="fetch") as outer:
+        with span("upstream.batting_stats", phase="fetch"):
+            pass
+        with span("aggregate.records", phase="aggregate"):
+            pass
+    durations = outer.trace.phase_durations()
+    assert durations["fetch"] == pytest.approx(outer.duration_ms)
+    assert set(durations) == {"fetch", "aggregate"}
+    header = server_timing(outer.trace, total_ms=12.34)
+    assert header.startswith("fetch;dur=")
+    assert ", aggregate;dur=" in header
+    assert header.endswith("total;dur=12.3")
+
+
+def test_http_responses_carry_server_timing(isolated_traces):
+    async def call_tool(name, arguments):
+        with span("lookup.player", phase="lookup"):
+            pass
+        with span("serialize.player_stats", phase="serialize"):
+            return [SimpleNamespace(text="ok")]
+
+    async def list_tools():
+        return [SimpleNamespace(name="player_stats", description="Stats")]
+
+    app = FastAPI()
+    register_streamable_http_routes(app, call_tool, list_tools)
+    configure_server_timing(app)
+    client = TestClient(app)
+
+    response = client.post("/tools/player_stats", json={"player_name": "Aaron Judge"})
+    timing = response.headers["server-timing"]
+    assert "lookup;dur=" in timing and "serialize;dur=" in timing and "total;dur=" in timing
+    assert "total;dur=" in client.get("/tools").headers["server-timing"]
+
+    roots = [item for item in _read_spans(isolated_traces) if item["parentSpanId"] == ""]
+    request_span = next(item for item in roots if item["name"] == "POST /tools/player_stats")
+    assert request_span["kind"] == 2
+    attributes = {item["key"]: item["value"] for item in request_span["attributes"]}
+    assert attributes["http.status_code"] == {"intValue": 200}
+    assert attributes["phase"] == {"stringValue": "transport"}
+
+
+def test_player_stats_phases_cover_lookup_fetch_aggregate_and_serialize(monkeypatch, isolated_traces):
+    import pandas as pd
+
+    from pybaseball_mcp import frames, players, register
+    from pybaseball_mcp.register import PlayerEntry
+
+    pitching = pd.DataFrame({"IDfg": [13125], "Name": ["Gerrit Cole"], "ERA": [3.41], "SO": [99]})
+    monkeypatch.setattr(frames, "season_frames", frames.SeasonFrameStore())
+    monkeypatch.setattr(frames, "batting_stats", lambda year, qual=1: pitching.iloc[0:0])
+    monkeypatch.setattr(frames, "pitching_stats", lambda year, qual=1: pitching)
+    cole = PlayerEntry("Gerrit Cole", 543037, 13125, "colege01", 2013, 2024)
+    monkeypatch.setattr(register.player_register, "load", lambda: None)
+    monkeypatch.setattr(register.player_register, "lookup", lambda name: cole)
+
+    with span("tool.player_stats", phase="tool") as root:
+        result = json.loads(players._get_player_stats_impl("Gerrit Cole"))
+    assert result["type"] == "pitching"
+
+    names = [item.name for item in root.trace.spans]
+    assert "lookup.player" in names
+    assert names.count("upstream.batting_stats") == 1 and names.count("upstream.pitching_stats") == 1
+    assert "aggregate.records" in names and "serialize.player_stats" in names
+    assert {"lookup", "fetch", "aggregate", "serialize", "tool"} <= set(root.trace.phase_durations())
@@ -0,0 +1,56 @@
+"""
+Offline tests for the PyBaseball disk cache helpers.
+"""
+import pandas as pd
+import pytest
+from pybaseball.cache import cache, cache_record
+
+from pybaseball_mcp import frames
+from pybaseball_mcp.utils import _pybaseball_records, forget_pybaseball_records, trim_pybaseball_cache
+
+
+@pytest.fixture
+def pybaseball_cache(tmp_path, monkeypatch):
+    """Point PyBaseball's disk cache at a scratch directory."""
+    # One config object shared by the cache and its records
+    monkeypatch.setattr(cache.config, "cache_directory", str(tmp_path))
+    return tmp_path
+
+
+def _records():
+    return list(_pybaseball_records())
+
+
+def save_record(func, args, expires=7):
+    record = cache_record.CacheRecord(data={"func": func, "args": args, "kwargs": {}}, expires=expires)
+    record.save()
+    record.save_df(pd.DataFrame({"HR": [1, 2]}))
+    return record
+
+
+def test_forget_deletes_only_matching_records(pybaseball_cache):
+    save_record("standings", [2025])
+    save_record("standings", [2024])
+    save_record("standings_other", [2025])
+    assert forget_pybaseball_records("standings", lambda call: call["args"] == [2025]) == 1
+    remaining = sorted(record.data["args"][0] for _, record in _records())
+    assert remaining == [2024, 2025]
+
+
+def test_trim_removes_unreadable_and_expired_records_first(pybaseball_cache):
+    # PyBaseball leaves records like this when a call's arguments are dates
+    (pybaseball_cache / "_small_request1.cache_record.json").write_text('{"func": "_small_request", "args": [')
+    save_record("standings", [2023], expires=-1)
+    save_record("standings", [2024])
+    assert trim_pybaseball_cache() == 2
+    assert [record.data["args"] for _, record in _records()] == [[2024]]
+    assert trim_pybaseball_cache(max_bytes=0) == 1
+
+
+def test_live_seasons_forget_pybaseball_records_before_fetching(pybaseball_cache, monkeypatch):
+    monkeypatch.setattr(frames, "_fetch_frame", lambda kind, year, qual: pd.DataFrame())
+    monkeypatch.setattr(frames, "is_completed_season", lambda year, kind: year < 2025)
+    save_record("FangraphsBattingStatsTable.fetch", [2025])
+    save_record("FangraphsBattingStatsTable.fetch", [2024])
+    frames._load_frame("batting", 2025, 1)
+    assert [record.data["args"] for _, record in _records()] == [[2024]]
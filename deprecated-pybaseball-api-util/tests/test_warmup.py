@@ -0,0 +1,98 @@
+"""
+Offline tests for the background warmup scheduler and ahead-of-expiry refreshes.
+"""
+import asyncio
+
+import pandas as pd
+import pytest
+
+from pybaseball_mcp import frames
+from pybaseball_mcp.expiry import FixedExpiryPolicy
+from pybaseball_mcp.frames import SeasonFrameStore
+from pybaseball_mcp.warmup import WarmupJob, WarmupScheduler
+
+
+def _scheduler(jobs, **kwargs):
+    settings = {"interval": 60, "jitter": 0.0, "backoff": 5, "max_backoff": 30, "start_delay": 0}
+    settings.update(kwargs)
+    return WarmupScheduler(jobs, **settings)
+
+
+def test_backoff_doubles_and_is_capped():
+    scheduler = _scheduler([])
+    assert [scheduler.retry_delay(failures) for failures in range(1, 6)] == [5, 10, 20, 30, 30]
+
+
+def test_jitter_stays_within_bounds():
+    scheduler = _scheduler([], jitter=0.1)
+    delays = [scheduler.jittered(100) for _ in range(200)]
+    assert all(90 <= delay <= 110 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_failures_back_off_and_success_resets():
+    outcomes = [RuntimeError("down"), RuntimeError("down"), True]
+
+    def flaky():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    job = WarmupJob("flaky", flaky)
+    scheduler = _scheduler([job])
+
+    async def run():
+        return [await scheduler.run_once(job) for _ in range(3)]
+
+    assert asyncio.run(run()) == [5, 10, 60]
+    status = scheduler.stats()["jobs"]["flaky"]
+    assert status["runs"] == 3
+    assert status["consecutive_failures"] == 0
+    assert status["last_error"] is None
+    assert status["last_success"] is not None
+
+
+def test_jobs_run_at_start_and_stop_cleanly():
+    calls = []
+    scheduler = _scheduler([WarmupJob("a", lambda: calls.append("a")), WarmupJob("b", lambda: calls.append("b"))])
+
+    async def run():
+        scheduler.start()
+        for _ in range(100):
+            if len(calls) == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert scheduler.running
+        await scheduler.stop()
+        assert not scheduler.running
+
+    asyncio.run(run())
+    assert sorted(calls) == ["a", "b"]
+
+
+@pytest.fixture
+def fetch_calls(monkeypatch):
+    calls = []
+
+    def fake_fetch(kind, year, qual):
+        calls.append((kind, year, qual))
+        return pd.DataFrame({"Name": ["A"], "Team": ["NYY"], "HR": [len(calls)]})
+
+    monkeypatch.setattr(frames, "_load_frame", fake_fetch)
+    return calls
+
+
+def test_refresh_loads_missing_and_expiring_frames(fetch_calls):
+    store = SeasonFrameStore(FixedExpiryPolicy(600), memory_budget_bytes=10**8)
+    assert store.refresh("batting", 2024) is True
+    first = store.get("batting", 2024)
+
+    # Fresh for longer than the look-ahead: kept as is
+    assert store.refresh("batting", 2024, ahead=300) is False
+    assert store.get("batting", 2024) is first
+
+    # Would expire before the next run: replaced ahead of time
+    assert store.refresh("batting", 2024, ahead=900) is True
+    assert store.get("batting", 2024) is not first
+    assert len(fetch_calls) == 2